@@ -0,0 +1,18 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It contains the benchmark suite of schedula.
+
+The benchmarks follow the `asv` conventions (i.e., classes with `setup`,
+`params`, `time_*`, and `peakmem_*` methods), so they can be run by `asv` or by
+the builtin runner, that compares the results with a stored baseline::
+
+    $ python -m benchmarks.run
+    $ python -m benchmarks.run --save benchmarks/baseline.json
+"""
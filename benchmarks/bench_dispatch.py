@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+Benchmarks of the dispatch algorithm and of the model construction.
+"""
+import copy
+import functools
+import schedula as sh
+from .generator import generate_model
+
+#: Model shapes: plain, nested sub-dispatchers, and dense features.
+SHAPES = {
+    'plain': {},
+    'nested': {'sub_ratio': .1},
+    'dense': {
+        'fan_in': 3, 'fan_out': 2, 'domain_density': .2, 'wait_density': .1,
+        'cycle_density': .1
+    }
+}
+
+
+class Dispatch:
+    params = [[10, 100, 1000], list(SHAPES)]
+    param_names = ['size', 'shape']
+
+    def setup(self, size, shape):
+        self.dsp, self.inputs, self.outputs = generate_model(
+            size, **SHAPES[shape]
+        )
+
+    def time_dispatch(self, size, shape):
+        self.dsp.dispatch(self.inputs)
+
+    def time_dispatch_outputs(self, size, shape):
+        self.dsp.dispatch(self.inputs, self.outputs)
+
+    def time_dispatch_no_call(self, size, shape):
+        self.dsp.dispatch(self.inputs, no_call=True)
+
+    def time_shrink_dsp(self, size, shape):
+        self.dsp.shrink_dsp(self.inputs, self.outputs)
+
+    def time_copy(self, size, shape):
+        self.dsp.copy()
+
+
+class Build:
+    params = [[10, 100, 1000]]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.blue = generate_model(size, sub_ratio=.1, blue=True)[0]
+
+    def time_generate_model(self, size):
+        generate_model(size, sub_ratio=.1)
+
+    def time_blueprint_register(self, size):
+        self.blue.register()
+
+    def time_blueprint_register_cow(self, size):
+        self.blue.register(copy='cow')
+
+
+def _sum(a, b):
+    return a + b
+
+
+class Records:
+    """
+    Construction of a chain of functions, in bulk and node by node.
+    """
+    params = [[1000, 10000]]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.data = [{'data_id': 'd%d' % i} for i in range(size + 1)]
+        self.funcs = [{
+            'function_id': 'fun', 'function': _sum,
+            'inputs': ['d%d' % i, 'd%d' % (i + 1)], 'outputs': ['o%d' % i]
+        } for i in range(size)]
+        self.partial = functools.partial(_sum, 1)
+
+    def time_add_from_lists(self, size):
+        sh.Dispatcher().add_from_lists(self.data, self.funcs)
+
+    def time_add_from_records(self, size):
+        sh.Dispatcher().add_from_records(self.data, self.funcs)
+
+    def time_add_func(self, size):
+        dsp = sh.Dispatcher()
+        for i in range(size):
+            dsp.add_func(self.partial if i % 2 else _sum, ['o%d' % i])
+
+    def time_add_function_same_id(self, size):
+        dsp = sh.Dispatcher()
+        for _ in range(size):
+            dsp.add_function('f', inputs=['a'])
+
+
+class Caches:
+    """
+    Cached, versioned, and frozen variants of a nested model.
+    """
+    params = [[100, 1000]]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.dsp, self.inputs, self.outputs = generate_model(
+            size, domain_density=.2, wait_density=.1, **SHAPES['nested']
+        )
+        self.frozen = self.dsp.freeze()
+
+    def time_shrink_dsp_not_memoized(self, size):
+        self.dsp._bump()
+        self.dsp.shrink_dsp(self.inputs, self.outputs)
+
+    def time_get_wait_in(self, size):
+        self.dsp._get_wait_in()
+
+    def time_deepcopy(self, size):
+        copy.deepcopy(self.dsp)
+
+    def time_freeze(self, size):
+        self.dsp.freeze()
+
+    def time_frozen_dispatch(self, size):
+        self.frozen.dispatch(self.inputs)
+
+    def time_fingerprint(self, size):
+        self.dsp._bump()
+        self.dsp.fingerprint()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+Benchmarks of the dispatch with the builtin executors.
+"""
+import schedula as sh
+from .generator import generate_model
+
+
+class Executors:
+    params = [
+        [10, 100],
+        ['sync', 'async', 'parallel', 'parallel-pool', 'parallel-dispatch']
+    ]
+    param_names = ['size', 'executor']
+
+    def setup(self, size, executor):
+        self.dsp, self.inputs, _ = generate_model(size, sub_ratio=.1)
+        self.dsp.dispatch(self.inputs, executor=executor).result()  # Warm up.
+
+    def teardown(self, size, executor):
+        sh.shutdown_executors(False)
+
+    def time_dispatch(self, size, executor):
+        self.dsp.dispatch(self.inputs, executor=executor).result()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+Import-time benchmarks measured with `python -X importtime`.
+"""
+import sys
+import subprocess
+
+
+def _importtime(code):
+    res = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True
+    )
+    times = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        cells = line[12:].split('|')
+        try:
+            self, cumulative = int(cells[0]), int(cells[1])
+        except ValueError:  # Header.
+            continue
+        name = cells[2].rstrip()
+        level = (len(name) - len(name.lstrip())) // 2
+        times[name.strip()] = self, cumulative, level
+    return times
+
+
+def import_times(code):
+    """
+    Returns the import times of the modules loaded by the code.
+
+    The modules imported at the interpreter startup are excluded.
+
+    :param code:
+        Python code to execute (e.g., `import schedula`).
+    :type code: str
+
+    :return:
+        Self time [us], cumulative time [us], and nesting level of the imported
+        modules.
+    :rtype: dict[str, (int, int, int)]
+
+    Example::
+
+        >>> times = import_times('import schedula')
+        >>> 'schedula' in times, 'jinja2' in times
+        (True, False)
+    """
+    startup = _importtime('pass')
+    return {k: v for k, v in _importtime(code).items() if k not in startup}
+
+
+def import_time(code):
+    """
+    Returns the total import time [us] of the code.
+
+    :param code:
+        Python code to execute (e.g., `import schedula`).
+    :type code: str
+
+    :return:
+        Total import time [us].
+    :rtype: int
+    """
+    return sum(v[1] for v in import_times(code).values() if v[2] == 0)
+
+
+class ImportTime:
+    params = [[
+        'schedula', 'schedula.utils.drw', 'schedula.utils.web',
+        'schedula.utils.form'
+    ]]
+    param_names = ['module']
+    unit = 'microseconds'
+
+    def track_import(self, module):
+        return import_time('import %s' % module)
+
+
+class ColdStart:
+    unit = 'microseconds'
+
+    def track_dispatcher(self):
+        return import_time('import schedula; schedula.Dispatcher')
+
+    def track_dispatch(self):
+        return import_time('import schedula; schedula.Dispatcher()({})')
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+Benchmarks of the model persistence and of the plot rendering.
+"""
+import os
+import sys
+import shutil
+import inspect
+import tempfile
+import importlib
+import subprocess
+import schedula as sh
+from .generator import generate_model
+
+
+class SaveLoad:
+    params = [[10, 100, 1000]]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.dsp = generate_model(size, sub_ratio=.1)[0]
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        sh.save_dispatcher(self.dsp, self.path)
+
+    def teardown(self, size):
+        os.remove(self.path)
+
+    def time_save_dispatcher(self, size):
+        sh.save_dispatcher(self.dsp, self.path)
+
+    def time_load_dispatcher(self, size):
+        sh.load_dispatcher(self.path)
+
+
+def _module_functions(*modules):
+    functions = []
+    for name in modules:
+        functions.extend(
+            v for k, v in inspect.getmembers(
+                importlib.import_module(name), inspect.isfunction
+            ) if v.__module__ == name and not k.startswith('_')
+        )
+    return functions
+
+
+class RefFormat:
+    """
+    The `dill` and `ref` formats on a model of importable functions.
+    """
+    params = [[1000, 5000], ['dill', 'ref']]
+    param_names = ['size', 'format']
+    unit = 'bytes'
+    modules = (
+        'statistics', 'difflib', 'email.utils', 'xml.dom.minidom',
+        'http.cookiejar', 'tarfile', 'ftplib', 'imaplib', 'plistlib', 'pydoc',
+        'doctest', 'multiprocessing.pool', 'xml.etree.ElementTree',
+        'unittest.mock'
+    )
+
+    def setup(self, size, format):
+        functions = _module_functions(*self.modules)
+        self.dsp = generate_model(size, functions=functions)[0]
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'model')
+        sh.save_dispatcher(self.dsp, self.path, format=format)
+
+    def teardown(self, size, format):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_save_dispatcher(self, size, format):
+        sh.save_dispatcher(self.dsp, self.path, format=format)
+
+    def time_load_dispatcher(self, size, format):
+        sh.load_dispatcher(self.path)
+
+    def time_lazy_load_dispatcher(self, size, format):
+        sh.load_dispatcher(self.path, lazy=True)
+
+    def track_file_size(self, size, format):
+        return sum(  # Including the side file of the `ref` format.
+            os.path.getsize(os.path.join(self.directory, f))
+            for f in os.listdir(self.directory)
+        )
+
+
+class ColdLoad(RefFormat):
+    """
+    Lazy load in a new process, where the modules of the functions are not
+    imported yet.
+    """
+    params = [[1000], ['dill', 'ref']]
+    unit = 'microseconds'
+
+    def track_cold_load(self, size, format):
+        code = 'import time, schedula as sh; t = time.perf_counter(); ' \
+               'sh.load_dispatcher(%r, lazy=True); ' \
+               'print(int((time.perf_counter() - t) * 1e6))' % self.path
+        return int(subprocess.check_output([sys.executable, '-c', code]))
+
+
+class Compression:
+    """
+    Compression of the saved files according to their extension.
+    """
+    params = [[1000], ['.pkl', '.gz', '.bz2', '.xz']]
+    param_names = ['size', 'ext']
+    unit = 'bytes'
+
+    def setup(self, size, ext):
+        self.dsp = generate_model(size, sub_ratio=.1)[0]
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'model' + ext)
+        sh.save_dispatcher(self.dsp, self.path)
+
+    def teardown(self, size, ext):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_save_dispatcher(self, size, ext):
+        sh.save_dispatcher(self.dsp, self.path)
+
+    def time_load_dispatcher(self, size, ext):
+        sh.load_dispatcher(self.path)
+
+    def track_file_size(self, size, ext):
+        return os.path.getsize(self.path)
+
+
+class Plot:
+    params = [[10, 100]]
+    param_names = ['size']
+
+    def setup(self, size):
+        if not shutil.which('dot'):
+            raise NotImplementedError('Graphviz is not installed.')
+        dsp, inputs, _ = generate_model(size, sub_ratio=.1)
+        self.sol = dsp(inputs)
+        self.directory = tempfile.mkdtemp()
+
+    def teardown(self, size):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_plot_render(self, size):
+        self.sol.plot(view=False).render(directory=self.directory)
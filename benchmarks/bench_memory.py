@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+Memory benchmarks of the model construction and of the dispatch.
+"""
+from .generator import generate_model
+
+
+class Memory:
+    params = [[100, 1000]]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.dsp, self.inputs, self.outputs = generate_model(
+            size, sub_ratio=.1
+        )
+
+    def peakmem_generate_model(self, size):
+        generate_model(size, sub_ratio=.1)
+
+    def peakmem_dispatch(self, size):
+        self.dsp.dispatch(self.inputs)
+
+    def peakmem_shrink_dsp(self, size):
+        self.dsp.shrink_dsp(self.inputs, self.outputs)
+
+    def peakmem_copy(self, size):
+        self.dsp.copy()
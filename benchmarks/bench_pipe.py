@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+Benchmarks of the sub-dispatch functions.
+"""
+import schedula as sh
+from .generator import generate_model
+
+
+class SubDispatch:
+    params = [[10, 100, 1000]]
+    param_names = ['size']
+
+    def setup(self, size):
+        dsp, inputs, outputs = generate_model(size, sub_ratio=.1)
+        self.args = list(inputs.values())
+        inputs = list(inputs)
+        self.func = sh.SubDispatchFunction(dsp, 'func', inputs, outputs)
+        self.pipe = sh.SubDispatchPipe(dsp, 'pipe', inputs, outputs)
+        self.dispatch_pipe = sh.DispatchPipe(dsp, 'dispatch_pipe', inputs,
+                                             outputs)
+
+    def time_sub_dispatch_function(self, size):
+        self.func(*self.args)
+
+    def time_sub_dispatch_pipe(self, size):
+        self.pipe(*self.args)
+
+    def time_dispatch_pipe(self, size):
+        self.dispatch_pipe(*self.args)
+
+
+class Map:
+    params = [[10, 100], [10, 100]]
+    param_names = ['size', 'items']
+
+    def setup(self, size, items):
+        dsp, inputs, outputs = generate_model(size)
+        self.func = sh.MapDispatch(dsp)
+        self.inputs = [
+            {k: v + i for k, v in inputs.items()} for i in range(items)
+        ]
+
+    def time_map_dispatch(self, size, items):
+        self.func(self.inputs)
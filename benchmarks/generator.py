@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It provides a deterministic generator of random dispatcher models.
+"""
+import random
+import functools
+import schedula as sh
+
+
+def _function(n_out, *args):
+    s = sum(args)
+    return s if n_out == 1 else [s + i for i in range(n_out)]
+
+
+def _domain(*args):
+    return True
+
+
+def _wait(kw):
+    return sum(kw.values())
+
+
+def generate_model(size=100, fan_in=2, fan_out=1, depth=None, sub_ratio=0.,
+                   domain_density=0., wait_density=0., cycle_density=0.,
+                   seed=0, blue=False, functions=None, name='model',
+                   _level=0):
+    """
+    Generates a random layered model with a fixed seed.
+
+    The data nodes of the first layer are the inputs and the ones of the last
+    layer are the outputs. Each function node takes `fan_in` data nodes of
+    the previous layers and produces `fan_out` new data nodes.
+
+    :param size:
+        Number of function nodes.
+    :type size: int
+
+    :param fan_in:
+        Number of inputs of a function.
+    :type fan_in: int
+
+    :param fan_out:
+        Number of outputs of a function.
+    :type fan_out: int
+
+    :param depth:
+        Number of layers. If None it is the square root of the size.
+    :type depth: int, optional
+
+    :param sub_ratio:
+        Ratio of function nodes that are sub-dispatchers (i.e., nested models
+        added with `add_dispatcher`).
+    :type sub_ratio: float
+
+    :param domain_density:
+        Ratio of function nodes with an input domain.
+    :type domain_density: float
+
+    :param wait_density:
+        Ratio of data nodes that wait all their inputs.
+    :type wait_density: float
+
+    :param cycle_density:
+        Ratio of function nodes that have an extra back edge (i.e., a function
+        from a data node of a layer to a data node of a previous one).
+    :type cycle_density: float
+
+    :param seed:
+        Random seed.
+    :type seed: int
+
+    :param blue:
+        Return a :class:`~schedula.utils.blue.BlueDispatcher`?
+    :type blue: bool
+
+    :param functions:
+        Functions assigned in turn to the function nodes of the model (e.g.,
+        module functions to be saved by reference). By default, a function
+        that sums its inputs.
+    :type functions: list[callable], optional
+
+    :param name:
+        Model name.
+    :type name: str
+
+    :return:
+        Model, inputs, and outputs.
+    :rtype: (schedula.Dispatcher, dict, list)
+
+    Example::
+
+        >>> dsp, inputs, outputs = generate_model(20, seed=1)
+        >>> len(dsp.function_nodes), len(inputs), len(outputs) > 0
+        (20, 2, True)
+        >>> other = generate_model(20, seed=1)[0]
+        >>> sorted(dsp(inputs)) == sorted(other(inputs))
+        True
+    """
+    rnd = random.Random(seed)
+    dsp = (sh.BlueDispatcher if blue else sh.Dispatcher)(name=name)
+    depth = max(int(depth or size ** .5), 1)
+    n_inp = fan_in if _level else max(fan_in, -(-size // depth) // 2)
+    layers = [['%s%d' % ('x' if _level else 'i', i) for i in range(n_inp)]]
+    waits = set()
+    for i in range(size):
+        layer = i * depth // size + 1
+        if len(layers) <= layer:
+            layers.append([])
+        available = [d for l in layers[:layer] for d in l]
+        inputs = rnd.sample(available, min(fan_in, len(available)))
+        outputs = ['d%d_%d' % (i, j) for j in range(fan_out)]
+        layers[layer].extend(outputs)
+        fid = 'f%d' % i
+        if _level == 0 and rnd.random() < sub_ratio:
+            sub, sub_inp, sub_out = generate_model(
+                max(size // 20, 3), fan_in, fan_out, 2, 0, domain_density,
+                wait_density, cycle_density, rnd.randrange(2 ** 32), blue,
+                functions, 'sub%d' % i, _level + 1
+            )
+            dsp.add_dispatcher(
+                sub, dict(zip(inputs, sub_inp)),
+                dict(zip(sub_out[-fan_out:], outputs)), fid
+            )
+            continue
+        for d in outputs:
+            if rnd.random() < wait_density:
+                waits.add(d)
+                dsp.add_data(d, wait_inputs=True, function=_wait)
+        kw = {}
+        if rnd.random() < domain_density:
+            kw['input_domain'] = _domain
+        if functions:
+            func = functions[i % len(functions)]
+        else:
+            func = functools.partial(_function, fan_out)
+        dsp.add_function(fid, func, inputs, outputs, **kw)
+        if layer > 1 and rnd.random() < cycle_density:
+            back = [
+                d for d in layers[rnd.randrange(1, layer)] if d not in waits
+            ]
+            if back:
+                dsp.add_function(
+                    'c%d' % i, functools.partial(_function, 1), outputs[:1],
+                    [rnd.choice(back)]
+                )
+    inputs = {k: rnd.random() for k in layers[0]}
+    return dsp, inputs, list(layers[-1])
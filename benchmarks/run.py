@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It runs the benchmark suite and compares the results with a stored baseline.
+
+The `time_*` benchmarks report the median time [s] per call, the
+`peakmem_*` benchmarks the peak memory [bytes] allocated by Python during a
+call (measured by :mod:`tracemalloc`), and the `track_*` benchmarks the value
+they return (e.g., the import time [us] of a module). A benchmark is a
+regression when its result is greater than the baseline multiplied by the
+regression factor.
+
+Usage::
+
+    $ python -m benchmarks.run [-b BENCH] [--baseline PATH] [--save PATH]
+                               [--factor FACTOR] [--quick]
+
+The process exits with status 1 if there are regressions.
+"""
+import os
+import re
+import sys
+import json
+import timeit
+import inspect
+import platform
+import argparse
+import importlib
+import itertools
+import statistics
+import tracemalloc
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(BENCHMARKS_DIR, 'baseline.json')
+PREFIXES = 'time_', 'peakmem_', 'track_'
+
+
+def _params(cls):
+    params = getattr(cls, 'params', [])
+    if params and not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def discover(pattern=None):
+    """
+    Yields the benchmarks of the suite.
+
+    :param pattern:
+        Regular expression to select the benchmarks by name.
+    :type pattern: str, optional
+
+    :return:
+        Benchmark name, class, method name, and parameters.
+    :rtype: collections.abc.Iterable[(str, type, str, tuple)]
+    """
+    regex = pattern and re.compile(pattern)
+    for fname in sorted(os.listdir(BENCHMARKS_DIR)):
+        if not (fname.startswith('bench_') and fname.endswith('.py')):
+            continue
+        mdl = importlib.import_module('%s.%s' % (__package__, fname[:-3]))
+        for cls_name, cls in inspect.getmembers(mdl, inspect.isclass):
+            if cls.__module__ != mdl.__name__:
+                continue
+            for meth in sorted(vars(cls)):
+                if not meth.startswith(PREFIXES):
+                    continue
+                for params in _params(cls):
+                    name = '%s.%s.%s' % (fname[6:-3], cls_name, meth)
+                    if params:
+                        name += '(%s)' % ', '.join(map(str, params))
+                    if regex and not regex.search(name):
+                        continue
+                    yield name, cls, meth, params
+
+
+def measure(cls, meth, params, quick=False, repeat=5):
+    """
+    Runs a benchmark.
+
+    :param cls:
+        Benchmark class.
+    :type cls: type
+
+    :param meth:
+        Benchmark method name.
+    :type meth: str
+
+    :param params:
+        Benchmark parameters.
+    :type params: tuple
+
+    :param quick:
+        Run the benchmark once?
+    :type quick: bool
+
+    :param repeat:
+        Number of time measurements.
+    :type repeat: int
+
+    :return:
+        Benchmark result or None if it is skipped.
+    :rtype: float | int | None
+    """
+    obj = cls()
+    try:
+        getattr(obj, 'setup', lambda *a: None)(*params)
+    except NotImplementedError:  # Skipped as in asv.
+        return None
+    try:
+        func = getattr(obj, meth)
+        if meth.startswith('track_'):
+            return func(*params)
+        if meth.startswith('peakmem_'):
+            tracing = tracemalloc.is_tracing()
+            tracing or tracemalloc.start()
+            try:
+                tracemalloc.reset_peak()
+                start = tracemalloc.get_traced_memory()[0]
+                func(*params)
+                return tracemalloc.get_traced_memory()[1] - start
+            finally:
+                tracing or tracemalloc.stop()
+        timer = timeit.Timer(lambda: func(*params))
+        if quick:
+            return timer.timeit(1)
+        number = timer.autorange()[0]
+        return statistics.median(
+            t / number for t in timer.repeat(repeat, number)
+        )
+    finally:
+        getattr(obj, 'teardown', lambda *a: None)(*params)
+
+
+def compare(results, baseline, factor=1.25):
+    """
+    Returns the regressions of the results w.r.t. the baseline.
+
+    :param results:
+        Benchmark results.
+    :type results: dict
+
+    :param baseline:
+        Baseline results.
+    :type baseline: dict
+
+    :param factor:
+        Regression factor.
+    :type factor: float
+
+    :return:
+        Benchmark name, baseline, and result of the regressions.
+    :rtype: list[(str, float, float)]
+
+    Example::
+
+        >>> compare({'a': 2.0, 'b': 1.1, 'c': 3}, {'a': 1.0, 'b': 1.0})
+        [('a', 1.0, 2.0)]
+    """
+    return [
+        (k, baseline[k], v) for k, v in results.items()
+        if k in baseline and v is not None and baseline[k] is not None and
+        v > baseline[k] * factor
+    ]
+
+
+def _machine():
+    return {
+        'python': platform.python_version(), 'system': platform.system(),
+        'machine': platform.machine(), 'cpus': os.cpu_count()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.run', description=__doc__.split('\n')[1]
+    )
+    parser.add_argument('-b', '--bench', help='regex to select benchmarks')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='baseline file (default: %(default)s)')
+    parser.add_argument('--save', help='file where to save the results')
+    parser.add_argument('--factor', type=float, default=1.25,
+                        help='regression factor (default: %(default)s)')
+    parser.add_argument('--quick', action='store_true',
+                        help='run each benchmark once (smoke test)')
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline) as f:
+            data = json.load(f)
+        baseline = data['results']
+        if data.get('machine') != _machine():
+            print('Warning: the baseline was recorded on %r.' % (
+                data.get('machine'),
+            ))
+
+    results = {}
+    for name, cls, meth, params in discover(args.bench):
+        results[name] = value = measure(cls, meth, params, args.quick)
+        ref = baseline.get(name)
+        if value is None:
+            msg = 'skipped'
+        elif meth.startswith('peakmem_'):
+            msg = '%d B' % value
+        elif meth.startswith('track_'):
+            msg = '%s %s' % (value, getattr(cls, 'unit', ''))
+        else:
+            msg = '%.6f s' % value
+        if value is not None and ref:
+            msg += ' (%.2fx)' % (value / ref)
+        print('%s: %s' % (name, msg))
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'machine': _machine(), 'results': results}, f,
+                      indent=2, sort_keys=True)
+
+    if args.quick:  # Single runs are too noisy to be compared.
+        return 0
+    regressions = compare(results, baseline, args.factor)
+    for name, ref, value in regressions:
+        print('REGRESSION %s: %s -> %s' % (name, ref, value))
+    return int(bool(regressions))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
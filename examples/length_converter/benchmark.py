@@ -0,0 +1,34 @@
+"""
+Compares the row by row execution of the converter with the vectorized one.
+
+Run it from this folder::
+
+    $ python benchmark.py
+"""
+import timeit
+import numpy as np
+import schedula as sh
+from converter import converter
+
+if __name__ == '__main__':
+    n, sample = 1000000, 2000
+    dsp = converter.register()
+    values = np.random.default_rng(0).random(n)
+    inputs, outputs = ['ft'], ['cm', 'km', 'lea']
+
+    func = sh.SubDispatchFunction(dsp, 'convert', inputs, outputs)
+    t_row = timeit.timeit(
+        lambda: [func(v) for v in values[:sample]], number=1
+    ) / sample * n
+    print('Row by row: %.2f s (estimated from %d rows).' % (t_row, sample))
+
+    vfunc = sh.SubDispatchFunction(
+        dsp, 'convert', inputs, outputs, vectorize=True
+    )
+    t_vec = min(timeit.repeat(lambda: vfunc(values), number=1, repeat=3))
+    print('Vectorized: %.4f s (%.0fx faster).' % (t_vec, t_row / t_vec))
+
+    # The vectorized results are the same of the row by row execution.
+    res = vfunc(values[:10])
+    for i, v in enumerate(values[:10]):
+        np.testing.assert_allclose([r[i] for r in res], func(v))
@@ -8,11 +8,11 @@ converter.extend(imperial, metric)  # Concatenate imperial and metric models.
 # Add the connection between the two unit system.
 converter.add_function(
     'inch2cm', lambda inch: 2.54 * inch, ['in'], ['cm'],
-    description='Converts inches to cm.'
+    description='Converts inches to cm.', vectorizable=True
 )
 converter.add_function(
     'cm2inch', lambda cm: cm / 2.54, ['cm'], ['in'],
-    description='Converts cm to inches.'
+    description='Converts cm to inches.', vectorizable=True
 )
 
 if __name__ == '__main__':
@@ -128,14 +128,16 @@ def thou2leagues(th):
 
 # ----------------------------------- MODEL -----------------------------------
 imperial = sh.BlueDispatcher(name='Imperial')
-imperial.add_func(leagues2miles, outputs=['mi'])
-imperial.add_func(miles2furlongs, outputs=['fur'])
-imperial.add_func(furlongs2chains, outputs=['ch'])
-imperial.add_func(chains2yards, outputs=['yd'])
-imperial.add_func(yards2feet, outputs=['ft'])
-imperial.add_func(feet2inch, outputs=['in'])
-imperial.add_func(inch2thou, outputs=['th'], inputs=['in'])
-imperial.add_func(thou2leagues, outputs=['lea'])
+imperial.add_func(leagues2miles, outputs=['mi'], vectorizable=True)
+imperial.add_func(miles2furlongs, outputs=['fur'], vectorizable=True)
+imperial.add_func(furlongs2chains, outputs=['ch'], vectorizable=True)
+imperial.add_func(chains2yards, outputs=['yd'], vectorizable=True)
+imperial.add_func(yards2feet, outputs=['ft'], vectorizable=True)
+imperial.add_func(feet2inch, outputs=['in'], vectorizable=True)
+imperial.add_func(
+    inch2thou, outputs=['th'], inputs=['in'], vectorizable=True
+)
+imperial.add_func(thou2leagues, outputs=['lea'], vectorizable=True)
 
 if __name__ == '__main__':
     # To plot the imperial model.
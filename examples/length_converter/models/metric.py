@@ -82,11 +82,11 @@ def mm2km(mm):
 
 # ----------------------------------- MODEL -----------------------------------
 metric = sh.BlueDispatcher(name='Metric')
-metric.add_func(km2m, outputs=['m'])
-metric.add_func(m2dm, outputs=['dm'])
-metric.add_func(dm2cm, outputs=['cm'])
-metric.add_func(cm2mm, outputs=['mm'])
-metric.add_func(mm2km, outputs=['km'])
+metric.add_func(km2m, outputs=['m'], vectorizable=True)
+metric.add_func(m2dm, outputs=['dm'], vectorizable=True)
+metric.add_func(dm2cm, outputs=['cm'], vectorizable=True)
+metric.add_func(cm2mm, outputs=['mm'], vectorizable=True)
+metric.add_func(mm2km, outputs=['km'], vectorizable=True)
 
 if __name__ == '__main__':
     # To plot the metric model.
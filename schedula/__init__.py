@@ -31,6 +31,7 @@ from ._version import *
 _all = {
     'Dispatcher': '.dispatcher',
     'BlueDispatcher': '.utils.blue',
+    'FrozenDispatcher': '.utils.frozen',
     'Blueprint': '.utils.blue',
     'PoolExecutor': '.utils.asy.executors',
     'ProcessExecutor': '.utils.asy.executors',
@@ -68,23 +69,33 @@ _all = {
     'MapDispatch': '.utils.dsp',
     'parent_func': '.utils.dsp',
     'SubDispatchPipe': '.utils.dsp',
+    'MultiDispatchPipe': '.utils.dsp',
     'DispatchPipe': '.utils.dsp',
     'kk_dict': '.utils.dsp',
     'add_function': '.utils.dsp',
     'DispatcherError': '.utils.exc',
     'DispatcherAbort': '.utils.exc',
+    'DeadlineExceeded': '.utils.exc',
     'ExecutorShutdown': '.utils.exc',
     'WebResponse': '.utils.exc',
     'SkipNode': '.utils.exc',
     'counter': '.utils.gen',
     'Token': '.utils.gen',
+    'LazyValue': '.utils.gen',
     'DiGraph': '.utils.graph',
+    'register_hook': '.utils.hook',
+    'unregister_hook': '.utils.hook',
+    'MetricsCollector': '.utils.hook',
+    'DispatchStream': '.utils.stream',
     'save_dispatcher': '.utils.io',
     'load_dispatcher': '.utils.io',
     'save_default_values': '.utils.io',
     'load_default_values': '.utils.io',
     'save_map': '.utils.io',
-    'load_map': '.utils.io'
+    'load_map': '.utils.io',
+    'save_pipe': '.utils.io',
+    'load_pipe': '.utils.io',
+    'MemoryMap': '.utils.io'
 }
 
 __all__ = tuple(_all)
@@ -124,7 +135,7 @@ if sys.version_info[:2] < (3, 7) or os.environ.get('IMPORT_ALL') == 'True':
     from .utils.cst import EMPTY, END, NONE, PLOT, SELF, SINK, START
     from .utils.dsp import (
         DispatchPipe, SubDispatch, SubDispatchFunction, SubDispatchPipe,
-        MapDispatch, add_args, partial, run_model,
+        MapDispatch, MultiDispatchPipe, add_args, partial, run_model,
         add_function, are_in_nested_dicts, bypass, combine_dicts,
         combine_nested_dicts, get_nested_dicts, inf, kk_dict, map_dict,
         map_list,
@@ -132,16 +143,20 @@ if sys.version_info[:2] < (3, 7) or os.environ.get('IMPORT_ALL') == 'True':
         summation
     )
     from .utils.exc import (
-        DispatcherAbort, DispatcherError, ExecutorShutdown, SkipNode,
-        WebResponse
+        DeadlineExceeded, DispatcherAbort, DispatcherError, ExecutorShutdown,
+        SkipNode, WebResponse
     )
-    from .utils.gen import Token, counter
+    from .utils.frozen import FrozenDispatcher
+    from .utils.gen import LazyValue, Token, counter
     from .utils.graph import DiGraph
+    from .utils.hook import MetricsCollector, register_hook, unregister_hook
+    from .utils.stream import DispatchStream
 
     try:
         from .utils.io import (
-            load_default_values, load_dispatcher, load_map, save_default_values,
-            save_dispatcher, save_map
+            MemoryMap, load_default_values, load_dispatcher, load_map,
+            load_pipe, save_default_values, save_dispatcher, save_map,
+            save_pipe
         )
     except ImportError:  # MicroPython.
         pass
@@ -16,9 +16,9 @@ Define the command line interface.
 """
 import click
 import logging
+import importlib
 import click_log
 from schedula import __version__
-from schedula.utils.form.cli import cli as form
 
 log = logging.getLogger('schedula.cli')
 
@@ -38,8 +38,39 @@ logger = _Logger('cli')
 click_log.basic_config(logger)
 
 
+class _LazyGroup(click.Group):
+    # Imports the sub-commands on first use, so the heavy dependencies of a
+    # sub-command are not loaded by the others or by the help.
+    lazy_commands = {
+        'form': ('schedula.utils.form.cli:cli',
+                 'schedula forms command line tool.')
+    }
+
+    def list_commands(self, ctx):
+        return sorted(set(super(_LazyGroup, self).list_commands(ctx)).union(
+            self.lazy_commands
+        ))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands:
+            mdl, name = self.lazy_commands[cmd_name][0].split(':')
+            return getattr(importlib.import_module(mdl), name)
+        return super(_LazyGroup, self).get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        rows = [
+            (k, self.lazy_commands[k][1] if k in self.lazy_commands else
+            self.commands[k].get_short_help_str())
+            for k in self.list_commands(ctx)
+        ]
+        if rows:
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
+
+
 @click.group(
-    'schedula', context_settings=dict(help_option_names=['-h', '--help'])
+    'schedula', cls=_LazyGroup,
+    context_settings=dict(help_option_names=['-h', '--help'])
 )
 @click.version_option(__version__)
 def cli():
@@ -47,8 +78,5 @@ def cli():
     schedula command line tool.
     """
 
-
-cli.add_command(form)
-
 if __name__ == '__main__':
     cli()
@@ -9,13 +9,15 @@
 It provides Dispatcher class.
 """
 import copy
+import time
 from .utils.cst import EMPTY, START, NONE, SINK, SELF, PLOT, END
 from .utils.dsp import (
     bypass, combine_dicts, selector, parent_func, kk_dict
 )
 from .utils.gen import counter
 from .utils.base import Base
-from .utils.utl import get_unused_node_id
+from .utils.imp import WeakSet
+from .utils.utl import get_unused_node_id, cached_by_version
 
 __all__ = ['Dispatcher']
 __author__ = 'Vincenzo Arcidiacono <vinci1it2000@gmail.com>'
@@ -131,11 +133,76 @@ class Dispatcher(Base):
         Solution({'a': 0, 'b': 1, 'c': 1, 'd': 2.0})
     """
 
+    #: Maximum number of memoized :func:`shrink_dsp` results.
+    shrink_cache_size = 32
+
     def __getstate__(self):
         state = self.__dict__.copy()
         state['solution'] = state['solution'].__class__(self)
+        state.pop('_cache', None)
+        state.pop('_parents', None)
+        state.pop('_dfl_shared', None)
         return state
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.pop('nodes', None)  # Pickled by an older version.
+        self.__dict__.setdefault('_version', 0)
+        self._dfl_shared = None
+        self._cache, self._parents = {}, WeakSet()
+        self._link_sub_dsps()
+
+    def __deepcopy__(self, memo):
+        cls = self.__class__
+        memo[id(self)] = result = cls.__new__(cls)
+        for k, v in self.__dict__.items():
+            if k not in ('_cache', '_parents', '_dfl_shared'):
+                setattr(result, k, copy.deepcopy(v, memo))
+        result._cache, result._parents = {}, WeakSet()
+        result._dfl_shared = None
+        result._link_sub_dsps()
+        return result
+
+    def __copy__(self):
+        return self._cow_copy({})
+
+    def _cow_copy(self, memo):
+        try:
+            return memo[id(self)]
+        except KeyError:
+            cls = self.__class__
+            memo[id(self)] = result = cls.__new__(cls)
+        result.__dict__.update(self.__dict__)
+
+        # Share the default values until one of the dispatchers changes them.
+        shared = self.__dict__.get('_dfl_shared') or [1]
+        shared[0] += 1
+        self._dfl_shared = result._dfl_shared = shared
+
+        result.counter = copy.deepcopy(self.counter)
+        result._cache, result._parents = {}, WeakSet()
+
+        # Sub-dispatchers and sub-dispatch functions have a state.
+        override = {}
+        for k, a in self._stateful_nodes.items():
+            function = a['function']._cow_copy(memo)
+            override[k] = dict(a, function=function)
+            if a['type'] == 'dispatcher':
+                function._parents.add(result)
+        result.dmap = self.dmap.cow_copy(override)
+        result.solution = self.solution.__class__(result)
+        return result
+
+    def _own_default_values(self):
+        """
+        Clones the default values shared with other dispatchers (if any).
+        """
+        shared = self.__dict__.get('_dfl_shared')
+        if shared and shared[0] > 1:
+            shared[0] -= 1
+            self._dfl_shared = [1]
+            self.default_values = self.default_values.copy()
+
     def __init__(self, dmap=None, name='', default_values=None, raises=False,
                  description='', executor=False):
         """
@@ -192,9 +259,6 @@ class Dispatcher(Base):
         #: The dispatcher's description.
         self.__doc__ = description
 
-        #: The function and data nodes of the dispatcher.
-        self.nodes = self.dmap.nodes
-
         #: Data node default values. These will be used as input if it is not
         #: specified as inputs in the ArciDispatch algorithm.
         self.default_values = default_values or {}
@@ -212,6 +276,67 @@ class Dispatcher(Base):
         #: Counter to set the node index.
         self.counter = counter()
 
+        self._version, self._cache, self._parents = 0, {}, WeakSet()
+        self._dfl_shared = None
+        self._link_sub_dsps()
+
+    @property
+    def nodes(self):
+        """
+        The function and data nodes of the dispatcher.
+
+        :return:
+            The function and data nodes of the dispatcher.
+        :rtype: dict[str, dict]
+        """
+        return self.dmap.nodes
+
+    @property
+    def version(self):
+        """
+        Structural version of the dispatcher.
+
+        It is increased by every mutating method of the dispatcher, of its
+        `dmap`, and of its sub-dispatchers.
+
+        :return:
+            Structural version.
+        :rtype: int
+
+        Example::
+
+            >>> dsp = Dispatcher()
+            >>> sub_dsp = Dispatcher()
+            >>> dsp.add_dispatcher(sub_dsp, ['a'], ['b'], 'sub')
+            'sub'
+            >>> v = dsp.version
+            >>> sub_dsp.add_data('c')
+            'c'
+            >>> dsp.version > v
+            True
+        """
+        return self._version + self.dmap.version
+
+    def _bump(self):
+        """
+        Increases the structural version of the dispatcher and its parents.
+        """
+        self._version += 1
+        if self._parents:
+            for p in tuple(self._parents):
+                p._bump()
+
+    def _link_sub_dsps(self):
+        """
+        Registers the dispatcher as parent of its sub-dispatchers.
+        """
+        for a in self.dmap.nodes.values():
+            if a.get('type') == 'dispatcher' and \
+                    isinstance(a.get('function'), Dispatcher):
+                a['function'].__dict__.setdefault(
+                    '_parents', WeakSet()
+                ).add(self)
+
     def copy_structure(self, **kwargs):
         """
         Returns a copy of the Dispatcher structure.
@@ -404,6 +529,7 @@ class Dispatcher(Base):
 
         # Add node to the dispatcher map.
         self.dmap.add_node(data_id, **attr_dict)
+        self._bump()
 
         # Set default value.
         self.set_default_value(data_id, default_value, initial_dist)
@@ -414,7 +540,7 @@ class Dispatcher(Base):
                      outputs=None, input_domain=None, weight=None,
                      inp_weight=None, out_weight=None, description=None,
                      filters=None, await_domain=None, await_result=None,
-                     **kwargs):
+                     timeout=None, **kwargs):
         """
         Add a single function node to dispatcher.
 
@@ -482,6 +608,13 @@ class Dispatcher(Base):
             asynchronous or parallel execution is enable.
         :type await_result: bool|int|float, optional
 
+        :param timeout:
+            Maximum execution time [s] of the function. When it is exceeded the
+            node fails with a `TimeoutError`, the worker process is terminated
+            (a worker thread is left running). Note this is used when
+            asynchronous or parallel execution is enable.
+        :type timeout: int|float, optional
+
         :param kwargs:
             Set additional node attributes using key=value.
         :type kwargs: keyword arguments, optional
@@ -561,6 +694,9 @@ class Dispatcher(Base):
         if await_result is not None:  # Add await_result as node attribute.
             attr_dict['await_result'] = await_result
 
+        if timeout is not None:  # Add timeout as node attribute.
+            attr_dict['timeout'] = timeout
+
         if description is not None:  # Add description as node attribute.
             attr_dict['description'] = description
 
@@ -590,6 +726,7 @@ class Dispatcher(Base):
 
         # Add node to the dispatcher map.
         self.dmap.add_node(fun_id, **attr_dict)
+        self._bump()
 
         from .utils.alg import add_func_edges  # Add input edges.
         n_data = add_func_edges(self, fun_id, inputs, inp_weight, True)
@@ -603,7 +740,7 @@ class Dispatcher(Base):
                  inputs_defaults=False, inputs_kwargs=False, filters=None,
                  input_domain=None, await_domain=None, await_result=None,
                  inp_weight=None, out_weight=None, description=None,
-                 inputs=None, function_id=None, **kwargs):
+                 inputs=None, function_id=None, timeout=None, **kwargs):
         """
         Add a single function node to dispatcher.
 
@@ -680,6 +817,13 @@ class Dispatcher(Base):
             asynchronous or parallel execution is enable.
         :type await_result: bool|int|float, optional
 
+        :param timeout:
+            Maximum execution time [s] of the function. When it is exceeded the
+            node fails with a `TimeoutError`, the worker process is terminated
+            (a worker thread is left running). Note this is used when
+            asynchronous or parallel execution is enable.
+        :type timeout: int|float, optional
+
         :param kwargs:
             Set additional node attributes using key=value.
         :type kwargs: keyword arguments, optional
@@ -729,7 +873,7 @@ class Dispatcher(Base):
             input_domain=input_domain, await_domain=await_domain, inputs=inputs,
             description=description, out_weight=out_weight,
             inp_weight=inp_weight, await_result=await_result,
-            function_id=function_id, **kwargs
+            function_id=function_id, timeout=timeout, **kwargs
         )
 
         if inputs_defaults:
@@ -870,6 +1014,9 @@ class Dispatcher(Base):
             )
             dsp.add_from_lists(**kw)
 
+        if include_defaults:  # It fails before changing the model.
+            dsp._own_default_values()
+
         if not dsp_id:  # Get the dsp id.
             dsp_id = dsp.name or 'unknown'
 
@@ -923,6 +1070,7 @@ class Dispatcher(Base):
 
         # Set proper outputs.
         self.nodes[dsp_id]['outputs'] = outputs
+        dsp._parents.add(self)
 
         if SINK not in dsp.nodes and \
                 SINK in _nodes(inputs.values()).union(_nodes(outputs)):
@@ -947,6 +1095,7 @@ class Dispatcher(Base):
             # Remove default values.
             for k in remove:
                 dsp_dfl.pop(k, None)
+            dsp._bump()
 
         return dsp_id  # Return sub-dispatcher node id.
 
@@ -1036,6 +1185,98 @@ class Dispatcher(Base):
         # Return data, function, and sub-dispatcher node ids.
         return data_ids, fun_ids, dsp_ids
 
+    def add_from_records(self, data_records=None, fun_records=None,
+                         dsp_records=None):
+        """
+        Add multiple data, function, and sub-dispatcher nodes in bulk.
+
+        It is the bulk version of :func:`add_from_lists`: the nodes and edges
+        are written in the dispatcher map directly, the records are validated
+        once, and the dispatcher version is increased only at the end. If some
+        records are invalid, the dispatcher is restored and a `ValueError`
+        listing all invalid records is raised.
+
+        :param data_records:
+            Data node kwargs (see :func:`add_data`) as a list of records or as
+            a dictionary of columns (i.e., `{'data_id': [...], ...}`).
+        :type data_records: list[dict] | dict[str, list], optional
+
+        :param fun_records:
+            Function node kwargs (see :func:`add_function`) as a list of
+            records or as a dictionary of columns.
+        :type fun_records: list[dict] | dict[str, list], optional
+
+        :param dsp_records:
+            Sub-dispatcher node kwargs (see :func:`add_dispatcher`) as a list of
+            records or as a dictionary of columns. They are added once the data
+            and function records are validated; if one fails, the dispatcher
+            is restored.
+        :type dsp_records: list[dict] | dict[str, list], optional
+
+        :returns:
+
+            - Data node ids.
+            - Function node ids.
+            - Sub-dispatcher node ids.
+        :rtype: (list[str], list[str], list[str])
+
+        .. seealso:: :func:`add_from_lists`
+
+        **--------------------------------------------------------------------**
+
+        **Example**:
+
+        .. testsetup::
+            >>> dsp = Dispatcher(name='Dispatcher')
+
+        Define the data and the function nodes as columns::
+
+            >>> def func(a, b):
+            ...     return a + b
+            ...
+            >>> data_records = {'data_id': ['a', 'b'], 'default_value': [1, 2]}
+            >>> fun_records = {
+            ...     'function': [func, func],
+            ...     'inputs': [['a', 'b'], ['a', 'c']],
+            ...     'outputs': [['c'], ['d']]
+            ... }
+
+        Add them to dispatcher::
+
+            >>> dsp.add_from_records(data_records, fun_records)
+            (['a', 'b'], ['func', 'func<0>'], [])
+            >>> sorted(dsp.dispatch())
+            ['a', 'b', 'c', 'd']
+
+        Invalid records are reported all together and nothing is added::
+
+            >>> dsp.add_from_records(fun_records=[
+            ...     {'function': func, 'inputs': ['func'], 'outputs': ['e']},
+            ...     {'function': func, 'inputs': ['a'], 'outputs': ['func']}
+            ... ])
+            Traceback (most recent call last):
+             ...
+            ValueError: Invalid records:
+              fun_records[0]: Invalid input id: func is not a data node
+              fun_records[1]: Invalid output id: func is not a data node
+            >>> 'e' in dsp.nodes
+            False
+        """
+        from .utils.alg import _records, _add_records
+        data_records, fun_records, dsp_records = map(
+            _records, (data_records, fun_records, dsp_records)
+        )
+        ids, errors = _add_records(
+            self, data_records, fun_records, dsp_records
+        )
+        self.dmap._bump()
+        self._bump()
+        if errors:
+            raise ValueError('Invalid records:\n  %s' % '\n  '.join(errors))
+
+        # Return data, function, and sub-dispatcher node ids.
+        return ids
+
     def set_default_value(self, data_id, value=EMPTY, initial_dist=0.0):
         """
         Set the default value of a data node in the dispatcher.
@@ -1082,6 +1323,7 @@ class Dispatcher(Base):
 
         try:
             if self.dmap.nodes[data_id]['type'] == 'data':  # Is data node?
+                self._own_default_values()
                 if value is EMPTY:
                     self.default_values.pop(data_id, None)  # Remove default.
                 else:  # Add default.
@@ -1089,6 +1331,7 @@ class Dispatcher(Base):
                         'value': value,
                         'initial_dist': initial_dist
                     }
+                self._bump()
                 return
         except KeyError:
             pass
@@ -1433,9 +1676,12 @@ class Dispatcher(Base):
                 i, o = _update_io(a, pred[k], succ[k])  # Unreachable nodes.
                 msg = 'Sub-dsp {} missing: inp {}, out {}'
                 assert not i and not o, msg.format(k, i, o)
+        sub_dsp.dmap._bump()  # Nodes and edges have been set directly.
+        sub_dsp._link_sub_dsps()
         return sub_dsp  # Return the sub-dispatcher map.
 
     @property
+    @cached_by_version
     def data_nodes(self):
         """
         Returns all data nodes of the dispatcher.
@@ -1448,6 +1694,7 @@ class Dispatcher(Base):
         return {k: v for k, v in self.nodes.items() if v['type'] == 'data'}
 
     @property
+    @cached_by_version
     def function_nodes(self):
         """
         Returns all function nodes of the dispatcher.
@@ -1460,6 +1707,7 @@ class Dispatcher(Base):
         return {k: v for k, v in self.nodes.items() if v['type'] == 'function'}
 
     @property
+    @cached_by_version
     def sub_dsp_nodes(self):
         """
         Returns all sub-dispatcher nodes of the dispatcher.
@@ -1473,9 +1721,26 @@ class Dispatcher(Base):
             k: v for k, v in self.nodes.items() if v['type'] == 'dispatcher'
         }
 
+    @property
+    @cached_by_version
+    def _stateful_nodes(self):
+        from .utils.dsp import SubDispatch
+        return {
+            k: v for k, v in self.nodes.items()
+            if isinstance(v.get('function'), (Dispatcher, SubDispatch))
+        }
+
     def copy(self):
         """
-        Returns a deepcopy of the Dispatcher.
+        Returns a copy-on-write copy of the Dispatcher.
+
+        The copy shares the nodes, the edges, the node attributes, and the
+        default values with the original. The containers are cloned by the
+        first dispatcher that modifies them through the :class:`Dispatcher`
+        and :class:`~schedula.utils.graph.DiGraph` methods. Sub-dispatchers
+        and sub-dispatch functions are copied in the same way, while the
+        other functions, the default values, and the last dispatch solution are
+        not copied. Use :func:`copy.deepcopy` for a fully independent copy.
 
         :return:
             A copy of the Dispatcher.
@@ -1484,10 +1749,119 @@ class Dispatcher(Base):
         Example::
 
             >>> dsp = Dispatcher()
-            >>> dsp is dsp.copy()
+            >>> dsp.add_data('a', default_value=[1])
+            'a'
+            >>> c = dsp.copy()
+            >>> c is dsp, c.nodes is dsp.nodes
+            (False, True)
+            >>> v = dsp.default_values['a']['value']
+            >>> c.default_values['a']['value'] is v
+            True
+            >>> c.add_data('b')
+            'b'
+            >>> c.set_default_value('a', 2)
+            >>> sorted(c.nodes), sorted(dsp.nodes)
+            (['a', 'b'], ['a'])
+            >>> dsp.default_values['a']['value']
+            [1]
+        """
+        return copy.copy(self)  # Return the copy of the Dispatcher.
+
+    def freeze(self):
+        """
+        Returns an immutable and hashable compiled copy of the Dispatcher.
+
+        The node records (e.g., successors, edge lengths, and `wait_inputs`
+        flags) are precomputed to speed up the dispatch. Sub-dispatchers are
+        frozen recursively.
+
+        :return:
+            A frozen copy of the Dispatcher.
+        :rtype: schedula.utils.frozen.FrozenDispatcher
+
+        Example::
+
+            >>> dsp = Dispatcher()
+            >>> dsp.add_function(function=max, inputs=['a', 'b'], outputs=['c'])
+            'max'
+            >>> frozen = dsp.freeze()
+            >>> frozen.dispatch({'a': 1, 'b': 3})
+            Solution({'a': 1, 'b': 3, 'c': 3})
+            >>> isinstance(hash(frozen), int), frozen.freeze() is frozen
+            (True, True)
+        """
+        from .utils.frozen import FrozenDispatcher
+        return FrozenDispatcher._freeze(self, {})
+
+    def fingerprint(self, code=False):
+        """
+        Returns a deterministic structural digest of the Dispatcher.
+
+        It is a Merkle hash of node ids, types, attributes (e.g., weights and
+        function identities), edges, and default values. Sub-dispatchers and
+        the dispatchers of :class:`~schedula.utils.dsp.SubDispatch` functions
+        are hashed recursively. Functions are identified by module and
+        qualified name (see :func:`~schedula.utils.utl.fingerprint`). The
+        digest does not depend on the process, the node insertion order, the
+        name, and the description of the Dispatcher. It is cached until the
+        `version` of the Dispatcher or of one of its sub-models changes.
+
+        :param code:
+            If True the byte-code of the functions is hashed.
+        :type code: bool, optional
+
+        :return:
+            Hexadecimal digest.
+        :rtype: str
+
+        Example::
+
+            >>> dsp = Dispatcher()
+            >>> dsp.add_function(function=max, inputs=['a', 'b'], outputs=['c'])
+            'max'
+            >>> other = Dispatcher(name='other')
+            >>> other.add_data('c')
+            'c'
+            >>> other.add_function('max', max, ['a', 'b'], ['c'])
+            'max'
+            >>> dsp.fingerprint() == other.fingerprint()
+            True
+            >>> other.set_default_value('a', 1)
+            >>> dsp.fingerprint() == other.fingerprint()
             False
         """
-        return copy.deepcopy(self)  # Return the copy of the Dispatcher.
+        return self._fingerprint(code, {})
+
+    def _fingerprint_token(self):
+        # None when the digest cannot be cached: the attributes of the
+        # sub-dispatch functions (e.g., `outputs`) are not versioned.
+        tokens = [self.version]
+        for a in self._stateful_nodes.values():
+            if a['type'] != 'dispatcher':
+                return None
+            tokens.append(a['function']._fingerprint_token())
+            if tokens[-1] is None:
+                return None
+        return tuple(tokens)
+
+    def _fingerprint(self, code, memo):
+        from .utils.utl import _canon, _hash
+        key, token = ('fingerprint', code), self._fingerprint_token()
+        try:
+            t, fp = self._cache[key]
+            if token is not None and t == token:
+                return fp
+        except KeyError:
+            pass
+        succ, items, skip = self.dmap.succ, [], ('index', 'remote_links')
+        for k, a in self.dmap.nodes.items():
+            a = {i: v for i, v in a.items() if i not in skip}
+            items.append(_hash(_canon((k, a, succ[k]), code, memo)))
+        dfl = _canon(self.default_values, code, memo)
+        fp = _hash('Dispatcher', *sorted(items), dfl)
+        if token is not None:
+            self._cache[key] = token, fp
+        return fp
 
     def blue(self, memo=None, depth=-1):
         """
@@ -1583,7 +1957,9 @@ class Dispatcher(Base):
     def dispatch(self, inputs=None, outputs=None, inputs_dist=None,
                  wildcard=False, no_call=False, shrink=False,
                  rm_unused_nds=False, select_output_kw=None, _wait_in=None,
-                 stopper=None, executor=False, sol_name=(), verbose=False):
+                 stopper=None, executor=False, sol_name=(), verbose=False,
+                 checkpoint=None, memory_profile=False, deadline=None,
+                 lazy=False, trace=False, _stream=None):
         """
         Evaluates the minimum workflow and data outputs of the dispatcher
         model from given inputs.
@@ -1649,6 +2025,51 @@ class Dispatcher(Base):
             If you pass a function you can customize the log message.
         :type verbose: str, Callable, optional
 
+        :param checkpoint:
+            File name of the store where the node results are logged to resume
+            the dispatch or the kwargs of the checkpoint.
+
+            .. seealso:: :func:`resume`,
+               :func:`~schedula.utils.sol.Solution.checkpoint`
+        :type checkpoint: str, dict, optional
+
+        :param memory_profile:
+            If True the peak and net memory allocated by each node evaluation
+            (measured by :mod:`tracemalloc`, or the resident set size delta of
+            the worker for process executors) and the output size estimate are
+            recorded in the workflow node attributes `memory_peak`,
+            `memory_net`, and `memory_size` [bytes]. The sub-dispatch
+            functions are measured as a whole.
+
+            .. seealso:: :func:`~schedula.utils.sol.Solution.profile`
+        :type memory_profile: bool, optional
+
+        :param deadline:
+            Time budget [s] of the dispatch. When it is exhausted no new node
+            is evaluated and the partial solution is returned. The targets
+            not estimated are stored in the solution attribute `missed`.
+        :type deadline: int | float, optional
+
+        :param lazy:
+            If True the reachable data nodes are planned without calling the
+            functions and a :class:`~schedula.utils.sol.LazySolution` is
+            returned, whose values are computed on first access by dispatching
+            only their minimal upstream workflow. It cannot be combined with
+            `no_call`, `select_output_kw`, and `checkpoint`.
+        :type lazy: bool, optional
+
+        :param trace:
+            If True the timeline of the node evaluations (i.e., timestamps,
+            process, and thread) is recorded to be exported.
+
+            .. seealso:: :func:`~schedula.utils.sol.Solution.export_trace`
+        :type trace: bool, optional
+
+        :param _stream:
+            Function called with the path and the value (or future) of the
+            estimated data nodes.
+        :type _stream: callable, optional
+
         :return:
             Dictionary of estimated data node outputs.
         :rtype: schedula.utils.sol.Solution
@@ -1715,6 +2136,27 @@ class Dispatcher(Base):
             Solution({'a': 3, 'b': 5, 'd': 1, 'c': 3})
         """
 
+        if lazy:
+            from .utils.sol import LazySolution
+            unsupported = {
+                'select_output_kw': select_output_kw,
+                'checkpoint': checkpoint, 'no_call': no_call,
+                '_stream': _stream
+            }
+            unsupported = sorted(k for k, v in unsupported.items() if v)
+            if unsupported:
+                raise ValueError(
+                    'Options not supported with `lazy=True`: %s.' %
+                    ', '.join(unsupported)
+                )
+            return LazySolution(
+                self, inputs, outputs, inputs_dist=inputs_dist,
+                wildcard=wildcard, shrink=shrink, rm_unused_nds=rm_unused_nds,
+                _wait_in=_wait_in, stopper=stopper, executor=executor,
+                sol_name=sol_name, verbose=verbose,
+                memory_profile=memory_profile, deadline=deadline, trace=trace
+            )
+
         dsp = self
 
         if not no_call:
@@ -1731,9 +2173,32 @@ class Dispatcher(Base):
             dsp, inputs, outputs, wildcard, inputs_dist, no_call, rm_unused_nds,
             _wait_in, full_name=sol_name, verbose=verbose
         )
+        if memory_profile:
+            sol.memory_profile = True
+        if trace:
+            sol.trace = True
+        if deadline is not None:
+            sol.deadline = time.time() + deadline
+        if _stream is not None:
+            sol._stream = _stream
+
+        if checkpoint is not None:  # Log the node results.
+            if not isinstance(checkpoint, dict):
+                checkpoint = {'path': checkpoint}
+            sol.checkpoint(_dispatch={
+                'inputs': inputs, 'outputs': outputs, 'inputs_dist': inputs_dist,
+                'wildcard': wildcard, 'no_call': no_call, 'shrink': shrink,
+                'rm_unused_nds': rm_unused_nds,
+                'select_output_kw': select_output_kw, '_wait_in': _wait_in,
+                'sol_name': sol_name
+            }, **checkpoint)
 
         # Dispatch.
-        sol._run(stopper=stopper, executor=executor)
+        try:
+            sol._run(stopper=stopper, executor=executor)
+        finally:
+            if sol._checkpoint is not None:
+                sol._checkpoint.flush()
 
         if select_output_kw:
             return selector(dictionary=sol, **select_output_kw)
@@ -1744,6 +2209,119 @@ class Dispatcher(Base):
     def __call__(self, *args, **kwargs):
         return self.dispatch(*args, **kwargs)
 
+    def dispatch_iter(self, *args, **kwargs):
+        """
+        Evaluates the dispatch in background and yields the data node values
+        as soon as they are estimated.
+
+        :param args:
+            Positional arguments of :func:`dispatch`.
+        :type args: tuple
+
+        :param kwargs:
+            Keyword arguments of :func:`dispatch`. The `stopper` (a new one if
+            not given) is set to abort the dispatch when the stream is closed.
+        :type kwargs: dict
+
+        :return:
+            An iterator (and asynchronous iterator) of `(node_path, value)`.
+        :rtype: schedula.utils.stream.DispatchStream
+
+        Example::
+
+            >>> dsp = Dispatcher()
+            >>> sub_dsp = Dispatcher()
+            >>> sub_dsp.add_func(lambda x: x * 2, ['y'])
+            '<lambda>'
+            >>> dsp.add_dispatcher(sub_dsp, {'a': 'x'}, {'y': 'b'}, 'sub')
+            'sub'
+            >>> for path, value in dsp.dispatch_iter({'a': 1}):
+            ...     print(path, value)
+            ('a',) 1
+            ('sub', 'x') 1
+            ('sub', 'y') 2
+            ('b',) 2
+        """
+        import threading
+        from .utils.stream import DispatchStream
+        if kwargs.get('stopper') is None:
+            kwargs['stopper'] = threading.Event()
+        return DispatchStream(
+            lambda stream: self.dispatch(*args, _stream=stream, **kwargs),
+            kwargs['stopper']
+        )
+
+    def resume(self, path, nodes=1, seconds=None, stopper=None,
+               executor=False, verbose=False):
+        """
+        Resumes a dispatch from its checkpoint store.
+
+        The dispatch is repeated with the logged arguments. The logged node
+        results are used instead of calling the functions again (i.e., their
+        callbacks are not invoked), while the results of the remaining nodes
+        are appended to the store.
+
+        :param path:
+            File name of the checkpoint store.
+
+            .. seealso:: :func:`~schedula.utils.sol.Solution.checkpoint`
+        :type path: str
+
+        :param nodes:
+            Number of evaluated nodes between two writes.
+        :type nodes: int, optional
+
+        :param seconds:
+            Maximum number of seconds between two writes.
+        :type seconds: float, optional
+
+        :param stopper:
+            A semaphore to abort the dispatching.
+        :type stopper: multiprocess.Event, optional
+
+        :param executor:
+            A pool executor id to dispatch asynchronously or in parallel.
+        :type executor: str, optional
+
+        :param verbose:
+            If True the dispatcher will log start and end of each function.
+        :type verbose: str, Callable, optional
+
+        :return:
+            Dictionary of estimated data node outputs.
+        :rtype: schedula.utils.sol.Solution
+
+        Example:
+
+        .. testsetup::
+            >>> import os
+            >>> from tempfile import mkstemp
+            >>> fd, path = mkstemp()
+            >>> os.close(fd)
+
+            >>> calls = []
+            >>> def f(a):
+            ...     calls.append(a)
+            ...     return a + 1
+            >>> dsp = Dispatcher()
+            >>> dsp.add_func(f, ['b'])
+            'f'
+            >>> dsp.add_function('g', lambda b: b * 2, ['b'], ['c'])
+            'g'
+            >>> sol = dsp.dispatch({'a': 1}, outputs=['b'], checkpoint=path)
+            >>> dsp.resume(path), calls
+            (Solution({'a': 1, 'b': 2}), [1])
+
+        .. testcleanup::
+            >>> os.remove(path)
+        """
+        from .utils.io.ckpt import Checkpoint
+        ckpt = Checkpoint.open(path, nodes, seconds)
+        return self.dispatch(
+            stopper=stopper, executor=executor, verbose=verbose,
+            checkpoint=ckpt, **ckpt.header['dispatch']
+        )
+
     def shrink_dsp(self, inputs=None, outputs=None, inputs_dist=None,
                    wildcard=True):
         """
@@ -1828,8 +2406,51 @@ class Dispatcher(Base):
            :opt: graph_attr={'ratio': '1'}
 
             >>> shrink_dsp.name = 'Sub-Dispatcher'
+
+        The result is memoized per `(inputs, outputs, inputs_dist, wildcard)`
+        until the :attr:`version` of the dispatcher changes::
+
+            >>> sub = dsp.shrink_dsp(inputs=['a', 'b', 'd'], outputs=['c', 'f'])
+            >>> sub.dmap is shrink_dsp.dmap, len(dsp._cache['shrink_dsp'][1])
+            (False, 1)
+            >>> dsp.add_data('a', default_value=1)
+            'a'
+            >>> dsp._cache['shrink_dsp'][0] == dsp.version
+            False
+
+        .. note::
+            Changes made directly on `default_values` or on the `dmap` of a
+            sub-dispatcher do not change the version, call `dsp._bump()` after
+            them.
         """
+        try:
+            key = tuple(
+                v if v is None else tuple(v) for v in (inputs, outputs)
+            )
+            key += (inputs_dist and tuple(inputs_dist.items()), wildcard)
+            hash(key)
+        except TypeError:  # Unhashable arguments.
+            return self._shrink_dsp(inputs, outputs, inputs_dist, wildcard)
+
+        version, cache = self.version, self._cache.get('shrink_dsp')
+        if cache is None or cache[0] != version:
+            self._cache['shrink_dsp'] = cache = version, {}
+        cache = cache[1]
+        try:
+            dsp = cache[key] = cache.pop(key)  # Move to the end.
+        except KeyError:
+            dsp = cache[key] = self._shrink_dsp(
+                key[0], key[1], inputs_dist, wildcard
+            )
+            while len(cache) > self.shrink_cache_size:  # Drop the oldest.
+                cache.pop(next(iter(cache)))
+
+        return dsp.copy_structure(
+            dmap=dsp.dmap.copy(), default_values=dsp.default_values.copy()
+        )
 
+    def _shrink_dsp(self, inputs=None, outputs=None, inputs_dist=None,
+                    wildcard=True):
         bfs = None
         if inputs:
             # Get all data nodes no wait inputs.
@@ -1926,6 +2547,8 @@ class Dispatcher(Base):
             i, o = _update_io(a, pred[n], succ[n])  # Unreachable nodes.
             rm_edges({(u, n) for u in i}.union(((n, u) for u in o)))
 
+        dsp.dmap._bump()  # Sub-dispatcher nodes have been replaced.
+        dsp._link_sub_dsps()
         return dsp
 
     @staticmethod
@@ -45,11 +45,15 @@ Sub-Modules:
     dsp
     exc
     form
+    frozen
     gen
     graph
+    hook
     imp
     io
+    prf
     sol
+    stream
     utl
     web
 """
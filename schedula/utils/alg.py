@@ -11,7 +11,7 @@ It contains basic algorithms, numerical tricks, and data processing tasks.
 """
 
 import collections
-from .gen import counter
+from .gen import counter, Token
 from .cst import EMPTY, NONE
 from .dsp import SubDispatch, bypass, stlp, parent_func, NoSub, inf
 
@@ -112,6 +112,229 @@ def _add_edge_dmap_fun(graph, edges_weights=None):
     return add_edge  # Returns the function.
 
 
+def _records(records):
+    """
+    Returns the list of records of a list of records or of a dict of columns.
+
+    :param records:
+        List of records or dictionary of columns.
+    :type records: list[dict] | dict[str, list] | None
+
+    :return:
+        List of records.
+    :rtype: list[dict]
+    """
+    if not records:
+        return []
+    if isinstance(records, dict):
+        if len({len(v) for v in records.values()}) > 1:
+            raise ValueError('Invalid records: columns of different length.')
+        keys = list(records)
+        return [dict(zip(keys, v)) for v in zip(*records.values())]
+    return list(records)
+
+
+_DATA_KW = {
+    'data_id', 'default_value', 'initial_dist', 'wait_inputs', 'wildcard',
+    'function', 'callback', 'description', 'filters', 'await_result'
+}
+_FUN_KW = {
+    'function_id', 'function', 'inputs', 'outputs', 'input_domain', 'weight',
+    'inp_weight', 'out_weight', 'description', 'filters', 'await_domain',
+    'await_result', 'timeout'
+}
+
+
+def _add_records(dsp, data_records, fun_records, dsp_records=()):
+    """
+    Adds data, function, and sub-dispatcher records to the dispatcher map.
+
+    The sub-dispatchers are added (with :func:`add_dispatcher`) only if the
+    other records are valid. If some record is invalid, the dispatcher is
+    restored (i.e., nodes, default values, node index, and node id suffixes).
+
+    :param dsp:
+        A dispatcher that identifies the model adopted.
+    :type dsp: schedula.Dispatcher
+
+    :param data_records:
+        Data node kwargs.
+    :type data_records: list[dict]
+
+    :param fun_records:
+        Function node kwargs.
+    :type fun_records: list[dict]
+
+    :param dsp_records:
+        Sub-dispatcher node kwargs.
+    :type dsp_records: list[dict]
+
+    :return:
+        Data, function, and sub-dispatcher node ids, and errors of invalid
+        records.
+    :rtype: (list[str], list[str], list[str]), list[str]
+    """
+    from .cst import START, SINK, SELF, PLOT
+    from .blue import _init
+    from .gen import counter
+    from .utl import get_unused_node_id
+    if dsp.dmap._shared:
+        dsp.dmap._unshare()
+    dsp._own_default_values()
+    # Namespace shortcut for speed.
+    dmap, defaults = dsp.dmap, dsp.default_values
+    nodes, succ, pred = dmap.nodes, dmap.succ, dmap.pred
+    added, updated, errors, old_defaults = [], {}, [], defaults.copy()
+    data_ids, fun_ids, dsp_ids = [], [], []
+    # Snapshot of the node index and of the node id suffixes.
+    start = dsp.counter()
+    dsp.counter = index = counter(start)
+    suffixes = {k: [n, r[:]] for k, (n, r) in dmap._suffixes.items()}
+
+    def _add_node(n, attr):
+        if n in nodes:
+            if n not in updated:
+                updated[n] = nodes[n].copy()
+            dmap.add_node(n, **attr)
+        else:
+            nodes[n], succ[n], pred[n] = attr, {}, {}
+            added.append(n)
+
+    def _add_special(data_id, **kw):
+        if data_id not in nodes:
+            added.append(data_id)
+        elif data_id not in updated:
+            updated[data_id] = nodes[data_id].copy()
+        return dsp.add_data(data_id, **kw)
+
+    def _add_edge(u, v, w, k):
+        if v in succ[u]:
+            dmap.add_edge(u, v, **({'weight': w[k]} if w and k in w else {}))
+        elif w and k in w:
+            succ[u][v] = pred[v][u] = {'weight': w[k]}
+        else:
+            succ[u][v] = pred[v][u] = {}
+
+    for i, r in enumerate(data_records):
+        data_id = r.get('data_id')
+        if isinstance(data_id, Token) and data_id in (START, SINK, SELF, PLOT):
+            data_ids.append(_add_special(**r))
+            continue
+        attr = {
+            'type': 'data', 'wait_inputs': r.get('wait_inputs', False),
+            'index': (index(),)
+        }
+        for k in ('function', 'await_result', 'callback', 'wildcard',
+                  'description'):
+            if r.get(k) is not None:
+                attr[k] = r[k]
+        if r.get('filters'):
+            attr['filters'] = r['filters']
+        for k in r.keys() - _DATA_KW:  # Additional attributes.
+            attr[k] = r[k]
+
+        if data_id is None:
+            data_id = get_unused_node_id(dmap)
+        elif data_id in nodes and nodes[data_id]['type'] != 'data':
+            errors.append('data_records[%d]: Invalid data id: override '
+                          'function %s' % (i, data_id))
+            continue
+        _add_node(data_id, attr)
+        value = r.get('default_value', EMPTY)
+        if value is EMPTY:
+            defaults.pop(data_id, None)
+        else:
+            defaults[data_id] = {
+                'value': value, 'initial_dist': r.get('initial_dist', 0.0)
+            }
+        data_ids.append(data_id)
+
+    msg = 'fun_records[%d]: Invalid %sput id: %s is not a data node'
+    for i, r in enumerate(fun_records):
+        function = _init(r.get('function'))
+        inputs, outputs = r.get('inputs'), r.get('outputs')
+        if inputs is None:
+            if START not in nodes:
+                _add_special(START)
+            inputs = [START]
+        if outputs is None:
+            if SINK not in nodes:
+                _add_special(SINK)
+            outputs = [SINK]
+
+        function_id = r.get('function_id')
+        if function_id is None:
+            func = parent_func(function)
+            try:
+                function_id = func.__name__
+            except AttributeError as ex:
+                if not func:
+                    errors.append('fun_records[%d]: Invalid function id due '
+                                  'to: %s' % (i, ex))
+                    continue
+                function_id = 'unknown'
+        fun_id = get_unused_node_id(dmap, initial_guess=function_id)
+
+        err = [msg % (i, k, u) for k, b in (('in', inputs), ('out', outputs))
+               for u in b if u == fun_id or (
+                       u in nodes and nodes[u]['type'] != 'data')]
+        if err:
+            errors.extend(err)
+            continue
+
+        attr = {
+            'type': 'function', 'inputs': inputs, 'outputs': outputs,
+            'function': function, 'wait_inputs': True, 'index': (index(),)
+        }
+        if r.get('input_domain'):
+            attr['input_domain'] = r['input_domain']
+        for k in ('await_domain', 'await_result', 'description', 'timeout'):
+            if r.get(k) is not None:
+                attr[k] = r[k]
+        if r.get('filters'):
+            attr['filters'] = r['filters']
+
+        if r.get('weight') is not None:
+            attr['weight'] = r['weight']
+        for k in r.keys() - _FUN_KW:  # Additional attributes.
+            attr[k] = r[k]
+        _add_node(fun_id, attr)
+
+        for inp, io, w in ((True, inputs, r.get('inp_weight')),
+                           (False, outputs, r.get('out_weight'))):
+            for u in io:
+                if u not in nodes:
+                    _add_node(u, {
+                        'type': 'data', 'wait_inputs': False,
+                        'index': (index(),)
+                    })
+                edge = (u, fun_id) if inp else (fun_id, u)
+                _add_edge(*edge, w, u)
+        fun_ids.append(fun_id)
+
+    if not errors and dsp_records:
+        n = len(nodes)  # New nodes are appended to the dispatcher map.
+        for i, r in enumerate(dsp_records):
+            try:
+                dsp_ids.append(dsp.add_dispatcher(**r))
+            except Exception as ex:
+                errors.append('dsp_records[%d]: %s' % (i, ex))
+                added.extend(list(nodes)[n:])
+                break
+
+    if errors:  # Restore the dispatcher.
+        dmap.remove_nodes_from(reversed(added))
+        for k, v in updated.items():
+            if k in nodes:
+                nodes[k] = v
+        defaults.clear()
+        defaults.update(old_defaults)
+        dsp.counter = counter(start)
+        dmap._suffixes = suffixes
+
+    return (data_ids, fun_ids, dsp_ids), errors
+
+
 def _get_node(nodes, node_id, fuzzy=True):
     """
     Returns a dispatcher node that match the given node id.
@@ -20,8 +20,12 @@ Sub-Modules:
     executors
     factory
 """
+import time
+import functools
 from ..imp import Future
 from ..cst import EMPTY
+from ..gen import LazyValue
+from ..hook import HOOKS, fire
 from .factory import ExecutorFactory
 from ..exc import DispatcherError, DispatcherAbort
 from ..dsp import parent_func, SubDispatch, NoSub, run_model
@@ -137,9 +141,38 @@ def shutdown_executors(wait=True, executors=None):
     return shutdown_executor(wait=wait, executors=executors)
 
 
+def load_lazy(args):
+    """
+    Materializes the lazy values of a list of arguments.
+
+    :param args:
+        Function arguments.
+    :type args: list | tuple
+
+    :return:
+        Function arguments without lazy values.
+    :rtype: list | tuple
+
+    Example::
+
+        >>> class One(LazyValue):
+        ...     def load(self):
+        ...         return 1
+        >>> load_lazy((One(), 2))
+        [1, 2]
+    """
+    if any(isinstance(v, LazyValue) for v in args):
+        return [v.load() if isinstance(v, LazyValue) else v for v in args]
+    return args
+
+
+def _call_lazy(fn, *args, **kw):
+    return fn(*load_lazy(args), **kw)
+
+
 def _process_funcs(
         exe_id, funcs, executor, *args, stopper=None, sol_name=None,
-        verbose=False, **kw):
+        verbose=False, timeout=None, trace=False, **kw):
     from ...dispatcher import Dispatcher
     res = []
     sid = exe_id[-1]
@@ -156,10 +189,12 @@ def _process_funcs(
             try:
                 if isinstance(pfunc, Dispatcher):
                     r['res'] = fn(*args, stopper=stopper, executor=executor,
-                                  sol_name=sol_name, verbose=verbose, **kw)
+                                  sol_name=sol_name, verbose=verbose,
+                                  trace=trace, **kw)
                 else:
                     r['res'] = fn(*args, _stopper=stopper, _executor=executor,
-                                  _sol_name=sol_name, _verbose=verbose, **kw)
+                                  _sol_name=sol_name, _verbose=verbose,
+                                  _trace=trace, **kw)
             except DispatcherError as ex:
                 if isinstance(pfunc, NoSub):
                     raise ex
@@ -167,8 +202,13 @@ def _process_funcs(
             if not isinstance(pfunc, NoSub):
                 r['sol'] = pfunc.solution
         else:
+            if any(isinstance(v, LazyValue) for v in args):
+                fn = functools.partial(_call_lazy, fn)
             e = EXECUTORS.get_executor(exe_id)
-            r['res'] = e.process(sid, fn, *args, **kw) if e else fn(*args, **kw)
+            if e:
+                r['res'] = e.process(sid, fn, *args, _timeout=timeout, **kw)
+            else:
+                r['res'] = fn(*args, **kw)
         res_append(r)
         if 'err' in r:
             break
@@ -247,6 +287,19 @@ def _await_result(result, timeout, sol, node_id):
         raise SkipNode(ex=ex)
 
 
+def _set_timeout(fut, timeout):
+    import threading
+    from ..exc import SkipNode
+    from .executors import _safe_set_exception
+    ex = TimeoutError('Execution exceeded the timeout of %s sec.' % timeout)
+    timer = threading.Timer(
+        timeout, _safe_set_exception, (fut, SkipNode(ex=ex))
+    )
+    timer.daemon = True
+    timer.start()
+    fut.add_done_callback(lambda f: timer.cancel())
+
+
 def async_thread(sol, args, node_attr, node_id, *a, **kw):
     """
     Execute `sol._evaluate_node` in an asynchronous thread.
@@ -292,10 +345,24 @@ def async_thread(sol, args, node_attr, node_id, *a, **kw):
         futures = args[0].values()
     futures = {v for v in futures if isinstance(v, Future)}
 
+    max_time = node_attr.get('timeout')
+
     def _submit():
-        return EXECUTORS.get_executor(exe_id).thread(
+        sol.workflow.nodes[node_id]['queued'] = time.time()
+        fut = EXECUTORS.get_executor(exe_id).thread(
             sid, _async_eval, sol, args, node_attr, node_id, *a, **kw
         )
+        if max_time is not None:  # The thread is left running.
+            _set_timeout(fut, max_time)
+        if HOOKS:
+            fire('submit', sol, node_id, executor=name)
+
+            def _complete(f):
+                fire('complete', sol, node_id, executor=name,
+                     error=f.exception())
+
+            fut.add_done_callback(_complete)
+        return fut
 
     if futures:  # Chain results.
         result = executor.add_future(sid, Future())
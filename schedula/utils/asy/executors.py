@@ -9,8 +9,10 @@
 """
 It defines the executors classes.
 """
+import os
 import time
 import functools
+import threading
 from ..cst import EMPTY
 from . import _process_funcs
 from ..exc import ExecutorShutdown
@@ -18,6 +20,32 @@ from ..imp import Future, finalize, Error, Lock
 from ..dsp import parent_func, SubDispatch, NoSub, get_nested_dicts
 
 
+_worker = threading.local()
+
+
+def _run_traced(fn, *args, **kwargs):
+    from ..prf import rss
+    m0, t0 = rss(), time.perf_counter_ns()
+    res = fn(*args, **kwargs)
+    t1, m1 = time.perf_counter_ns(), rss()
+    m = None if m0 is None or m1 is None else m1 - m0
+    return res, (os.getpid(), threading.get_ident(), t0, t1, m)
+
+
+def pop_worker():
+    """
+    Returns and clears the process info of the last function executed by
+    :func:`PoolExecutor.process` in the current thread.
+
+    :return:
+        Process id, thread id, start and end times [ns] of the function, and
+        resident set size delta [bytes] of the process (None if unknown).
+    :rtype: tuple[int] | None
+    """
+    worker, _worker.info = getattr(_worker, 'info', None), None
+    return worker
+
+
 def _safe_set_result(fut, value):
     try:
         not fut.done() and fut.set_result(value)
@@ -43,7 +71,7 @@ class Executor:
         return self.__class__, ()
 
     def _set_future(self, fut, res):
-        self.tasks.pop(fut)
+        self.tasks.pop(fut, None)
         if 'err' in res:
             _safe_set_exception(fut, res['err'])
         else:
@@ -80,6 +108,24 @@ class Executor:
                 raise ValueError('Task could not terminate!')
         return tasks
 
+    def cancel(self, fut, ex):
+        """
+        Sets the exception of a task future and terminates its worker process
+        (if any).
+
+        :param fut:
+            Task future.
+        :type fut: concurrent.futures.Future
+
+        :param ex:
+            Exception to be set.
+        :type ex: BaseException
+        """
+        task = self.tasks.get(fut)
+        _safe_set_exception(fut, ex)
+        self.tasks.pop(fut, None)
+        hasattr(task, 'terminate') and task.terminate()
+
     def submit(self, func, *args, **kwargs):
         fut, send = Future(), lambda res: self._set_future(fut, res)
         self.tasks[fut] = None
@@ -117,7 +163,20 @@ class ProcessExecutor(Executor):
             target=self._target, args=(c1.send, func, args, kwargs)
         )
         task.start()
-        return self._set_future(fut, c0.recv())
+        c1.close()
+
+        def _recv():
+            try:
+                self._set_future(fut, c0.recv())
+            except EOFError:  # Terminated task.
+                self.cancel(fut, ExecutorShutdown())
+            finally:
+                c0.close()
+
+        reader = threading.Thread(target=_recv)
+        reader.daemon = True
+        reader.start()
+        return fut
 
     def __reduce__(self):
         return self.__class__, (), {
@@ -230,14 +289,29 @@ class PoolExecutor:
         if self._parallel is not False and not_sub or self._parallel:
             sid = exe_id[-1]
             exe_id = False, sid
-            return self.process(sid, _process_funcs, exe_id, funcs, *args, **kw)
+            timeout = kw.pop('timeout', None)
+            return self.process(
+                sid, _process_funcs, exe_id, funcs, *args, _timeout=timeout,
+                **kw
+            )
         return _process_funcs(exe_id, funcs, *args, **kw)
 
-    def process(self, sol_id, fn, *args, **kwargs):
+    def process(self, sol_id, fn, *args, _timeout=None, **kwargs):
         if self._running:
             if self._process:
-                fut = self._process.submit(fn, *args, **kwargs)
-                return self.add_future(sol_id, fut).result()
+                fut = self._process.submit(_run_traced, fn, *args, **kwargs)
+                self.add_future(sol_id, fut)
+                if _timeout is not None:
+                    from concurrent.futures import wait as _wait_fut
+                    if not _wait_fut([fut], _timeout).done:
+                        ex = TimeoutError(
+                            'Execution exceeded the timeout of %s sec.' %
+                            _timeout
+                        )
+                        self._process.cancel(fut, ex)
+                        raise ex
+                res, _worker.info = fut.result()
+                return res
             return fn(*args, **kwargs)
         raise ExecutorShutdown
 
@@ -52,7 +52,8 @@ class Base(_Base):
         return result
 
     def web(self, depth=-1, node_data=NONE, node_function=NONE, directory=None,
-            sites=None, run=True, subsite_idle_timeout=600, debug=False):
+            sites=None, run=True, subsite_idle_timeout=600, debug=False,
+            metrics=None):
         """
         Creates a dispatcher Flask app.
 
@@ -89,6 +90,11 @@ class Base(_Base):
             Enable debug chart backend server?
         :type subsite_idle_timeout: bool, optional
 
+        :param metrics:
+            Metrics collector to expose in Prometheus text format on
+            `/metrics`.
+        :type metrics: ~schedula.utils.hook.MetricsCollector, optional
+
         :return:
             A WebMap.
         :rtype: ~schedula.utils.web.WebMap
@@ -135,6 +141,7 @@ class Base(_Base):
         webmap.add_items(obj, workflow=False, depth=depth, **options)
         webmap.directory = directory
         webmap.idle_timeout = subsite_idle_timeout
+        webmap.metrics = metrics
         if sites is not None:
             sites.add(webmap.site(view=run, debug=debug))
         elif run:
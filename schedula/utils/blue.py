@@ -13,14 +13,16 @@ from .cst import EMPTY
 from .base import _Base
 from ..dispatcher import Dispatcher
 
-def _init(obj, memo=None):
-    return obj.register(memo=memo) if isinstance(obj, Blueprint) else obj
+def _init(obj, memo=None, copy=False):
+    if isinstance(obj, Blueprint):
+        return obj.register(memo=memo, copy=copy)
+    return obj
 
 
-def _safe_call(fn, *args, memo=None, **kwargs):
+def _safe_call(fn, *args, memo=None, _copy=False, **kwargs):
     return fn(
-        *(_init(a, memo) for a in args),
-        **{k: _init(v, memo=memo) for k, v in kwargs.items()}
+        *(_init(a, memo, _copy) for a in args),
+        **{k: _init(v, memo, _copy) for k, v in kwargs.items()}
     )
 
 
@@ -42,7 +44,7 @@ class Blueprint(_Base):
         self.cls = cls
         return self
 
-    def register(self, obj=None, memo=None):
+    def register(self, obj=None, memo=None, copy=False):
         """
         Creates a :class:`Blueprint.cls` and calls each deferred operation.
 
@@ -54,6 +56,14 @@ class Blueprint(_Base):
             A dictionary to cache registered Blueprints.
         :type memo: dict[Blueprint,T]
 
+        :param copy:
+            If 'cow', the first registration is cached as template and a
+            copy-on-write copy of it is returned (see
+            :func:`~schedula.dispatcher.Dispatcher.copy`). The template is
+            rebuilt when the Blueprint or one of its nested Blueprints is
+            extended. It applies to Dispatcher and SubDispatch Blueprints.
+        :type copy: bool | str
+
         :return:
             The initialized object.
         :rtype: Blueprint.cls | Blueprint
@@ -66,22 +76,71 @@ class Blueprint(_Base):
             >>> blue = sh.BlueDispatcher().add_func(len, ['length'])
             >>> blue.register()
             <schedula.dispatcher.Dispatcher object at ...>
+
+        Register a copy-on-write copy of the cached template::
+
+            >>> dsp = blue.register(copy='cow')
+            >>> dsp.nodes is blue.register(copy='cow').nodes
+            True
+            >>> blue.add_func(callable, ['is_callable'])
+            <schedula.utils.blue.BlueDispatcher object at ...>
+            >>> sorted(blue.register(copy='cow').data_nodes)
+            ['is_callable', 'length', 'obj']
         """
         if memo and self in memo:
             obj = memo[self]
             if obj is not None:
                 return obj
-        if obj is None:
-            obj = _safe_call(self.cls, *self.args, memo=memo, **self.kwargs)
-
-        for method, kwargs in self.deferred:
-            _safe_call(getattr(obj, method), memo=memo, **kwargs)
+        if obj is None and copy == 'cow' and self._cow:
+            obj = self._get_template()._cow_copy({})
+        else:
+            obj = self._register(obj, memo, copy)
 
         if memo is not None:
             memo[self] = obj
 
         return obj
 
+    def _register(self, obj, memo, copy=False):
+        if obj is None:
+            obj = _safe_call(
+                self.cls, *self.args, memo=memo, _copy=copy, **self.kwargs
+            )
+
+        for method, kwargs in self.deferred:
+            _safe_call(getattr(obj, method), memo=memo, _copy=copy, **kwargs)
+        return obj
+
+    @property
+    def _cow(self):
+        from .dsp import SubDispatch
+        cls = self.cls
+        return isinstance(cls, type) and issubclass(
+            cls, (Dispatcher, SubDispatch)
+        )
+
+    def _is_registered(self):
+        # Checks that no Blueprint has been extended after the registration.
+        tpl = self.__dict__.get('_template')
+        return tpl is not None and all(
+            len(b.deferred) == n and (
+                b is self or '_template' not in b.__dict__ or
+                b._is_registered()
+            ) for b, n in tpl[0]
+        )
+
+    def _get_template(self):
+        """
+        Returns the cached registered object, rebuilding it if the Blueprint
+        or one of its nested Blueprints has been extended.
+        """
+        if not self._is_registered():
+            memo = {}
+            obj = self._register(None, memo, 'cow')
+            deps = [(b, len(b.deferred)) for b in memo]
+            self._template = [(self, len(self.deferred))] + deps, obj
+        return self._template[1]
+
     def extend(self, *blues, memo=None):
         """
         Extends deferred operations calling each operation of given Blueprints.
@@ -120,7 +179,7 @@ class Blueprint(_Base):
 
     def __call__(self, *args, **kwargs):
         """Calls the registered Blueprint."""
-        return self.register(memo={})(*args, **kwargs)
+        return self.register(memo={}, copy='cow')(*args, **kwargs)
 
 
 def _parent_blue(func, memo=None, depth=-1):
@@ -300,7 +359,7 @@ class BlueDispatcher(Blueprint):
                      outputs=None, input_domain=None, weight=None,
                      inp_weight=None, out_weight=None, description=None,
                      filters=None, await_domain=None, await_result=None,
-                     **kwargs):
+                     timeout=None, **kwargs):
         """
         Add a single function node to dispatcher.
 
@@ -368,6 +427,13 @@ class BlueDispatcher(Blueprint):
             asynchronous or parallel execution is enable.
         :type await_result: bool|int|float, optional
 
+        :param timeout:
+            Maximum execution time [s] of the function. When it is exceeded the
+            node fails with a `TimeoutError`, the worker process is terminated
+            (a worker thread is left running). Note this is used when
+            asynchronous or parallel execution is enable.
+        :type timeout: int|float, optional
+
         :param kwargs:
             Set additional node attributes using key=value.
         :type kwargs: keyword arguments, optional
@@ -377,7 +443,7 @@ class BlueDispatcher(Blueprint):
             'weight': weight, 'input_domain': input_domain, 'filters': filters,
             'await_result': await_result, 'await_domain': await_domain,
             'out_weight': out_weight, 'description': description,
-            'outputs': outputs, 'inp_weight': inp_weight
+            'outputs': outputs, 'inp_weight': inp_weight, 'timeout': timeout
         })
         self.deferred.append(('add_function', kwargs))
         return self
@@ -386,7 +452,7 @@ class BlueDispatcher(Blueprint):
                  inputs_defaults=False, filters=None, input_domain=None,
                  await_domain=None, await_result=None, inp_weight=None,
                  out_weight=None, description=None, inputs=None,
-                 function_id=None, **kwargs):
+                 function_id=None, timeout=None, **kwargs):
         """
         Add a single function node to dispatcher.
 
@@ -463,6 +529,13 @@ class BlueDispatcher(Blueprint):
             asynchronous or parallel execution is enable.
         :type await_result: bool|int|float, optional
 
+        :param timeout:
+            Maximum execution time [s] of the function. When it is exceeded the
+            node fails with a `TimeoutError`, the worker process is terminated
+            (a worker thread is left running). Note this is used when
+            asynchronous or parallel execution is enable.
+        :type timeout: int|float, optional
+
         :param kwargs:
             Set additional node attributes using key=value.
         :type kwargs: keyword arguments, optional
@@ -477,7 +550,7 @@ class BlueDispatcher(Blueprint):
             'inputs_kwargs': inputs_kwargs, 'inputs_defaults': inputs_defaults,
             'await_result': await_result, 'await_domain': await_domain,
             'out_weight': out_weight, 'description': description,
-            'outputs': outputs, 'inp_weight': inp_weight
+            'outputs': outputs, 'inp_weight': inp_weight, 'timeout': timeout
         })
         self.deferred.append(('add_func', kwargs))
         return self
@@ -603,6 +676,37 @@ class BlueDispatcher(Blueprint):
         self.deferred.append(('add_from_lists', kwargs))
         return self
 
+    def add_from_records(self, data_records=None, fun_records=None,
+                         dsp_records=None):
+        """
+        Add multiple data, function, and sub-dispatcher nodes in bulk.
+
+        :param data_records:
+            Data node kwargs as a list of records or as a dictionary of
+            columns.
+        :type data_records: list[dict] | dict[str, list], optional
+
+        :param fun_records:
+            Function node kwargs as a list of records or as a dictionary of
+            columns.
+        :type fun_records: list[dict] | dict[str, list], optional
+
+        :param dsp_records:
+            Sub-dispatcher node kwargs as a list of records or as a dictionary
+            of columns.
+        :type dsp_records: list[dict] | dict[str, list], optional
+
+        :return:
+            Self.
+        :rtype: BlueDispatcher
+        """
+        kwargs = {
+            'data_records': data_records, 'fun_records': fun_records,
+            'dsp_records': dsp_records
+        }
+        self.deferred.append(('add_from_records', kwargs))
+        return self
+
     def set_default_value(self, data_id, value=EMPTY, initial_dist=0.0):
         """
         Set the default value of a data node in the dispatcher.
@@ -25,7 +25,6 @@ import glob
 import copy
 import time
 import html
-import regex
 import socket
 import pprint
 import string
@@ -43,14 +42,6 @@ import threading
 import collections
 import os.path as osp
 import urllib.parse as urlparse
-
-try:
-    from jinja2 import Environment, PackageLoader
-    from pygments import highlight
-    from pygments.lexers import Python3Lexer
-    from pygments.formatters import HtmlFormatter
-except ModuleNotFoundError:
-    pass
 from ..cst import START, SINK, END, EMPTY, SELF, NONE, PLOT
 from ..dsp import (
     SubDispatch, combine_dicts, map_dict, combine_nested_dicts, selector, stlp,
@@ -115,6 +106,7 @@ def autoplot_callback(res):
 
 
 def jinja2_format(source, context=None, **kw):
+    from jinja2 import Environment
     return Environment(**kw, autoescape=True).from_string(source).render(
         context or {}
     )
@@ -237,6 +229,9 @@ class SiteNode:
         return self.title
 
     def render(self, *args, **kwargs):
+        from pygments import highlight
+        from pygments.lexers import Python3Lexer
+        from pygments.formatters import HtmlFormatter
         code = render_output(self.item, self.pprint.pformat)
         formatter = HtmlFormatter(noclasses=True)
         formatter.style.background_color = 'transparent'
@@ -261,6 +256,7 @@ class SiteNode:
 
 @functools.lru_cache(128)
 def get_match_func(expr):
+    import regex
     return regex.compile(expr).match
 
 
@@ -437,7 +433,14 @@ class FolderNode:
             )[0]
         except (AttributeError, KeyError):
             tooltip = None
-        yield 'tooltip', '"%s"' % (tooltip or self.title).replace('"', "'")
+        tooltip = tooltip or self.title
+        memory = [
+            '%s: %d B' % (k, self.attr['memory_%s' % k])
+            for k in ('peak', 'net', 'size') if 'memory_%s' % k in self.attr
+        ]
+        if memory:  # Recorded by `dispatch(memory_profile=True)`.
+            tooltip = '%s\nmemory %s' % (tooltip, ', '.join(memory))
+        yield 'tooltip', '"%s"' % tooltip.replace('"', "'")
 
     def _wait_inputs(self):
         attr = self.attr
@@ -707,6 +710,7 @@ class FolderNode:
 
 
 def _format_output(obj, **kwargs):
+    from jinja2 import PackageLoader
     fpath = osp.join(pkg_dir, 'templates', 'render.html')
     with open(fpath) as template:
         return jinja2_format(
@@ -1320,6 +1324,7 @@ class SiteIndex(SiteNode):
         )
 
     def render(self, context, *args, **kwargs):
+        from jinja2 import PackageLoader
         fpath = osp.join(pkg_dir, 'templates', 'index.html')
 
         with open(fpath) as template:
@@ -1859,5 +1864,6 @@ def _compile_subs(o, n):
 
 
 def _sub(old, new):
+    import regex
     p, repl = r'(href\s*=\s*"[^"]*)(/%s)((.|/)[^"]*")' % old, r'\1/%s\3' % new
     return functools.partial(regex.compile(p, regex.IGNORECASE).sub, repl)
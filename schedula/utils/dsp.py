@@ -20,6 +20,8 @@ from .cst import START
 from .gen import Token
 from .base import Base
 from .exc import DispatcherError
+from .hook import HOOKS, fire
+from .imp import ref as _weakref
 from dataclasses import dataclass
 
 __author__ = 'Vincenzo Arcidiacono <vinci1it2000@gmail.com>'
@@ -475,22 +477,259 @@ class add_args:
         return res
 
 
+def _signature_token(func):
+    """
+    Returns the objects whose identities identify the signature of a function.
+    """
+    if isinstance(func, partial):
+        kw = func.keywords or {}
+        return (func.func, func.args, *kw, *kw.values()) + _signature_token(
+            func.func
+        )
+    sig = getattr(func, '__signature__', None)
+    if sig is not None:  # E.g., `add_args` and `SubDispatchFunction`.
+        return sig,
+    try:
+        return func.__code__, func.__defaults__, func.__kwdefaults__
+    except AttributeError:
+        return ()
+
+
+#: Parsed signatures per callable id: (weak reference, token, {n: signature}).
+_signatures = {}
+
+
+def _del_signature(key, ref):
+    if _signatures.get(key, (None,))[0] is ref:
+        del _signatures[key]
+
+
+def _signature_cache(func):
+    """
+    Returns the cache of the parsed signatures of a function.
+
+    The cache is dropped when the function is garbage collected or when its
+    signature token (see :func:`_signature_token`) changes.
+    """
+    key, token = id(func), _signature_token(func)
+    entry = _signatures.get(key)
+    if entry and entry[0]() is func:
+        if len(entry[1]) == len(token) and all(
+                a is b for a, b in zip(entry[1], token)):
+            return entry[2]
+        ref = entry[0]
+    else:
+        try:
+            ref = _weakref(func, functools.partial(_del_signature, key))
+        except TypeError:  # Not weak referenceable.
+            return {}
+    _signatures[key] = ref, token, {}
+    return _signatures[key][2]
+
+
 def _get_signature(func, n=1):
-    import inspect
-    sig = inspect.signature(func)  # Get function signature.
+    cache = _signature_cache(func)
+    try:
+        return cache[n]
+    except KeyError:
+        pass
+
+    orig = inspect.signature(func)  # Get function signature.
 
     def ept_par():  # Return none signature parameter.
         name = Token('none')
         return name, inspect.Parameter(name, inspect._POSITIONAL_OR_KEYWORD)
 
-    # Update signature parameters.
+    # Build a new signature, the original could be cached (e.g., `add_args`).
+    sig = inspect.Signature(
+        return_annotation=orig.return_annotation, __validate_parameters__=False
+    )
     par = itertools.chain(*([p() for p in itertools.repeat(ept_par, n)],
-                            sig.parameters.items()))
-    sig._parameters = sig._parameters.__class__(collections.OrderedDict(par))
-
+                            orig.parameters.items()))
+    sig._parameters = orig._parameters.__class__(collections.OrderedDict(par))
+    cache[n] = sig
     return sig
 
 
+class vectorized:
+    """
+    Executes a function over column arrays (i.e., one row per evaluation).
+
+    If the function is not vectorizable, it is invoked row by row and the
+    results are stacked into arrays. Rows that are masked in the inputs or that
+    do not satisfy the `domain` are masked in the outputs.
+
+    :param func:
+        Function to wrap.
+    :type func: callable
+
+    :param n_out:
+        Number of function outputs.
+    :type n_out: int
+
+    :param domain:
+        A function that checks if input values satisfy the function domain.
+    :type domain: callable, optional
+
+    :param row_wise:
+        If True the function (and its domain) is invoked row by row.
+    :type row_wise: bool
+
+    :return:
+        Wrapped function.
+    :rtype: callable
+
+    Example::
+
+        >>> import numpy as np
+        >>> from math import log
+        >>> func = vectorized(log, domain=lambda x: x > 0, row_wise=True)
+        >>> func.__name__
+        'log'
+        >>> func(np.array([1.0, -1.0, np.e]))
+        masked_array(data=[0.0, --, 1.0],
+                     mask=[False,  True, False],
+               fill_value=1e+20)
+        >>> func.any_row(np.array([-1.0, -2.0]))
+        False
+    """
+    __name__ = __doc__ = None
+    _args = ('func', 'n_out', 'domain', 'row_wise')
+
+    def __init__(self, func, n_out=1, domain=None, row_wise=False):
+        self.func = func
+        self.n_out = n_out
+        self.domain = domain
+        self.row_wise = row_wise
+        for i in range(2):
+            # noinspection PyBroadException
+            try:
+                self.__name__ = func.__name__
+                self.__doc__ = func.__doc__
+                break
+            except AttributeError:
+                func = parent_func(func)
+
+    @staticmethod
+    def _n_rows(args):
+        import numpy as np
+        n = {len(a) for a in args if np.ndim(a)}
+        if len(n) > 1:
+            raise ValueError('Column arrays with different lengths: %s' % n)
+        return n.pop() if n else None
+
+    @staticmethod
+    def _stack(results):
+        import numpy as np
+        if any(r is np.ma.masked for r in results):
+            return np.ma.array([
+                0 if r is np.ma.masked else r for r in results
+            ], mask=[r is np.ma.masked for r in results])
+        try:
+            return np.asarray(results)
+        except ValueError:  # Ragged results.
+            res = np.empty(len(results), dtype=object)
+            res[:] = results
+            return res
+
+    def _call_rows(self, func, args, n):
+        import numpy as np
+        args = [a if np.ndim(a) else itertools.repeat(a, n) for a in args]
+        res = [func(*a) for a in zip(*args)] if args else [func()] * n
+        if func is self.domain or self.n_out == 1:
+            return self._stack(res)
+        return tuple(self._stack(r) for r in zip(*res))
+
+    def _call(self, func, args, n):
+        if self.row_wise:
+            return self._call_rows(func, args, n)
+        return func(*args)
+
+    def _mask(self, args, n):
+        import numpy as np
+        mask = np.ones(n, dtype=bool)
+        for a in args:
+            if np.ndim(a) and np.ma.isMaskedArray(a):
+                m = np.ma.getmaskarray(a)
+                mask &= ~m.reshape(n, -1).any(1)
+        if self.domain is not None and mask.any():
+            dom = self._call(self.domain, self._take(args, mask), mask.sum())
+            mask[mask] = np.ma.filled(np.asarray(dom, dtype=bool), False)
+        return mask
+
+    @staticmethod
+    def _take(args, mask):
+        import numpy as np
+        if mask.all():
+            return args
+        return [a[mask] if np.ndim(a) else a for a in args]
+
+    @staticmethod
+    def _scatter(res, mask):
+        import numpy as np
+        res = np.asanyarray(res)
+        if not res.ndim:
+            res = np.broadcast_to(res, (int(mask.sum()),))
+        out = np.ma.masked_all((len(mask),) + res.shape[1:], dtype=res.dtype)
+        out[mask] = res
+        return out
+
+    def any_row(self, *args):
+        """
+        Returns True if at least one row satisfies the function domain.
+        """
+        n = self._n_rows(args)
+        if n is None:
+            return bool(self.domain(*args))
+        return bool(self._mask(args, n).any())
+
+    def __call__(self, *args):
+        n = self._n_rows(args)
+        if n is None:  # Scalar inputs.
+            return self.func(*args)
+        mask = self._mask(args, n)
+        res = self._call(self.func, self._take(args, mask), int(mask.sum()))
+        if mask.all():
+            return res
+        if self.n_out > 1:
+            return tuple(self._scatter(r, mask) for r in res)
+        return self._scatter(res, mask)
+
+
+def _vectorize_dsp(dsp):
+    """
+    Returns a copy of the dispatcher that evaluates function nodes over column
+    arrays.
+
+    Function nodes tagged as `vectorizable` are invoked once with the column
+    arrays, the others row by row. Function `input_domain` are converted in
+    row masks.
+
+    :param dsp:
+        A dispatcher.
+    :type dsp: schedula.Dispatcher
+
+    :return:
+        Vectorized dispatcher.
+    :rtype: schedula.Dispatcher
+    """
+    dsp = dsp.copy_structure(
+        dmap=dsp.dmap.copy(), default_values=dsp.default_values.copy()
+    )
+    for k, a in dsp.nodes.items():
+        if a['type'] == 'dispatcher':
+            a['function'] = _vectorize_dsp(a['function'])
+        elif a['type'] == 'function' and a.get('function') is not None \
+                and not isinstance(a['function'], vectorized):
+            a['function'] = func = vectorized(
+                a['function'], len(a['outputs']), a.get('input_domain'),
+                not a.get('vectorizable', False)
+            )
+            if 'input_domain' in a:
+                a['input_domain'] = func.any_row
+    return dsp
+
+
 def stack_nested_keys(nested_dict, key=(), depth=-1):
     """
     Stacks the keys of nested-dictionaries into tuples and yields a list of
@@ -796,7 +1035,7 @@ class SubDispatch(Base):
         return memo[self]
 
     def __call__(self, *input_dicts, copy_input_dicts=False, _stopper=None,
-                 _executor=False, _sol_name=(), _verbose=False):
+                 _executor=False, _sol_name=(), _verbose=False, _trace=False):
 
         # Combine input dictionaries.
         i = combine_dicts(*input_dicts, copy=copy_input_dicts)
@@ -805,11 +1044,69 @@ class SubDispatch(Base):
         self.solution = self.dsp.dispatch(
             i, self.outputs, self.inputs_dist, self.wildcard, self.no_call,
             self.shrink, self.rm_unused_nds, stopper=_stopper,
-            executor=_executor, sol_name=_sol_name, verbose=_verbose
+            executor=_executor, sol_name=_sol_name, verbose=_verbose,
+            trace=_trace
         )
 
         return self._return(self.solution)
 
+    def iter(self, *input_dicts, copy_input_dicts=False, stopper=None,
+             executor=False):
+        """
+        Dispatches in background and yields the data node values as soon as
+        they are estimated.
+
+        .. seealso:: :func:`~schedula.dispatcher.Dispatcher.dispatch_iter`
+
+        :param input_dicts:
+            Input dictionaries.
+        :type input_dicts: dict
+
+        :param copy_input_dicts:
+            Copy the input dictionaries before combining them?
+        :type copy_input_dicts: bool, optional
+
+        :param stopper:
+            A semaphore to abort the dispatching when the stream is closed. If
+            None, a new one is created.
+        :type stopper: multiprocess.Event, optional
+
+        :param executor:
+            A pool executor id to dispatch asynchronously or in parallel.
+        :type executor: str, optional
+
+        :return:
+            An iterator (and asynchronous iterator) of `(node_path, value)`.
+        :rtype: schedula.utils.stream.DispatchStream
+
+        Example::
+
+            >>> from schedula import Dispatcher
+            >>> dsp = Dispatcher()
+            >>> dsp.add_func(lambda a: a + 1, ['b'])
+            '<lambda>'
+            >>> func = SubDispatch(dsp, ['b'], output_type='list')
+            >>> list(func.iter({'a': 1}, {'a': 2}))
+            [(('a',), 2), (('b',), 3)]
+            >>> func.solution
+            Solution({'a': 2, 'b': 3})
+        """
+        import threading
+        from .stream import DispatchStream
+        i = combine_dicts(*input_dicts, copy=copy_input_dicts)
+        if stopper is None:
+            stopper = threading.Event()
+
+        def _dispatch(stream):
+            self.solution = sol = self.dsp.dispatch(
+                i, self.outputs, self.inputs_dist, self.wildcard, self.no_call,
+                self.shrink, self.rm_unused_nds, stopper=stopper,
+                executor=executor, _stream=stream
+            )
+            return sol
+
+        return DispatchStream(_dispatch, stopper)
+
     def _return(self, solution):
         outs = self.outputs
         solution.result()
@@ -835,8 +1132,30 @@ class SubDispatch(Base):
 
         return solution  # Return outputs.
 
+    def __copy__(self):
+        return self._cow_copy({})
+
+    def _cow_copy(self, memo):
+        try:
+            return memo[id(self)]
+        except KeyError:
+            cls = self.__class__
+            memo[id(self)] = result = cls.__new__(cls)
+        result.__dict__.update(self.__dict__)
+        result.dsp = self.dsp._cow_copy(memo)
+        return result
+
     def copy(self):
-        return _copy.deepcopy(self)
+        """
+        Returns a copy-on-write copy of the object.
+
+        The dispatcher is copied with :func:`~schedula.Dispatcher.copy`.
+
+        :return:
+            A copy of the object.
+        :rtype: SubDispatch
+        """
+        return _copy.copy(self)
 
 
 class run_model:
@@ -886,7 +1205,7 @@ class run_model:
     def __init__(self, func, *args, _init=None, **kwargs):
         from .blue import Blueprint
         if isinstance(func, Blueprint):
-            func = func.register(memo={})
+            func = func.register(memo={}, copy='cow')
         self.func = func
         if _init:
             args, kwargs = _init(*args, **kwargs)
@@ -1094,11 +1413,12 @@ class MapDispatch(SubDispatch):
 
     # noinspection PyMethodOverriding
     def __call__(self, inputs, defaults=None, recursive_inputs=None,
-                 _stopper=None, _executor=False, _sol_name=(), _verbose=False):
+                 _stopper=None, _executor=False, _sol_name=(), _verbose=False,
+                 _trace=False):
         inputs = self._init_dsp(defaults, inputs, recursive_inputs)
         return super(MapDispatch, self).__call__(
             inputs, _stopper=_stopper, _executor=_executor, _verbose=_verbose,
-            _sol_name=_sol_name
+            _sol_name=_sol_name, _trace=_trace
         )
 
 
@@ -1167,7 +1487,7 @@ class SubDispatchFunction(SubDispatch):
 
     def __init__(self, dsp, function_id=None, inputs=None, outputs=None,
                  inputs_dist=None, shrink=True, wildcard=True, output_type=None,
-                 output_type_kw=None, first_arg_as_kw=False):
+                 output_type_kw=None, first_arg_as_kw=False, vectorize=False):
         """
         Initializes the Sub-dispatch Function.
 
@@ -1218,6 +1538,14 @@ class SubDispatchFunction(SubDispatch):
         :param first_arg_as_kw:
             Uses the first argument of the __call__ method as `kwargs`.
         :type output_type_kw: bool
+
+        :param vectorize:
+            If True the function takes column arrays as inputs and returns
+            arrays. The model is executed once: function nodes with the
+            attribute `vectorizable=True` are invoked with the whole columns,
+            the others row by row. Rows that do not satisfy the `input_domain`
+            are masked (see :class:`vectorized`).
+        :type vectorize: bool
         """
 
         if shrink:
@@ -1225,6 +1553,9 @@ class SubDispatchFunction(SubDispatch):
                 inputs, outputs, inputs_dist=inputs_dist, wildcard=wildcard
             )
 
+        if vectorize:
+            dsp = _vectorize_dsp(dsp)
+
         if outputs:
             # Outputs not reached.
             missed = {k for k in outputs if k not in dsp.nodes}
@@ -1261,10 +1592,20 @@ class SubDispatchFunction(SubDispatch):
             self.output_type = 'values'
 
         self.first_arg_as_kw = first_arg_as_kw
+        self.vectorize = vectorize
+
+    def __getstate__(self):
+        state = super(SubDispatchFunction, self).__getstate__()
+        state.pop('_signature', None)  # Rebuilt on demand.
+        return state
 
     @property
     def __signature__(self):
-        import inspect
+        # The signature is cached until the inputs or the dispatcher change.
+        key = tuple(self.inputs or ()), self.var_keyword, self.dsp.version
+        cache = self.__dict__.get('_signature')
+        if cache and cache[0] == key:
+            return cache[1]
         dfl, p = self.dsp.default_values, []
         for name in self.inputs or ():
             par = inspect.Parameter('par', inspect._POSITIONAL_OR_KEYWORD)
@@ -1274,7 +1615,9 @@ class SubDispatchFunction(SubDispatch):
             p.append(par)
         if self.var_keyword:
             p.append(inspect.Parameter(self.var_keyword, inspect._VAR_KEYWORD))
-        return inspect.Signature(p, __validate_parameters__=False)
+        sig = inspect.Signature(p, __validate_parameters__=False)
+        self._signature = key, sig
+        return sig
 
     def _parse_inputs(self, *args, **kw):
         if self.first_arg_as_kw:
@@ -1310,11 +1653,44 @@ class SubDispatchFunction(SubDispatch):
 
         return inputs
 
+    def iter(self, *args, stopper=None, executor=False, **kw):
+        """
+        Dispatches in background and yields the data node values as soon as
+        they are estimated.
+
+        .. seealso:: :func:`SubDispatch.iter`
+
+        :param args:
+            Positional inputs of the function.
+        :type args: tuple
+
+        :param stopper:
+            A semaphore to abort the dispatching when the stream is closed. If
+            None, a new one is created.
+        :type stopper: multiprocess.Event, optional
+
+        :param executor:
+            A pool executor id to dispatch asynchronously or in parallel.
+        :type executor: str, optional
+
+        :param kw:
+            Keyword inputs of the function.
+        :type kw: dict
+
+        :return:
+            An iterator (and asynchronous iterator) of `(node_path, value)`.
+        :rtype: schedula.utils.stream.DispatchStream
+        """
+        return super(SubDispatchFunction, self).iter(
+            self._parse_inputs(*args, **kw), stopper=stopper,
+            executor=executor
+        )
+
     def __call__(self, *args, _stopper=None, _executor=False, _sol_name=(),
-                 _verbose=False, **kw):
+                 _verbose=False, _trace=False, **kw):
         # Namespace shortcuts.
         self.solution = sol = self._sol._copy_structure()
-        sol.verbose = _verbose
+        sol.verbose, sol.trace = _verbose, _trace
         self.solution.full_name, dfl = _sol_name, self.dsp.default_values
 
         # Parse inputs.
@@ -1495,11 +1871,11 @@ class SubDispatchPipe(SubDispatchFunction):
 
         return [_make_tks(v['task']) for v in self._sol.pipe.values()]
 
-    def _init_new_solution(self, full_name, verbose):
+    def _init_new_solution(self, full_name, verbose, trace=False):
         key_map, sub_sol = {}, {}
         for k, s in self._sol.sub_sol.items():
             ns = s._copy_structure(dist=1)
-            ns.verbose = verbose
+            ns.verbose, ns.trace = verbose, trace
             ns.fringe = None
             ns.sub_sol = sub_sol
             ns.full_name = full_name + s.full_name
@@ -1519,8 +1895,10 @@ class SubDispatchPipe(SubDispatchFunction):
         return self.solution._pipe.append
 
     def __call__(self, *args, _stopper=None, _executor=False, _sol_name=(),
-                 _verbose=False, **kw):
-        self.solution, key_map = self._init_new_solution(_sol_name, _verbose)
+                 _verbose=False, _trace=False, **kw):
+        self.solution, key_map = self._init_new_solution(
+            _sol_name, _verbose, _trace
+        )
         pipe_append = self._pipe_append()
         self._init_workflows(self._parse_inputs(*args, **kw))
 
@@ -1607,22 +1985,42 @@ class DispatchPipe(NoSub, SubDispatchPipe):
     """
 
     def __getstate__(self):
-        self._init_workflows(dict.fromkeys(self.inputs or ()))
-        self._reset_sol()
-        state = super(DispatchPipe, self).__getstate__()
-        del state['pipe']
-        return state
+        if self.__dict__.get('_dirty', True):  # Solution used by a call.
+            self._init_workflows(dict.fromkeys(self.inputs or ()))
+            self._reset_sol()
+        return super(DispatchPipe, self).__getstate__()
 
     def __setstate__(self, d):
         super(DispatchPipe, self).__setstate__(d)
-        self.pipe = self._set_pipe()
+        if 'pipe' not in d:  # Pickled by an older version.
+            self.pipe = self._set_pipe()
+
+    def _reset_sol(self):
+        super(DispatchPipe, self)._reset_sol()
+        self._dirty = False
+
+    def _cow_copy(self, memo):
+        result = super(DispatchPipe, self)._cow_copy(memo)
+        # The pipe solution is updated by the calls: copy it, but share the
+        # dispatchers and their containers.
+        shared = {}
+        for s in self._sol.sub_sol.values():
+            for obj in (s.dsp, s.dmap, s.nodes, s._pred, s._succ,
+                        s.dsp.default_values):
+                shared[id(obj)] = obj
+        sol_pipe = self._sol, self.pipe
+        result._sol, result.pipe = _copy.deepcopy(sol_pipe, shared)
+        if self.solution is self._sol:
+            result.solution = result._sol
+        return result
 
     def _pipe_append(self):
         return lambda *args: None
 
-    def _init_new_solution(self, _sol_name, verbose):
+    def _init_new_solution(self, _sol_name, verbose, trace=False):
         from .asy import EXECUTORS
         EXECUTORS.set_active(id(self._sol))
+        self._dirty = True
         return self._sol, lambda x: x
 
     def _init_workflows(self, inputs):
@@ -1647,13 +2045,233 @@ class DispatchPipe(NoSub, SubDispatchPipe):
         return super(DispatchPipe, self).plot(workflow, *args, **kwargs)
 
 
+class MultiDispatchPipe(SubDispatchFunction):
+    """
+    It converts a :class:`~schedula.dispatcher.Dispatcher` into a function
+    that selects, per call, the pipe of the requested outputs.
+
+    One :class:`SubDispatchPipe` is compiled for each distinct `outputs`
+    request and cached in a bounded LRU.
+
+    :return:
+        A function that executes the pipe of the requested outputs.
+    :rtype: callable
+
+    .. seealso:: :class:`SubDispatchPipe`
+
+    **Example**:
+
+    A dispatcher with two functions `max` and `min`:
+
+    .. dispatcher:: dsp
+       :opt: graph_attr={'ratio': '1'}
+
+        >>> from schedula import Dispatcher
+        >>> dsp = Dispatcher(name='Dispatcher')
+        >>> dsp.add_function('max', max, inputs=['a', 'b'], outputs=['c'])
+        'max'
+        >>> dsp.add_function('min', min, inputs=['a', 'b'], outputs=['d'])
+        'min'
+
+    Precompile the pipes of two output sets, the first is the default::
+
+        >>> fun = MultiDispatchPipe(
+        ...     dsp, 'myF', ['a', 'b'], [['c'], ['c', 'd']], maxsize=2
+        ... )
+        >>> fun.outputs, fun.outputs_list
+        (['c'], [['c'], ['c', 'd']])
+        >>> fun(2, 1)
+        2
+        >>> fun(2, 1, _outputs=['c', 'd'])
+        [2, 1]
+
+    New output sets are compiled lazily, evicting the least recently used::
+
+        >>> fun(2, 1, _outputs=['d'])
+        1
+        >>> sorted(fun.pipes)
+        [('c', 'd'), ('d',)]
+        >>> fun.cache_info()
+        {'hits': 2, 'misses': 1, 'maxsize': 2, 'currsize': 2,
+         'hit_rate': 0.6...}
+    """
+    var_keyword = None
+
+    def __init__(self, dsp, function_id=None, inputs=None, outputs=None,
+                 maxsize=128, inputs_dist=None, no_domain=True, wildcard=True,
+                 shrink=True, output_type=None, output_type_kw=None,
+                 first_arg_as_kw=False):
+        """
+        Initializes the Multi Dispatch Pipe.
+
+        :param dsp:
+            A dispatcher that identifies the model adopted.
+        :type dsp: schedula.Dispatcher | schedula.utils.blue.BlueDispatcher
+
+        :param function_id:
+            Function name.
+        :type function_id: str, optional
+
+        :param inputs:
+            Input data nodes.
+        :type inputs: list[str], iterable
+
+        :param outputs:
+            Output sets to be precompiled (stored as `outputs_list`). The first
+            one is the default `outputs`, used when no outputs are requested.
+        :type outputs: list[list[str]], optional
+
+        :param maxsize:
+            Maximum number of cached pipes. If None the cache is unbounded.
+        :type maxsize: int, optional
+
+        :param inputs_dist:
+            Initial distances of input data nodes.
+        :type inputs_dist: dict[str, int | float], optional
+
+        :param no_domain:
+            Skip the domain check.
+        :type no_domain: bool, optional
+
+        :param wildcard:
+            If True, when the data node is used as input and target in the
+            ArciDispatch algorithm, the input value will be used as input for
+            the connected functions, but not as output.
+        :type wildcard: bool,int, optional
+
+        :param shrink:
+            If True the dispatcher is shrink before the dispatch.
+        :type shrink: bool, optional
+
+        :param output_type:
+            Type of function output (see :class:`SubDispatchPipe`).
+        :type output_type: str, optional
+
+        :param output_type_kw:
+            Extra kwargs to pass to the `selector` function.
+        :type output_type_kw: dict, optional
+
+        :param first_arg_as_kw:
+            Converts first argument of the __call__ method as `kwargs`.
+        :type output_type_kw: bool
+        """
+        super(MultiDispatchPipe, self).__init__(
+            dsp, function_id, inputs, inputs_dist=inputs_dist, shrink=False,
+            wildcard=wildcard, output_type_kw=output_type_kw,
+            first_arg_as_kw=first_arg_as_kw
+        )
+        self.outputs_list = outputs
+        self.outputs = outputs[0] if outputs else None
+        self.maxsize = maxsize
+        self.no_domain = no_domain
+        self.shrink = shrink
+        self.output_type = output_type
+        self.pipes = collections.OrderedDict()
+        self.hits = self.misses = 0
+        for o in reversed(outputs or ()):
+            self.pipes[tuple(o)] = self._compile(o)
+        self._evict()
+
+    def blue(self, memo=None, depth=-1):
+        blue = super(MultiDispatchPipe, self).blue(memo, depth)
+        if blue is not self:  # The `outputs` argument is the `outputs_list`.
+            blue.kwargs['outputs'] = self.outputs_list
+        return blue
+
+    def _compile(self, outputs):
+        return SubDispatchPipe(
+            self.dsp, self.function_id, self.inputs, outputs,
+            inputs_dist=self.inputs_dist, no_domain=self.no_domain,
+            wildcard=self.wildcard, shrink=self.shrink,
+            output_type=self.output_type, output_type_kw=self.output_type_kw,
+            first_arg_as_kw=self.first_arg_as_kw
+        )
+
+    def _evict(self):
+        if self.maxsize is not None:
+            while len(self.pipes) > self.maxsize:
+                self.pipes.popitem(last=False)
+
+    def get_pipe(self, outputs=None):
+        """
+        Returns the compiled pipe of the given outputs.
+
+        :param outputs:
+            Ending data nodes. If None the first precompiled output set is
+            used.
+        :type outputs: list[str], iterable, optional
+
+        :return:
+            The compiled pipe.
+        :rtype: SubDispatchPipe
+        """
+        if outputs is None:
+            outputs = self.outputs
+        key = None if outputs is None else tuple(outputs)
+        try:
+            pipe = self.pipes[key]
+            self.pipes.move_to_end(key)
+            self.hits += 1
+            if HOOKS:
+                fire('cache_hit', self, self.function_id, cache='pipe')
+        except KeyError:
+            self.misses += 1
+            self.pipes[key] = pipe = self._compile(outputs)
+            self._evict()
+        return pipe
+
+    def cache_info(self):
+        """
+        Returns the statistics of the pipe cache.
+
+        :return:
+            Number of hits and misses, maximum and current size, and hit rate.
+        :rtype: dict
+        """
+        n = self.hits + self.misses
+        return {
+            'hits': self.hits, 'misses': self.misses, 'maxsize': self.maxsize,
+            'currsize': len(self.pipes), 'hit_rate': n and self.hits / n
+        }
+
+    def cache_clear(self):
+        """
+        Clears the pipe cache and its statistics.
+        """
+        self.pipes.clear()
+        self.hits = self.misses = 0
+
+    def _cow_copy(self, memo):
+        result = super(MultiDispatchPipe, self)._cow_copy(memo)
+        result.pipes = collections.OrderedDict(
+            (k, p._cow_copy(memo)) for k, p in self.pipes.items()
+        )
+        return result
+
+    def __call__(self, *args, _outputs=None, _stopper=None, _executor=False,
+                 _sol_name=(), _verbose=False, _trace=False, **kw):
+        pipe = self.get_pipe(_outputs)
+        try:
+            return pipe(*args, _stopper=_stopper, _executor=_executor,
+                        _sol_name=_sol_name, _verbose=_verbose,
+                        _trace=_trace, **kw)
+        finally:
+            self.solution = pipe.solution
+
+
 def _get_par_args(func, exl_kw=False):
-    par = collections.OrderedDict()
-    for k, v in _get_signature(func, 0)._parameters.items():
-        if v.kind >= v.VAR_POSITIONAL or (exl_kw and v.default is not v.empty):
-            break
-        par[k] = v
-    return par
+    cache = _signature_cache(func)
+    try:
+        par = cache['par', exl_kw]
+    except KeyError:
+        par = []
+        for k, v in _get_signature(func, 0)._parameters.items():
+            if v.kind >= v.VAR_POSITIONAL or (
+                    exl_kw and v.default is not v.empty):
+                break
+            par.append((k, v))
+        cache['par', exl_kw] = par = tuple(par)
+    return collections.OrderedDict(par)
 
 
 def add_function(dsp, inputs_kwargs=False, inputs_defaults=False, **kw):
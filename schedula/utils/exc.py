@@ -35,6 +35,10 @@ class DispatcherAbort(BaseException):
     pass
 
 
+class DeadlineExceeded(DispatcherAbort):
+    pass
+
+
 class SkipNode(BaseException):
     def __init__(self, *args, ex=None, **kwargs):
         # noinspection PyArgumentList
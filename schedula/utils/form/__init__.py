@@ -32,21 +32,22 @@ import mimetypes
 import webbrowser
 import os.path as osp
 from ..web import WebMap
-from jinja2 import TemplateNotFound
 from collections import OrderedDict
-from werkzeug.exceptions import NotFound
 
-try:
-    from smart_open import open as _open
-    from smart_open.compression import NO_COMPRESSION
-
-    _open = functools.partial(_open, compression=NO_COMPRESSION)
-except ImportError:
-    _open = open
 __author__ = 'Vincenzo Arcidiacono <vinci1it2000@gmail.com>'
 
 static_dir = osp.join(osp.dirname(__file__), 'static')
 
+
+@functools.lru_cache()
+def _get_open():
+    try:
+        from smart_open import open as _open
+        from smart_open.compression import NO_COMPRESSION
+        return functools.partial(_open, compression=NO_COMPRESSION)
+    except ImportError:
+        return open
+
 STATIC_CONTEXT = {}
 
 
@@ -84,6 +85,7 @@ def get_form_name(name):
 
 def get_template(form, context, name=None):
     from flask import render_template
+    from jinja2 import TemplateNotFound
     if name is None:
         name = get_form_name(form)
     try:
@@ -100,6 +102,8 @@ def get_template(form, context, name=None):
 def send_static_file(
         filename, static_folders, is_form=False):
     from flask import current_app, request, send_file
+    from werkzeug.exceptions import NotFound
+    _open = _get_open()
     filename = f'{filename}'.split('/')
     download_name = filename[-1]
     kw = {
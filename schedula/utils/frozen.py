@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It provides an immutable and hashable compiled version of the Dispatcher.
+
+Classes:
+
+.. autosummary::
+    :nosignatures:
+    :toctree: frozen/
+
+    FrozenDispatcher
+    FrozenDiGraph
+    FrozenNode
+"""
+import copy
+from types import MappingProxyType
+from ..dispatcher import Dispatcher
+from .graph import DiGraph
+from .imp import WeakSet
+
+__all__ = ['FrozenDispatcher', 'FrozenDiGraph', 'FrozenNode']
+
+
+class FrozenNode:
+    """
+    Precomputed attributes of a node of a :class:`FrozenDispatcher`.
+    """
+    __slots__ = ('type', 'wait_inputs', 'index', 'pred', 'succ')
+
+    def __init__(self, node_id, dmap, edge_length):
+        nodes, attr = dmap.nodes, dmap.nodes[node_id]
+
+        #: Node type (i.e., `data`, `function`, or `dispatcher`).
+        self.type = attr['type']
+
+        #: Flag to wait all inputs before the node evaluation.
+        self.wait_inputs = attr.get('wait_inputs', False)
+
+        #: Node index.
+        self.index = attr.get('index')
+
+        #: Predecessor ids.
+        self.pred = tuple(dmap.pred[node_id])
+
+        #: Successors as (id, edge length, is a sub-dispatcher).
+        self.succ = tuple(
+            (w, edge_length(e, nodes[w]), nodes[w]['type'] == 'dispatcher')
+            for w, e in dmap.succ[node_id].items()
+        )
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(
+            '%s=%r' % (k, getattr(self, k)) for k in self.__slots__
+        ))
+
+
+def _immutable(name):
+    def method(self, *args, **kwargs):
+        raise TypeError(
+            '%r object does not support %s' % (self.__class__.__name__, name)
+        )
+
+    method.__name__ = name
+    return method
+
+
+def _read_only(default_values):
+    return MappingProxyType({
+        k: MappingProxyType(dict(v)) for k, v in default_values.items()
+    })
+
+
+class FrozenDiGraph(DiGraph):
+    """
+    A read-only :class:`~schedula.utils.graph.DiGraph`.
+
+    It is the `dmap` of a :class:`FrozenDispatcher`. The methods that modify
+    the graph raise a :class:`TypeError`, while :func:`copy` and
+    :func:`subgraph` return a mutable graph. The node and edge containers
+    must not be modified in place.
+
+    Example::
+
+        >>> g = FrozenDiGraph({'a': {}, 'b': {}}, {'a': {'b': {}}})
+        >>> g.remove_node('a')
+        Traceback (most recent call last):
+         ...
+        TypeError: 'FrozenDiGraph' object does not support remove_node
+        >>> g.copy().remove_node('a').nodes
+        {'b': {}}
+    """
+    __slots__ = ()
+
+    def _bump(self):
+        _immutable('modifications')(self)
+
+    _add_node = add_node = _immutable('add_node')
+    _remove_node = remove_node = _immutable('remove_node')
+    add_nodes_from = _immutable('add_nodes_from')
+    remove_nodes_from = _immutable('remove_nodes_from')
+    _add_edge = add_edge = _immutable('add_edge')
+    _add_edge_fw = add_edge_fw = _immutable('add_edge_fw')
+    add_edges_from = _immutable('add_edges_from')
+    remove_edge = _immutable('remove_edge')
+    remove_edges_from = _immutable('remove_edges_from')
+
+    def subgraph(self, nodes):
+        g = super(FrozenDiGraph, self).subgraph(nodes)
+        g.__class__ = DiGraph
+        return g
+
+    def copy(self):
+        g = super(FrozenDiGraph, self).copy()
+        g.__class__ = DiGraph
+        return g
+
+
+class FrozenDispatcher(Dispatcher):
+    """
+    An immutable and hashable compiled model.
+
+    It is created by :func:`~schedula.dispatcher.Dispatcher.freeze`. The node
+    records (see :class:`FrozenNode`), the edge lengths, and the `wait_inputs`
+    flags are computed once and used by the
+    :class:`~schedula.utils.sol.Solution` to dispatch. The hash depends only
+    on the model structure and it is stable across processes.
+
+    The methods that modify the model, and the ones of its `dmap` (see
+    :class:`FrozenDiGraph`), raise a :class:`TypeError`, while the
+    `default_values` are read-only mappings. Use
+    :func:`~schedula.dispatcher.Dispatcher.blue` to get a mutable copy.
+
+    Example::
+
+        >>> import schedula as sh
+        >>> dsp = sh.Dispatcher()
+        >>> dsp.add_func(max, ['c'], inputs=['a', 'b'])
+        'max'
+        >>> frozen = dsp.freeze()
+        >>> frozen({'a': 1, 'b': 2})
+        Solution({'a': 1, 'b': 2, 'c': 2})
+        >>> frozen.add_data('d')
+        Traceback (most recent call last):
+         ...
+        TypeError: 'FrozenDispatcher' object does not support add_data
+        >>> frozen.dmap.add_node('d')
+        Traceback (most recent call last):
+         ...
+        TypeError: 'FrozenDiGraph' object does not support add_node
+        >>> frozen.default_values['a'] = {'value': 1}
+        Traceback (most recent call last):
+         ...
+        TypeError: 'mappingproxy' object does not support item assignment
+        >>> hash(frozen) == hash(dsp.freeze())
+        True
+        >>> frozen.blue().register().add_data('d')
+        'd'
+    """
+
+    def __getstate__(self):
+        state = super(FrozenDispatcher, self).__getstate__()
+        del state['_records']  # Rebuilt by `__setstate__`.
+        state['default_values'] = {
+            k: dict(v) for k, v in self.default_values.items()
+        }
+        return state
+
+    def __setstate__(self, state):
+        super(FrozenDispatcher, self).__setstate__(state)
+        self.default_values = _read_only(self.default_values)
+        self._compile()
+
+    def __deepcopy__(self, memo):  # It is immutable.
+        return self._cow_copy(memo)
+
+    def __hash__(self):
+        return self._hash
+
+    @classmethod
+    def _freeze(cls, dsp, memo):
+        try:
+            return memo[id(dsp)]
+        except KeyError:
+            memo[id(dsp)] = self = cls.__new__(cls)
+        self.__dict__.update(dsp.__dict__)
+        self.default_values = _read_only(dsp.default_values)
+        self.counter = copy.deepcopy(dsp.counter)
+        self._cache, self._parents, self._dfl_shared = {}, WeakSet(), None
+
+        # Sub-dispatchers are frozen, the other stateful functions are copied.
+        override = {}
+        for k, a in dsp._stateful_nodes.items():
+            func = a['function']
+            if a['type'] == 'dispatcher':
+                func = cls._freeze(func, memo)
+            else:
+                func = func._cow_copy(memo)
+            override[k] = dict(a, function=func)
+        self.dmap = dsp.dmap.cow_copy(override)
+        self.dmap.__class__ = FrozenDiGraph
+        self.solution = dsp.solution.__class__(self)
+        self._compile()
+        return self
+
+    def _compile(self):
+        dmap, el = self.dmap, self._edge_length
+        self._records = {k: FrozenNode(k, dmap, el) for k in dmap.nodes}
+        fp = bytes.fromhex(self.fingerprint())
+        self._hash = int.from_bytes(fp[:8], 'big', signed=True)
+
+    def copy_structure(self, **kwargs):
+        kw = {
+            'description': self.__doc__, 'name': self.name,
+            'raises': self.raises, 'executor': self.executor
+        }
+        kw.update(kwargs)
+        return Dispatcher(**kw)
+
+    def freeze(self):
+        return self
+
+    def _bump(self):
+        _immutable('modifications')(self)
+
+    _own_default_values = _immutable('modifications of the default values')
+    add_data = _immutable('add_data')
+    add_function = _immutable('add_function')
+    add_func = _immutable('add_func')
+    add_dispatcher = _immutable('add_dispatcher')
+    add_from_lists = _immutable('add_from_lists')
+    add_from_records = _immutable('add_from_records')
+    set_default_value = _immutable('set_default_value')
+    extend = _immutable('extend')
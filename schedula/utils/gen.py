@@ -91,3 +91,37 @@ class Token(_Token, str):
         >>> s.capitalize()
         'String'
     """
+
+
+class LazyValue:
+    """
+    Base class of data node values that are materialized on demand.
+
+    A lazy value is passed through data nodes and sub-dispatchers as it is. It
+    is materialized (see :func:`LazyValue.load`) only when it is given as
+    argument to a function or an input domain. When the function runs in a
+    process pool, it is materialized in the worker process.
+
+    Example::
+
+        >>> class Range(LazyValue):
+        ...     def __init__(self, n):
+        ...         self.n = n
+        ...     def load(self):
+        ...         return list(range(self.n))
+        >>> import schedula as sh
+        >>> dsp = sh.Dispatcher()
+        >>> dsp.add_data('a', Range(3))
+        'a'
+        >>> dsp.add_function('sum', sum, ['a'], ['b'])
+        'sum'
+        >>> dsp.dispatch()['b']
+        3
+    """
+    __slots__ = ()
+
+    def load(self):
+        """
+        Returns the materialized value.
+        """
+        raise NotImplementedError
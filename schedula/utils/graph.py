@@ -9,15 +9,26 @@
 """
 It contains the `DiGraph` class.
 """
+from heapq import heappush
+from .utl import cached_by_version
 
 
 class DiGraph:
-    __slots__ = 'nodes', 'succ', 'pred'
+    __slots__ = (
+        'nodes', 'succ', 'pred', 'version', '_cache', '_suffixes', '_shared'
+    )
 
     def __reduce__(self):
         return self.__class__, (self.nodes, self.succ)
 
     def __init__(self, nodes=None, adj=None):
+        #: Structural version, it is increased by every mutating method.
+        self.version = 0
+        self._cache = {}
+        #: Next and released suffixes of the generated node ids per base name.
+        self._suffixes = {}
+        #: Number of graphs sharing the containers (see :func:`cow_copy`).
+        self._shared = None
         if nodes is None and adj is None:
             self.nodes = {}
             self.succ = {}
@@ -46,22 +57,99 @@ class DiGraph:
     def adj(self):
         return self.succ
 
+    def _bump(self):
+        self.version += 1
+
+    def _unshare(self):
+        shared = self._shared
+        if shared[0] > 1:  # Clone the containers shared with other graphs.
+            shared[0] -= 1
+            self._shared = [1]
+            self.nodes = self.nodes.copy()
+            self.succ = {u: d.copy() for u, d in self.succ.items()}
+            self.pred = {u: d.copy() for u, d in self.pred.items()}
+
+    def cow_copy(self, override=None):
+        """
+        Returns a copy-on-write copy of the graph.
+
+        The copy shares the node and edge containers with the graph. They are
+        cloned by the first graph that is mutated. Node and edge attributes
+        are replaced, not updated in place, by the graphs that have been
+        shared.
+
+        :param override:
+            Attributes of existing nodes to be replaced in the copy. Only the
+            node container of the copy is cloned, the edges stay shared.
+        :type override: dict[str, dict], optional
+
+        :return:
+            A copy-on-write copy of the graph.
+        :rtype: DiGraph
+
+        Example::
+
+            >>> g = DiGraph()
+            >>> g.add_edge('a', 'b', weight=1)
+            <...>
+            >>> c = g.cow_copy()
+            >>> c.nodes is g.nodes
+            True
+            >>> c.add_edge('a', 'b', weight=2).edges
+            {('a', 'b'): {'weight': 2}}
+            >>> g.edges
+            {('a', 'b'): {'weight': 1}}
+            >>> c = g.cow_copy({'a': {'foo': 1}})
+            >>> c.nodes['a'], g.nodes['a'], c.succ is g.succ
+            ({'foo': 1}, {}, True)
+        """
+        g = self.__class__.__new__(self.__class__)
+        g.nodes, g.succ, g.pred = self.nodes, self.succ, self.pred
+        if override:
+            g.nodes = nodes = self.nodes.copy()
+            nodes.update(override)
+        g.version, g._cache, g._suffixes = self.version, {}, {}
+        if self._shared is None:
+            self._shared = [1]
+        self._shared[0] += 1
+        g._shared = self._shared
+        return g
+
     def _add_node(self, n, attr):
+        if self._shared:
+            self._unshare()
         nodes = self.nodes
         if n not in nodes:  # Add nodes.
             self.succ[n] = {}
             self.pred[n] = {}
             nodes[n] = attr
         elif attr:
+            if self._shared:  # Attributes may be shared with other graphs.
+                nodes[n] = nodes[n].copy()
             nodes[n].update(attr)
+        else:
+            return
+        self.version += 1
 
     def _remove_node(self, n):
+        if self._shared:
+            self._unshare()
         nodes, succ, pred = self.nodes, self.succ, self.pred
         for u in succ[n]:
             del pred[u][n]
         for u in pred[n]:
             del succ[u][n]
         del nodes[n], succ[n], pred[n]
+        self.version += 1
+        if self._suffixes and isinstance(n, str) and n.endswith('>'):
+            self._release_suffix(n)
+
+    def _release_suffix(self, n):
+        base, sep, i = n[:-1].rpartition('<')
+        if sep and base in self._suffixes and i.isdigit():
+            i, suffixes = int(i), self._suffixes[base]
+            if i < suffixes[0] and n == '%s<%d>' % (base, i):
+                heappush(suffixes[1], i)
 
     def add_node(self, n, **attr):
         self._add_node(n, attr)
@@ -87,11 +175,17 @@ class DiGraph:
         return self
 
     def _add_edge(self, u, v, attr):
-        succ = self.succ
         self.add_node(u)
         self.add_node(v)
-        succ[u][v] = self.pred[v][u] = dd = succ[u].get(v, {})
+        succ = self.succ
+        dd = succ[u].get(v)
+        if dd is None:
+            dd = {}
+        elif self._shared:  # Attributes may be shared with other graphs.
+            dd = dd.copy()
+        succ[u][v] = self.pred[v][u] = dd
         dd.update(attr)
+        self.version += 1
 
     def _add_edge_fw(self, u, v, attr):
         if v not in self.succ:  # Add nodes.
@@ -115,15 +209,22 @@ class DiGraph:
             fn(u, v, **attr)
 
     def remove_edge(self, u, v):
+        if self._shared:
+            self._unshare()
         del self.succ[u][v], self.pred[v][u]
+        self.version += 1
 
     def remove_edges_from(self, ebunch):
+        if self._shared:
+            self._unshare()
         succ, pred = self.succ, self.pred
         for e in ebunch:
             u, v = e[:2]  # ignore edge data
             del succ[u][v], pred[v][u]
+        self.version += 1
 
     @property
+    @cached_by_version
     def edges(self):
         return {(i, j): v for i, d in self.succ.items() for j, v in d.items()}
 
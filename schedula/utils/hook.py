@@ -0,0 +1,343 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It provides a registry of instrumentation hooks and a metrics collector.
+
+The hooks are called with the source of the event (i.e., the solution or the
+caching function), the node id, and the following keywords:
+
+- `node_start`: `attr` (workflow node attributes), when a node evaluation
+  starts,
+- `node_end`: `attr`, when a node evaluation ends (also after an error),
+- `node_error`: `attr` and `error`, when a node evaluation fails,
+- `node_skip`: `attr`, when the input domain of a function is not satisfied,
+- `submit`: `executor` (executor name), when a node is submitted to an
+  executor,
+- `complete`: `executor` and `error` (the exception or None), when an executor
+  completes a node,
+- `cache_hit`: `cache` (cache type), when a result is taken from a cache
+  (i.e., the logged results of a checkpoint or the compiled pipes of a
+  :class:`~schedula.utils.dsp.MultiDispatchPipe`, whose node id is its
+  function id).
+
+The registry is checked with a single truth test, so the dispatch pays no cost
+when no hooks are registered.
+
+Classes:
+
+.. autosummary::
+    :nosignatures:
+    :toctree: hook/
+
+    MetricsCollector
+"""
+import logging
+from .imp import Lock
+
+__author__ = 'Vincenzo Arcidiacono <vinci1it2000@gmail.com>'
+
+log = logging.getLogger(__name__)
+
+#: Hook events.
+EVENTS = (
+    'node_start', 'node_end', 'node_error', 'node_skip', 'submit', 'complete',
+    'cache_hit'
+)
+
+#: Registered hooks by event. It is empty when no hooks are registered.
+HOOKS = {}
+
+_lock = Lock()
+
+
+def register_hook(event, func):
+    """
+    Registers a hook that is called when the event occurs.
+
+    :param event:
+        Event name (see :data:`EVENTS`).
+    :type event: str
+
+    :param func:
+        Hook function.
+    :type func: callable
+
+    :return:
+        The hook function.
+    :rtype: callable
+
+    Example::
+
+        >>> import schedula as sh
+        >>> dsp = sh.Dispatcher()
+        >>> dsp.add_func(lambda a: a + 1, ['b'], function_id='f')
+        'f'
+        >>> def log_start(sol, node_id, attr):
+        ...     print('start', node_id)
+        >>> register_hook('node_start', log_start)
+        <function log_start at ...>
+        >>> dsp({'a': 1})
+        start f
+        Solution({'a': 1, 'b': 2})
+        >>> unregister_hook('node_start', log_start)
+        >>> dsp({'a': 1})
+        Solution({'a': 1, 'b': 2})
+    """
+    if event not in EVENTS:
+        raise ValueError('Invalid hook event %r.' % event)
+    with _lock:
+        HOOKS[event] = HOOKS.get(event, ()) + (func,)
+    return func
+
+
+def unregister_hook(event=None, func=None):
+    """
+    Removes the registered hooks.
+
+    :param event:
+        Event name. If None all events are considered.
+    :type event: str, optional
+
+    :param func:
+        Hook function. If None all hooks of the event are removed.
+    :type func: callable, optional
+    """
+    with _lock:
+        for k in (EVENTS if event is None else (event,)):
+            hooks = tuple(f for f in HOOKS.get(k, ()) if not (
+                func is None or f == func
+            ))
+            if hooks:
+                HOOKS[k] = hooks
+            else:
+                HOOKS.pop(k, None)
+
+
+def fire(event, source, key, **kw):
+    """
+    Calls the hooks registered for the event.
+
+    The exceptions raised by the hooks are logged and ignored.
+
+    :param event:
+        Event name.
+    :type event: str
+
+    :param source:
+        Source of the event (e.g., the solution).
+    :type source: object
+
+    :param key:
+        Node id or cache key.
+    :type key: object
+
+    :param kw:
+        Event keywords.
+    :type kw: dict
+    """
+    for func in HOOKS.get(event, ()):
+        try:
+            func(source, key, **kw)
+        except Exception as ex:
+            log.warning('Failed hook %r on %s due to:\n  %r', func, event, ex)
+
+
+def _escape(value):
+    value = str(value).replace('\\', '\\\\').replace('\n', '\\n')
+    return value.replace('"', '\\"')
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsCollector:
+    """
+    A hook collector of counters, latency histograms, and in-flight gauges.
+
+    It keeps the number of events per node id (and per cache type for the
+    cache hits), the histogram of the node evaluation times per node id, and
+    the number of nodes submitted and not completed per executor.
+
+    :param buckets:
+        Upper bounds [s] of the latency histogram buckets.
+    :type buckets: tuple[float], optional
+
+    Example::
+
+        >>> import schedula as sh
+        >>> dsp = sh.Dispatcher()
+        >>> dsp.add_func(lambda a: a + 1, ['b'], function_id='f')
+        'f'
+        >>> with MetricsCollector(buckets=(1,)) as metrics:
+        ...     sol = dsp({'a': 1})
+        >>> metrics.counters
+        {('node_start', 'f'): 1, ('node_end', 'f'): 1}
+        >>> print(metrics.to_prometheus())
+        # HELP schedula_node_events_total Number of node events.
+        # TYPE schedula_node_events_total counter
+        schedula_node_events_total{event="node_start",node="f"} 1
+        schedula_node_events_total{event="node_end",node="f"} 1
+        # HELP schedula_node_duration_seconds Node evaluation time.
+        # TYPE schedula_node_duration_seconds histogram
+        schedula_node_duration_seconds_bucket{node="f",le="1"} 1
+        schedula_node_duration_seconds_bucket{node="f",le="+Inf"} 1
+        schedula_node_duration_seconds_sum{node="f"} ...
+        schedula_node_duration_seconds_count{node="f"} 1
+        # HELP schedula_executor_inflight Nodes submitted and not completed.
+        # TYPE schedula_executor_inflight gauge
+
+    The cache hits are labelled by node id and cache type::
+
+        >>> pipe = sh.MultiDispatchPipe(dsp, 'pipe', ['a'], [['b']])
+        >>> with MetricsCollector() as metrics:
+        ...     pipe(1), pipe(2)
+        (2, 3)
+        >>> metrics.counters['cache_hit', 'pipe', 'pipe']
+        2
+        >>> print(metrics.to_prometheus().splitlines()[2].partition('{')[2])
+        event="cache_hit",node="pipe",cache="pipe"} 2
+    """
+
+    #: Default upper bounds [s] of the latency histogram buckets.
+    buckets = (
+        .0001, .0005, .001, .005, .01, .05, .1, .5, 1, 5, 10, 60, float('inf')
+    )
+
+    def __init__(self, buckets=None):
+        if buckets is not None:
+            buckets = tuple(sorted(buckets))
+            if buckets[-1] != float('inf'):
+                buckets += (float('inf'),)
+            self.buckets = buckets
+
+        #: Number of events by (event, node id) or, for the cache hits, by
+        #: (event, node id, cache type).
+        self.counters = {}
+
+        #: Histogram bucket counts, sum, and count by node id.
+        self.histograms = {}
+
+        #: Nodes submitted and not completed by executor name.
+        self.inflight = {}
+
+        self._lock = Lock()
+
+    def _count(self, *key):
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + 1
+
+    def node_start(self, sol, node_id, attr):
+        self._count('node_start', node_id)
+
+    def node_end(self, sol, node_id, attr):
+        duration = attr.get('duration', 0)
+        with self._lock:
+            key = 'node_end', node_id
+            self.counters[key] = self.counters.get(key, 0) + 1
+            try:
+                hist = self.histograms[node_id]
+            except KeyError:
+                hist = self.histograms[node_id] = [0] * len(self.buckets)
+                hist += [0.0, 0]
+            for i, b in enumerate(self.buckets):
+                if duration <= b:
+                    hist[i] += 1
+            hist[-2] += duration
+            hist[-1] += 1
+
+    def node_error(self, sol, node_id, attr, error):
+        self._count('node_error', node_id)
+
+    def node_skip(self, sol, node_id, attr):
+        self._count('node_skip', node_id)
+
+    def submit(self, sol, node_id, executor):
+        self._count('submit', node_id)
+        with self._lock:
+            self.inflight[executor] = self.inflight.get(executor, 0) + 1
+
+    def complete(self, sol, node_id, executor, error):
+        self._count('complete', node_id)
+        with self._lock:
+            self.inflight[executor] = self.inflight.get(executor, 0) - 1
+
+    def cache_hit(self, source, node_id, cache):
+        self._count('cache_hit', node_id, cache)
+
+    def register(self):
+        """
+        Registers the collector hooks.
+
+        :return:
+            Self.
+        :rtype: MetricsCollector
+        """
+        for event in EVENTS:
+            register_hook(event, getattr(self, event))
+        return self
+
+    def unregister(self):
+        """
+        Removes the collector hooks.
+        """
+        for event in EVENTS:
+            unregister_hook(event, getattr(self, event))
+
+    def __enter__(self):
+        return self.register()
+
+    def __exit__(self, *args):
+        self.unregister()
+
+    def to_prometheus(self):
+        """
+        Returns the metrics in Prometheus text format.
+
+        :return:
+            Prometheus metrics.
+        :rtype: str
+        """
+        with self._lock:
+            counters = list(self.counters.items())
+            hists = [(k, list(v)) for k, v in self.histograms.items()]
+            inflight = list(self.inflight.items())
+        name = 'schedula_node_events_total'
+        lines = [
+            '# HELP %s Number of node events.' % name,
+            '# TYPE %s counter' % name
+        ]
+        for (event, key, *cache), n in counters:
+            labels = 'event="%s",node="%s"' % (_escape(event), _escape(key))
+            if cache:
+                labels += ',cache="%s"' % _escape(cache[0])
+            lines.append('%s{%s} %d' % (name, labels, n))
+        name = 'schedula_node_duration_seconds'
+        lines += [
+            '# HELP %s Node evaluation time.' % name,
+            '# TYPE %s histogram' % name
+        ]
+        for key, hist in hists:
+            key = _escape(key)
+            for b, n in zip(self.buckets, hist):
+                lines.append('%s_bucket{node="%s",le="%s"} %d' % (
+                    name, key, _number(b), n
+                ))
+            lines.append('%s_sum{node="%s"} %r' % (name, key, hist[-2]))
+            lines.append('%s_count{node="%s"} %d' % (name, key, hist[-1]))
+        name = 'schedula_executor_inflight'
+        lines += [
+            '# HELP %s Nodes submitted and not completed.' % name,
+            '# TYPE %s gauge' % name
+        ]
+        for key, n in inflight:
+            lines.append('%s{executor="%s"} %d' % (name, _escape(key), n))
+        return '\n'.join(lines) + '\n'
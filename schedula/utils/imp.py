@@ -10,8 +10,10 @@
 Fixes ImportError for MicroPython.
 """
 try:
-    from threading import Lock
-    from weakref import finalize
+    from os import getpid
+    from time import perf_counter_ns
+    from threading import Lock, get_ident
+    from weakref import finalize, ref, WeakSet
     from concurrent.futures import Future
     from concurrent.futures._base import Error
 except ImportError:  # MicroPython.
@@ -30,3 +32,20 @@ except ImportError:  # MicroPython.
     # noinspection PyUnusedLocal
     def finalize(*args, **kwargs):
         pass
+
+
+    # noinspection PyUnusedLocal
+    def ref(obj, callback=None):
+        raise TypeError('cannot create weak reference')
+
+    WeakSet = set
+
+    def getpid():
+        return 0
+
+    def get_ident():
+        return 0
+
+    def perf_counter_ns():
+        import time
+        return time.ticks_us() * 1000
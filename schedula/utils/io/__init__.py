@@ -8,27 +8,139 @@
 
 """
 It provides functions to read and save a dispatcher from/to files.
+
+Sub-Modules:
+
+.. currentmodule:: schedula.utils.io
+
+.. autosummary::
+    :nosignatures:
+    :toctree: io/
+
+    ckpt
+    ref
 """
 
+import os
+import importlib
+import contextlib
+import os.path as osp
+from ..gen import LazyValue
+
 __author__ = 'Vincenzo Arcidiacono <vinci1it2000@gmail.com>'
 
+#: Compression modules by file extension.
+CODECS = {
+    '.gz': 'gzip', '.bz2': 'bz2', '.xz': 'lzma', '.lzma': 'lzma',
+    '.zst': 'zstandard'
+}
+
+
+def get_codec(path):
+    """
+    Returns the compression module of a file name.
+
+    :param path:
+        File or filename.
+    :type path: str, file
+
+    :return:
+        Compression module name or None if the file is not compressed.
+    :rtype: str | None
+
+    Example::
 
-def save_dispatcher(dsp, path):
+        >>> get_codec('model.dill.gz'), get_codec('model.dill')
+        ('gzip', None)
+    """
+    if isinstance(path, (str, os.PathLike)):
+        return CODECS.get(os.path.splitext(os.fspath(path))[1].lower())
+
+
+def open_file(path, mode='rb'):
+    """
+    Opens a file, compressed according to its extension (see :data:`CODECS`).
+
+    The data is streamed through the compressor. An already open file object
+    is returned as it is and it is not closed on exit.
+
+    .. note:: The `.zst` extension requires the `zstandard` package.
+
+    :param path:
+        File or filename.
+    :type path: str, file
+
+    :param mode:
+        Open mode.
+    :type mode: str
+
+    :return:
+        A context manager that returns the file object.
+    :rtype: contextlib.AbstractContextManager
+
+    .. testsetup::
+        >>> import os
+        >>> from tempfile import mkstemp
+        >>> fd, file_name = mkstemp(suffix='.gz')
+        >>> os.close(fd)
+
+    Example::
+
+        >>> with open_file(file_name, 'wb') as f:
+        ...     f.write(b'data')
+        4
+        >>> import gzip
+        >>> with gzip.open(file_name) as f:
+        ...     f.read()
+        b'data'
+
+    .. testcleanup::
+        >>> os.remove(file_name)
+    """
+    if hasattr(path, 'read' if 'r' in mode else 'write'):
+        return contextlib.nullcontext(path)
+    codec = get_codec(path)
+    if codec is None:
+        return open(path, mode)
+    return importlib.import_module(codec).open(path, mode)
+
+
+def _peek(f):
+    try:
+        return f.peek(1)[:1]
+    except AttributeError:  # Not a buffered reader.
+        pos = f.tell()
+        b = f.read(1)
+        f.seek(pos)
+        return b
+
+
+def save_dispatcher(dsp, path, format='dill'):
     """
     Write Dispatcher object in Python pickle format.
 
     Pickles are a serialized byte stream of a Python object.
     This format will preserve Python objects used as nodes or edges.
 
+    With `format='ref'` the model structure is written as compact JSON, the
+    importable functions as `module:qualname` references, and only the other
+    objects (e.g., closures and numpy default values) are pickled with `dill`
+    into the side file `<path>.dill` (see :mod:`~schedula.utils.io.ref`). The
+    last solution is not saved.
+
     :param dsp:
         A dispatcher that identifies the model adopted.
     :type dsp: schedula.Dispatcher
 
     :param path:
         File or filename to write.
-        File names ending in .gz or .bz2 will be compressed.
+        File names ending in .gz, .bz2, .xz, or .zst will be compressed.
     :type path: str, file
 
+    :param format:
+        Output format (i.e., `dill` or `ref`).
+    :type format: str, optional
+
     .. testsetup::
         >>> from tempfile import mkstemp
         >>> file_name = mkstemp()[1]
@@ -42,24 +154,38 @@ def save_dispatcher(dsp, path):
         >>> dsp.add_function(function=max, inputs=['a', 'b'], outputs=['c'])
         'max'
         >>> save_dispatcher(dsp, file_name)
+        >>> save_dispatcher(dsp, file_name, format='ref')
     """
+    if format == 'ref':
+        from .ref import save
+        save(dsp, path)
+        return
+    elif format != 'dill':
+        raise ValueError('Unknown format %r.' % format)
     import dill
-    with open(path, 'wb') as f:
+    with open_file(path, 'wb') as f:
         dill.dump(dsp, f)
 
 
-def load_dispatcher(path):
+def load_dispatcher(path, lazy=False):
     """
     Load Dispatcher object in Python pickle format.
 
     Pickles are a serialized byte stream of a Python object.
     This format will preserve Python objects used as nodes or edges.
 
+    The files written with `format='ref'` are detected automatically.
+
     :param path:
         File or filename to write.
-        File names ending in .gz or .bz2 will be uncompressed.
+        File names ending in .gz, .bz2, .xz, or .zst will be uncompressed.
     :type path: str, file
 
+    :param lazy:
+        If True, the functions of a `ref` file are resolved on their first call
+        (see :class:`~schedula.utils.io.ref.LazyFunction`).
+    :type lazy: bool, optional
+
     :return:
         A dispatcher that identifies the model adopted.
     :rtype: schedula.Dispatcher
@@ -81,14 +207,126 @@ def load_dispatcher(path):
         >>> dsp = load_dispatcher(file_name)
         >>> dsp.dispatch(inputs={'b': 3})['c']
         3
+
+        >>> save_dispatcher(dsp, file_name, format='ref')
+        >>> dsp = load_dispatcher(file_name, lazy=True)
+        >>> dsp.get_node('max', node_attr='function')[0]
+        LazyFunction('builtins:max')
+        >>> dsp.dispatch(inputs={'b': 3})['c']
+        3
     """
     import dill
     # noinspection PyArgumentList
-    with open(path, 'rb') as f:
+    with open_file(path, 'rb') as f:
+        if _peek(f) == b'{':
+            from .ref import load
+            return load(f, path, lazy=lazy)
         return dill.load(f)
 
 
-def save_default_values(dsp, path):
+class MemoryMap(LazyValue):
+    """
+    A lazy reference to a read-only memory-mapped file.
+
+    It can be used as data node value (e.g., a default value) to share large
+    arrays between dispatches and worker processes through the page cache. The
+    file is mapped when the value is given to a function (see
+    :class:`~schedula.utils.gen.LazyValue`) and the mapping is reused by the
+    following calls of the same process. Only the reference is pickled.
+
+    :param path:
+        File name. A `.npy` file is loaded with `numpy.load(mmap_mode='r')`.
+    :type path: str | os.PathLike
+
+    :param dtype:
+        Data type of a raw file. If None, a raw file is mapped as bytes.
+    :type dtype: str, optional
+
+    :param shape:
+        Array shape of a raw file.
+    :type shape: tuple[int], optional
+
+    :param offset:
+        Offset in bytes of the data of a raw file.
+    :type offset: int, optional
+
+    .. testsetup::
+        >>> from tempfile import mkstemp
+        >>> file_name = mkstemp(suffix='.npy')[1]
+
+    Example::
+
+        >>> import numpy as np
+        >>> import schedula as sh
+        >>> np.save(file_name, np.arange(4))
+        >>> dsp = sh.Dispatcher()
+        >>> dsp.add_data('a', MemoryMap(file_name))
+        'a'
+        >>> dsp.add_function('sum', np.sum, ['a'], ['b'])
+        'sum'
+        >>> sol = dsp.dispatch()
+        >>> sol['a']
+        MemoryMap('...npy')
+        >>> int(sol['b'])
+        6
+        >>> sol['a'].load()
+        memmap([0, 1, 2, 3])
+    """
+    __slots__ = ('path', 'dtype', 'shape', 'offset', '_value')
+
+    def __init__(self, path, dtype=None, shape=None, offset=0):
+        self.path, self.dtype, self.offset = os.fspath(path), dtype, offset
+        self.shape = shape if shape is None else tuple(shape)
+        self._value = None
+
+    def __reduce__(self):
+        return self.__class__, (self.path, self.dtype, self.shape, self.offset)
+
+    def __repr__(self):
+        args = [repr(self.path)]
+        for k in ('dtype', 'shape', 'offset'):
+            v = getattr(self, k)
+            if v != (0 if k == 'offset' else None):
+                args.append('%s=%r' % (k, v))
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(args))
+
+    def load(self):
+        """
+        Returns the memory-mapped value.
+
+        :return:
+            Read-only array or bytes.
+        :rtype: numpy.memmap | memoryview
+        """
+        value = self._value
+        if value is None:
+            if self.dtype is not None:
+                import numpy as np
+                value = np.memmap(
+                    self.path, self.dtype, 'r', self.offset, self.shape
+                )
+            elif self.path.endswith('.npy'):
+                import numpy as np
+                value = np.load(self.path, mmap_mode='r')
+            else:
+                import mmap
+                with open(self.path, 'rb') as f:
+                    m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                value = memoryview(m)[self.offset:]
+            self._value = value
+        return value
+
+
+def _mmap_dir(path):
+    name = path if isinstance(path, (str, os.PathLike)) else getattr(
+        path, 'name', None
+    )
+    if not isinstance(name, (str, os.PathLike)):
+        raise ValueError('Memory-mapped values need a file name.')
+    return '%s.mmap' % os.fspath(name)
+
+
+def save_default_values(dsp, path, mmap_size=None):
     """
     Write Dispatcher default values in Python pickle format.
 
@@ -101,9 +339,15 @@ def save_default_values(dsp, path):
 
     :param path:
         File or filename to write.
-        File names ending in .gz or .bz2 will be compressed.
+        File names ending in .gz, .bz2, .xz, or .zst will be compressed.
     :type path: str, file
 
+    :param mmap_size:
+        Minimum size in bytes of the numpy arrays that are saved as `.npy`
+        files in the folder `<path>.mmap` and loaded as :class:`MemoryMap`.
+        If None, all values are pickled.
+    :type mmap_size: int, optional
+
     .. testsetup::
         >>> from tempfile import mkstemp
         >>> file_name = mkstemp()[1]
@@ -119,8 +363,23 @@ def save_default_values(dsp, path):
         >>> save_default_values(dsp, file_name)
     """
     import dill
-    with open(path, 'wb') as f:
-        dill.dump(dsp.default_values, f)
+    dfl = dsp.default_values
+    if mmap_size is not None:
+        dfl, folder = dfl.copy(), _mmap_dir(path)
+        items = sorted(dfl.items(), key=lambda x: str(x[0]))
+        for i, (k, v) in enumerate(items):
+            value = v['value']
+            if getattr(value, 'nbytes', -1) >= mmap_size and \
+                    getattr(value, 'dtype', object) != object:
+                import numpy as np
+                os.makedirs(folder, exist_ok=True)
+                fn = '%d.npy' % i
+                np.save(osp.join(folder, fn), value)
+                # Relative to the folder of `path`.
+                fn = '/'.join((osp.basename(folder), fn))
+                dfl[k] = dict(v, value=MemoryMap(fn))
+    with open_file(path, 'wb') as f:
+        dill.dump(dfl, f)
 
 
 def load_default_values(dsp, path):
@@ -136,7 +395,7 @@ def load_default_values(dsp, path):
 
     :param path:
         File or filename to write.
-        File names ending in .gz or .bz2 will be uncompressed.
+        File names ending in .gz, .bz2, .xz, or .zst will be uncompressed.
     :type path: str, file
 
     .. testsetup::
@@ -157,11 +416,34 @@ def load_default_values(dsp, path):
         >>> load_default_values(dsp, file_name)
         >>> dsp.dispatch(inputs={'b': 3})['c']
         3
+
+    Large arrays can be loaded as memory-mapped values::
+
+        >>> import numpy as np
+        >>> dsp.add_data('d', default_value=np.arange(1000))
+        'd'
+        >>> dsp.add_function(function=np.sum, inputs=['d'], outputs=['e'])
+        'sum'
+        >>> save_default_values(dsp, file_name, mmap_size=1000)
+        >>> load_default_values(dsp, file_name)
+        >>> dsp.default_values['d']['value']
+        MemoryMap('...mmap/1.npy')
+        >>> int(dsp.dispatch(inputs={'b': 3})['e'])
+        499500
     """
     import dill
     # noinspection PyArgumentList
-    with open(path, 'rb') as f:
-        dsp.__init__(dmap=dsp.dmap, default_values=dill.load(f))
+    with open_file(path, 'rb') as f:
+        dfl = dill.load(f)
+    for k, v in dfl.items():
+        value = v['value']
+        if isinstance(value, MemoryMap) and not osp.isabs(value.path):
+            base = osp.dirname(_mmap_dir(path))
+            dfl[k] = dict(v, value=MemoryMap(
+                osp.join(base, value.path), value.dtype, value.shape,
+                value.offset
+            ))
+    dsp.__init__(dmap=dsp.dmap, default_values=dfl)
 
 
 def save_map(dsp, path):
@@ -177,7 +459,7 @@ def save_map(dsp, path):
 
     :param path:
         File or filename to write.
-        File names ending in .gz or .bz2 will be compressed.
+        File names ending in .gz, .bz2, .xz, or .zst will be compressed.
     :type path: str, file
 
     .. testsetup::
@@ -193,7 +475,7 @@ def save_map(dsp, path):
         >>> save_map(dsp, file_name)
     """
     import dill
-    with open(path, 'wb') as f:
+    with open_file(path, 'wb') as f:
         dill.dump(dsp.dmap, f)
 
 
@@ -207,7 +489,7 @@ def load_map(dsp, path):
 
     :param path:
         File or filename to write.
-        File names ending in .gz or .bz2 will be uncompressed.
+        File names ending in .gz, .bz2, .xz, or .zst will be uncompressed.
     :type path: str, file
 
     .. testsetup::
@@ -228,5 +510,82 @@ def load_map(dsp, path):
         3
     """
     import dill
-    with open(path, 'rb') as f:
+    with open_file(path, 'rb') as f:
         dsp.__init__(dmap=dill.load(f), default_values=dsp.default_values)
+
+
+def save_pipe(pipe, path):
+    """
+    Write a compiled pipe in Python pickle format.
+
+    The pickle contains the shrunk dispatcher and the computed pipe order, so
+    that :func:`load_pipe` returns a ready callable without any planning step
+    (i.e., dispatch, workflow union, and shrink).
+
+    :param pipe:
+        A compiled pipe.
+    :type pipe: schedula.utils.dsp.SubDispatchPipe
+
+    :param path:
+        File or filename to write.
+        File names ending in .gz, .bz2, .xz, or .zst will be compressed.
+    :type path: str, file
+
+    .. testsetup::
+        >>> from tempfile import mkstemp
+        >>> file_name = mkstemp()[1]
+
+    Example::
+
+        >>> from schedula import Dispatcher, SubDispatchPipe
+        >>> dsp = Dispatcher()
+        >>> dsp.add_data('a', default_value=1)
+        'a'
+        >>> dsp.add_function(function=max, inputs=['a', 'b'], outputs=['c'])
+        'max'
+        >>> pipe = SubDispatchPipe(dsp, 'max', ['a', 'b'], ['c'])
+        >>> save_pipe(pipe, file_name)
+    """
+    from ..dsp import SubDispatchPipe
+    if not isinstance(pipe, SubDispatchPipe):
+        raise TypeError('Expected a SubDispatchPipe, got %r.' % type(pipe))
+    import dill
+    with open_file(path, 'wb') as f:
+        dill.dump(pipe, f)
+
+
+def load_pipe(path):
+    """
+    Load a compiled pipe in Python pickle format.
+
+    :param path:
+        File or filename to read.
+        File names ending in .gz, .bz2, .xz, or .zst will be uncompressed.
+    :type path: str, file
+
+    :return:
+        A compiled pipe.
+    :rtype: schedula.utils.dsp.SubDispatchPipe
+
+    .. testsetup::
+        >>> from tempfile import mkstemp
+        >>> file_name = mkstemp()[1]
+
+    Example::
+
+        >>> from schedula import Dispatcher, SubDispatchPipe
+        >>> dsp = Dispatcher()
+        >>> dsp.add_data('a', default_value=1)
+        'a'
+        >>> dsp.add_function(function=max, inputs=['a', 'b'], outputs=['c'])
+        'max'
+        >>> save_pipe(SubDispatchPipe(dsp, 'max', ['a', 'b'], ['c']), file_name)
+
+        >>> pipe = load_pipe(file_name)
+        >>> pipe(b=3)
+        3
+    """
+    import dill
+    # noinspection PyArgumentList
+    with open_file(path, 'rb') as f:
+        return dill.load(f)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It provides an append-only store to checkpoint and resume a dispatch.
+
+The store is a local file of consecutive `dill` records. The first record is
+a header with the dispatch arguments and the model fingerprint, the others are
+the `(solution index, node id)` keys and the results of the evaluated nodes.
+A record that is truncated by a killed process is discarded on resume.
+
+Classes:
+
+.. autosummary::
+    :nosignatures:
+    :toctree: ckpt/
+
+    Checkpoint
+"""
+import os
+import time
+import logging
+import threading
+
+__author__ = 'Vincenzo Arcidiacono <vinci1it2000@gmail.com>'
+
+log = logging.getLogger(__name__)
+
+#: Identifier of the checkpoint format.
+FORMAT = 'schedula-checkpoint'
+
+#: Version of the checkpoint format.
+VERSION = 1
+
+
+class Checkpoint:
+    """
+    An append-only store of the node results of a dispatch.
+
+    It is created by :func:`~schedula.utils.sol.Solution.checkpoint`. The
+    results are pickled when they are added and written to the file every
+    `nodes` results or `seconds` seconds.
+
+    :param path:
+        File name of the store.
+    :type path: str
+
+    :param nodes:
+        Number of results to buffer before writing them.
+    :type nodes: int, optional
+
+    :param seconds:
+        Maximum number of seconds between two writes.
+    :type seconds: float, optional
+
+    Example:
+
+    .. testsetup::
+        >>> import os
+        >>> from tempfile import mkstemp
+        >>> fd, path = mkstemp()
+        >>> os.close(fd)
+
+    Write a store and reopen it to resume:
+
+        >>> ckpt = Checkpoint(path).start({'dispatch': {'inputs': {'a': 1}}})
+        >>> ckpt.append(((-1,), 'f'), 2)
+        >>> ckpt = Checkpoint.open(path)
+        >>> ckpt.header['dispatch'], ckpt.results
+        ({'inputs': {'a': 1}}, {((-1,), 'f'): 2})
+
+    .. testcleanup::
+        >>> os.remove(path)
+    """
+
+    def __init__(self, path, nodes=1, seconds=None):
+        #: File name of the store.
+        self.path = os.fspath(path)
+
+        #: Number of results to buffer before writing them.
+        self.nodes = max(int(nodes or 1), 1)
+
+        #: Maximum number of seconds between two writes.
+        self.seconds = seconds
+
+        #: Header of the store.
+        self.header = None
+
+        #: Logged results to be replayed.
+        self.results = {}
+
+        self._buffer, self._lock = [], threading.Lock()
+        self._time = time.monotonic()
+
+    def start(self, header):
+        """
+        Creates a new store with the given header.
+
+        :param header:
+            Header of the store.
+        :type header: dict
+
+        :return:
+            Self.
+        :rtype: Checkpoint
+        """
+        import dill
+        self.header = dict(header, format=FORMAT, version=VERSION)
+        with open(self.path, 'wb') as f:
+            dill.dump(self.header, f)
+        return self
+
+    @classmethod
+    def open(cls, path, nodes=1, seconds=None):
+        """
+        Reads an existing store to replay its results and append new ones.
+
+        :param path:
+            File name of the store.
+        :type path: str
+
+        :param nodes:
+            Number of results to buffer before writing them.
+        :type nodes: int, optional
+
+        :param seconds:
+            Maximum number of seconds between two writes.
+        :type seconds: float, optional
+
+        :return:
+            The store with the logged results to be replayed.
+        :rtype: Checkpoint
+        """
+        import dill
+        self = cls(path, nodes, seconds)
+        with open(self.path, 'r+b') as f:
+            try:
+                header = dill.load(f)
+                if header.get('format') != FORMAT or \
+                        header.get('version', 0) > VERSION:
+                    raise ValueError
+            except Exception:
+                raise ValueError('Unsupported format of %r.' % path)
+            results, offset = self.results, f.tell()
+            while True:
+                try:
+                    key, value = dill.load(f)
+                except Exception:  # End of file or record truncated by a kill.
+                    break
+                results[key], offset = value, f.tell()
+            f.truncate(offset)  # New results follow the last complete record.
+        self.header = header
+        return self
+
+    def __contains__(self, key):
+        return key in self.results
+
+    def pop(self, key):
+        """
+        Removes and returns a logged result to be replayed.
+
+        :param key:
+            Solution index and node id.
+        :type key: (tuple, str)
+
+        :return:
+            Logged result.
+        :rtype: object
+        """
+        return self.results.pop(key)
+
+    def append(self, key, value):
+        """
+        Adds a node result to the store.
+
+        The results that cannot be pickled are not stored.
+
+        :param key:
+            Solution index and node id.
+        :type key: (tuple, str)
+
+        :param value:
+            Node result.
+        :type value: object
+        """
+        import dill
+        try:
+            data = dill.dumps((key, value))
+        except Exception as ex:
+            log.warning('Checkpoint skips %r due to:\n  %r', key[-1], ex)
+            return
+        with self._lock:
+            self._buffer.append(data)
+            if len(self._buffer) >= self.nodes or (
+                    self.seconds is not None and
+                    time.monotonic() - self._time >= self.seconds):
+                self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            with open(self.path, 'ab') as f:
+                f.write(b''.join(self._buffer))
+            self._buffer.clear()
+        self._time = time.monotonic()
+
+    def flush(self):
+        """
+        Writes the buffered results.
+        """
+        with self._lock:
+            self._flush()
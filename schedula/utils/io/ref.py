@@ -0,0 +1,583 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It provides the `ref` format to save a dispatcher by import references.
+
+The model structure (i.e., nodes, edges, attributes, and default values) is
+written as compact JSON. The importable objects (e.g., module functions,
+classes, and constants) are written as `module:qualname` references. The other
+objects (e.g., closures, lambdas, and numpy arrays) are pickled with `dill`
+one by one into a side file (i.e., `<path>.dill`).
+
+The references are written once in an object table and the node ids once per
+dispatcher. The node attributes are stored as columns (i.e., type codes,
+indices, and functions with the positions of their inputs and outputs), and
+the edges as positions of the target nodes.
+
+Classes:
+
+.. autosummary::
+    :nosignatures:
+    :toctree: ref/
+
+    LazyFunction
+"""
+import gc
+import io
+import ast
+import json
+import inspect
+import functools
+import importlib
+import os
+import sys
+import os.path as osp
+from ..gen import counter, _Token
+
+__author__ = 'Vincenzo Arcidiacono <vinci1it2000@gmail.com>'
+
+#: Identifier of the `ref` format.
+FORMAT = 'schedula-ref'
+
+#: Version of the `ref` format.
+VERSION = 2
+
+
+def side_path(path):
+    """
+    Returns the path of the side file that stores the pickled objects.
+
+    The side file is compressed like the model structure file.
+
+    :param path:
+        File or file name of the model structure.
+    :type path: str, file
+
+    :return:
+        File name of the side file or None if `path` has no name.
+    :rtype: str | None
+
+    Example::
+
+        >>> side_path('model.json'), side_path('model.json.gz')
+        ('model.json.dill', 'model.json.dill.gz')
+    """
+    from . import get_codec
+    if not isinstance(path, (str, os.PathLike)):
+        path = getattr(path, 'name', None)
+        if not isinstance(path, str):
+            return None
+    path = os.fspath(path)
+    if get_codec(path):
+        return '%s.dill%s' % osp.splitext(path)
+    return '%s.dill' % path
+
+
+def import_ref(ref):
+    """
+    Returns the object of a `module:qualname` reference.
+
+    :param ref:
+        Import reference.
+    :type ref: str
+
+    :return:
+        Referenced object.
+    :rtype: object
+
+    Example::
+
+        >>> import_ref('builtins:max')
+        <built-in function max>
+        >>> import_ref('schedula.utils.cst:SINK')
+        sink
+    """
+    module, _, qualname = ref.partition(':')
+    try:  # Fast path, the modules are mostly imported already.
+        obj = sys.modules[module]
+    except KeyError:
+        obj = importlib.import_module(module)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    return obj
+
+
+def get_ref(obj):
+    """
+    Returns the `module:qualname` reference of an importable object.
+
+    :param obj:
+        Object to be referenced.
+    :type obj: object
+
+    :return:
+        Import reference or None if the object cannot be imported by reference.
+    :rtype: str | None
+
+    Example::
+
+        >>> get_ref(max)
+        'builtins:max'
+        >>> get_ref(lambda x: x) is None
+        True
+    """
+    if isinstance(obj, _Token):
+        module = obj.module_name
+        try:
+            names = importlib.import_module(module).__dict__.items()
+            qualname = next(k for k, v in names if v is obj)
+        except (ImportError, TypeError, StopIteration):
+            return None
+    else:
+        try:
+            module, qualname = obj.__module__, obj.__qualname__
+        except AttributeError:
+            return None
+    if not isinstance(module, str) or not isinstance(qualname, str) or \
+            module == '__main__' or '<' in qualname:
+        return None
+    ref = '%s:%s' % (module, qualname)
+    try:
+        if import_ref(ref) is obj:
+            return ref
+    except Exception:  # Not importable.
+        pass
+    return None
+
+
+class LazyFunction:
+    """
+    A proxy that resolves a function on its first call.
+
+    It is used by :func:`~schedula.utils.io.load_dispatcher` with `lazy=True`.
+
+    :param ref:
+        Import reference of the function.
+    :type ref: str, optional
+
+    :param loader:
+        A function without arguments that returns the function. It is used
+        when `ref` is None.
+    :type loader: callable, optional
+
+    Example::
+
+        >>> func = LazyFunction('builtins:max')
+        >>> func
+        LazyFunction('builtins:max')
+        >>> func(1, 2), func.func
+        (2, <built-in function max>)
+    """
+    __slots__ = ('ref', '_loader', '_func', '__weakref__')
+
+    def __init__(self, ref=None, loader=None):
+        #: Import reference of the function.
+        self.ref = ref
+        self._loader, self._func = loader, None
+
+    @property
+    def func(self):
+        """
+        Resolved function.
+
+        :rtype: callable
+        """
+        func = self._func
+        if func is None:
+            if self._loader is None:
+                func = import_ref(self.ref)
+            else:
+                func = self._loader()
+            self._func, self._loader = func, None
+        return func
+
+    @property
+    def __signature__(self):
+        return inspect.signature(self.func)
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def __getattr__(self, item):
+        return getattr(self.func, item)
+
+    def __reduce__(self):
+        return _identity, (self.func,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        if self.ref is not None:
+            obj = repr(self.ref)
+        elif self._func is None:
+            obj = '<not loaded>'
+        else:
+            obj = repr(self._func)
+        return '%s(%s)' % (self.__class__.__name__, obj)
+
+
+def _identity(obj):
+    return obj
+
+
+def _counter_args(c):
+    # `itertools.count` supports neither copy nor pickle from Python 3.14.
+    args = ast.literal_eval(repr(c.__self__)[len('count'):])
+    return list(args) if isinstance(args, tuple) else [args]
+
+
+#: Node types and their codes (upper case if the node waits all inputs).
+_TYPES = {'data': 'd', 'function': 'f', 'dispatcher': 's'}
+_CODES = {c: (k, w) for k, v in _TYPES.items() for c, w in (
+    (v, False), (v.upper(), True)
+)}
+
+
+class _Encoder:
+    def __init__(self):
+        self.objects, self.dispatchers, self.memo = [], [], {}
+        self.values, self.functions = [], []
+
+    def __call__(self, obj):
+        t = type(obj)
+        if obj is None or t in (str, int, float, bool):
+            return obj
+        elif t is list:
+            return [self(v) for v in obj]
+        elif t is tuple:
+            return {'$t': [self(v) for v in obj]}
+        elif t is dict:
+            if all(type(k) is str and k[:1] != '$' for k in obj):
+                return {k: self(v) for k, v in obj.items()}
+            return {'$d': [[self(k), self(v)] for k, v in obj.items()]}
+        return {'$': self.index(obj)}
+
+    def index(self, obj):
+        """Returns the position of an object in the object table."""
+        try:
+            return self.memo[id(obj)][1]
+        except KeyError:
+            pass
+        i = len(self.objects)
+        self.objects.append(None)
+        self.memo[id(obj)] = obj, i  # Keeps `obj` alive to reserve the id.
+        from ...dispatcher import Dispatcher
+        if isinstance(obj, Dispatcher):
+            self.objects[i] = {
+                '$dsp': len(self.dispatchers), 'class': self.entry(type(obj))
+            }
+            self.dispatchers.append(None)
+            self.dispatchers[self.objects[i]['$dsp']] = self.dispatcher(obj)
+        else:
+            self.objects[i] = self.entry(obj)
+        return i
+
+    def entry(self, obj):
+        """
+        Returns the object table entry of an object that is not a dispatcher.
+
+        Functions are `module:qualname` strings, the other importable objects
+        are lists with the reference, while the others are pickled apart.
+        """
+        if isinstance(obj, LazyFunction) and obj.ref is not None:
+            return obj.ref
+        ref, call = get_ref(obj), inspect.isroutine(obj)
+        if ref is not None:
+            return ref if call else [ref]
+        elif call:  # Functions are pickled apart to be loaded lazily.
+            self.functions.append(obj)
+            return {'$fun': len(self.functions) - 1}
+        self.values.append(obj)
+        return {'$obj': len(self.values) - 1}
+
+    def _node(self, k, attr, pos):
+        # Returns the type code, the index, the function column, and the
+        # attributes not stored in the columns.
+        t = _TYPES.get(attr.get('type'))
+        wait, index = attr.get('wait_inputs'), attr.get('index')
+        if t is None or type(wait) is not bool:
+            return '?', None, None, attr
+        extra = {k: v for k, v in attr.items() if k not in (
+            'type', 'wait_inputs', 'index', 'function', 'inputs', 'outputs'
+        )}
+        if not (type(index) is tuple and len(index) == 1 and
+                type(index[0]) is int):
+            extra['index'], index = index, None
+        func, column = attr.get('function'), None
+        if t == 'd':
+            if 'function' in attr:
+                extra['function'] = func
+        elif func is None or type(func) in (str, int, float, bool):
+            return '?', None, None, attr
+        elif t == 'f':
+            io = [attr.get('inputs'), attr.get('outputs')]
+            if not all(type(v) is list and all(
+                    type(i) is str and i in pos for i in v) for v in io):
+                return '?', None, None, attr
+            column = [self.index(func)] + [[pos[i] for i in v] for v in io]
+        else:
+            column = self.index(func)
+            extra.update(
+                (k, attr[k]) for k in ('inputs', 'outputs') if k in attr
+            )
+        return t.upper() if wait else t, index, column, extra
+
+    def dispatcher(self, dsp):
+        state = dsp.__getstate__()
+        dmap, dfl = state.pop('dmap'), state.pop('default_values')
+        nodes, succ = dmap.nodes, dmap.succ
+        pos = {k: i for i, k in enumerate(nodes)}
+        sol, count = state.pop('solution'), state.pop('counter')
+        try:
+            count = _counter_args(count)
+        except (AttributeError, SyntaxError, ValueError):
+            count = self(count)
+
+        # Node attributes as columns, the node ids are stored once.
+        types, index, functions, extra, last = [], [], [], [], 0
+        for i, (k, attr) in enumerate(nodes.items()):
+            t, idx, column, other = self._node(k, attr, pos)
+            types.append(t)
+            if idx is None:
+                index.append(None)
+            else:  # Indices are mostly consecutive, deltas are short.
+                index.append(idx[0] - last)
+                last = idx[0]
+            if column is not None:
+                functions.append(column)
+            if other:
+                extra.append([i, self(other)])
+
+        if all(k in pos for k in dfl):
+            dfl = [
+                [pos[k], self(v['value'])] + (
+                    [v['initial_dist']] if v.get('initial_dist') else []
+                ) for k, v in dfl.items()
+            ]
+        else:
+            dfl = self(dfl)
+        return {
+            'solution': self.entry(type(sol)),
+            'counter': count,
+            'state': self(state),
+            'ids': [k if type(k) is str else self(k) for k in nodes],
+            'types': ''.join(types),
+            'index': index,
+            'functions': functions,
+            'extra': extra,
+            # Edges as positions of the target nodes, plus the attributes.
+            'succ': [[
+                [pos[v], self(e)] if e else pos[v] for v, e in succ[k].items()
+            ] for k in nodes],
+            'default_values': dfl
+        }
+
+
+class _Decoder:
+    def __init__(self, values, functions, lazy):
+        self.values, self._functions = values, functions
+        self.lazy, self.objects, self.dispatchers = lazy, [], []
+
+    @property
+    def functions(self):
+        functions = self._functions
+        if isinstance(functions, bytes):  # Pickled functions of a lazy load.
+            import dill
+            self._functions = functions = dill.loads(functions)
+        return functions
+
+    def _function(self, i):
+        return self.functions[i]
+
+    def __call__(self, obj):  # Used as `object_hook` of `json.loads`.
+        if len(obj) != 1:
+            return obj
+        key = next(iter(obj))
+        if key == '$':
+            return self.objects[obj['$']]
+        elif key == '$t':
+            return tuple(obj['$t'])
+        elif key == '$d':
+            return dict(obj['$d'])
+        elif key == '$o':  # Object table, it is parsed before its uses.
+            self.objects = [self.entry(e) for e in obj['$o']]
+        return obj
+
+    def entry(self, e):
+        t = type(e)
+        if t is str:
+            return LazyFunction(e) if self.lazy else import_ref(e)
+        elif t is list:
+            return import_ref(e[0])
+        elif '$fun' in e:
+            if self.lazy:
+                return LazyFunction(loader=functools.partial(
+                    self._function, e['$fun']
+                ))
+            return self.functions[e['$fun']]
+        elif '$obj' in e:
+            return self.values[e['$obj']]
+        cls = self.entry(e['class'])
+        res = cls.__new__(cls)
+        self.dispatchers.append(res)
+        return res
+
+    def _nodes(self, d):
+        ids, objects, nodes, index = d['ids'], self.objects, {}, 0
+        extra, funcs = dict(d['extra']), iter(d['functions'])
+        get_id = ids.__getitem__
+        for i, (k, t, delta) in enumerate(zip(ids, d['types'], d['index'])):
+            if t == '?':
+                nodes[k] = extra[i]
+                continue
+            node_type, wait = _CODES[t]
+            if delta is None:
+                attr = {'type': node_type, 'wait_inputs': wait}
+            else:
+                index += delta
+                attr = {
+                    'type': node_type, 'wait_inputs': wait, 'index': (index,)
+                }
+            if node_type == 'data':
+                pass
+            elif node_type == 'function':
+                f, inputs, outputs = next(funcs)
+                attr['inputs'] = list(map(get_id, inputs))
+                attr['outputs'] = list(map(get_id, outputs))
+                attr['function'] = objects[f]
+            else:
+                attr['function'] = objects[next(funcs)]
+            if extra and i in extra:
+                attr.update(extra[i])
+            nodes[k] = attr
+        return nodes
+
+    def _graph(self, d):
+        from ..graph import DiGraph
+        g = DiGraph()
+        g.nodes = nodes = self._nodes(d)
+        ids = list(nodes)
+        g.succ = succ = {}
+        g.pred = pred = {k: {} for k in ids}
+        for u, edges in zip(ids, d['succ']):
+            succ[u] = adj = {}
+            for v in edges:  # The edges without attributes are positions.
+                if type(v) is list:
+                    v, e = ids[v[0]], v[1]
+                else:
+                    v, e = ids[v], {}
+                adj[v] = pred[v][u] = e
+        return g, ids
+
+    def load(self, data):
+        # Sub-dispatchers are listed after their parents.
+        items = list(zip(self.dispatchers, data['dispatchers']))
+        for dsp, d in reversed(items):
+            dmap, ids = self._graph(d)
+            dfl = d['default_values']
+            if type(dfl) is list:
+                dfl = {ids[v[0]]: {
+                    'value': v[1], 'initial_dist': v[2] if len(v) > 2 else 0.0
+                } for v in dfl}
+            count = d['counter']
+            state = d['state']
+            state.update({
+                'dmap': dmap,
+                'counter': counter(*count) if type(count) is list else count,
+                'default_values': dfl, 'solution': None
+            })
+            dsp.__setstate__(state)
+            dsp.solution = self.entry(d['solution'])(dsp)
+        return self.objects[data['root']]
+
+
+def save(dsp, path):
+    """
+    Write Dispatcher object in `ref` format.
+
+    :param dsp:
+        A dispatcher that identifies the model adopted.
+    :type dsp: schedula.Dispatcher
+
+    :param path:
+        File or file name to write.
+    :type path: str, file
+    """
+    from . import open_file
+    encode = _Encoder()
+    root = encode.index(dsp)
+    data = {
+        'format': FORMAT, 'version': VERSION,
+        'objects': {'$o': encode.objects}, 'root': root,
+        'dispatchers': encode.dispatchers
+    }
+    side = side_path(path)
+    if side is None and (encode.values or encode.functions):
+        raise ValueError(
+            'The `ref` format needs a file name to pickle the objects that '
+            'cannot be imported.'
+        )
+    with open_file(path, 'wb') as f:
+        t = io.TextIOWrapper(f, encoding='utf-8')
+        json.dump(data, t, separators=(',', ':'))
+        t.flush()
+        t.detach()  # Leaves the binary file open.
+
+    if encode.values or encode.functions:
+        import dill
+        with open_file(side, 'wb') as f:  # Two streams, functions are lazy.
+            dill.dump(encode.values, f)
+            dill.dump(encode.functions, f)
+    elif side and osp.isfile(side):  # Stale objects of a previous save.
+        os.remove(side)
+
+
+def load(f, path, lazy=False):
+    """
+    Load Dispatcher object in `ref` format.
+
+    :param f:
+        Readable binary file of the model structure.
+    :type f: io.IOBase
+
+    :param path:
+        File or file name of the model structure.
+    :type path: str, file
+
+    :param lazy:
+        If True, the functions are resolved on their first call.
+    :type lazy: bool, optional
+
+    :return:
+        A dispatcher that identifies the model adopted.
+    :rtype: schedula.Dispatcher
+    """
+    from . import open_file
+    values = functions = None
+    side = side_path(path)
+    if side and osp.isfile(side):
+        import dill
+        with open_file(side, 'rb') as sf:
+            values = dill.load(sf)
+            functions = sf.read() if lazy else dill.load(sf)
+    decoder = _Decoder(values, functions, lazy)
+    enabled = gc.isenabled()
+    gc.disable()  # The many new containers would trigger useless collections.
+    try:
+        data = json.loads(f.read(), object_hook=decoder)
+        if data.get('format') != FORMAT or data.get('version') != VERSION:
+            raise ValueError('Unsupported format of %r.' % path)
+        return decoder.load(data)
+    finally:
+        if enabled:
+            gc.enable()
@@ -0,0 +1,413 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It provides functions and classes to profile the node evaluations of a
+dispatch.
+
+Classes:
+
+.. autosummary::
+    :nosignatures:
+    :toctree: prf/
+
+    Profile
+"""
+import os
+import sys
+import threading
+import tracemalloc
+
+__author__ = 'Vincenzo Arcidiacono <vinci1it2000@gmail.com>'
+
+
+def sizeof(obj):
+    """
+    Returns a shallow estimate of the memory size of an object.
+
+    The size of the pandas objects is given by their `memory_usage`, and the
+    size of the objects with a `nbytes` attribute (e.g., numpy arrays) is the
+    size of their data. The size of a container includes the size of its
+    items, but not the size of the nested containers.
+
+    :param obj:
+        Object to be measured.
+    :type obj: object
+
+    :return:
+        Size in bytes.
+    :rtype: int
+
+    Example::
+
+        >>> import numpy as np
+        >>> sizeof(np.zeros(10)), sizeof([1, 2]) > sizeof([])
+        (80, True)
+    """
+    try:  # Pandas objects.
+        size = obj.memory_usage(deep=True)
+        return int(getattr(size, 'sum', lambda: size)())
+    except (AttributeError, TypeError, ValueError):
+        pass
+    try:
+        return int(obj.nbytes)
+    except (AttributeError, TypeError, ValueError):
+        pass
+    getsize, size = sys.getsizeof, sys.getsizeof(obj, 0)
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(getsize(v, 0) for v in obj)
+    elif isinstance(obj, dict):
+        size += sum(getsize(k, 0) + getsize(v, 0) for k, v in obj.items())
+    return size
+
+
+def rss():
+    """
+    Returns the resident set size of the current process.
+
+    :return:
+        Resident set size in bytes or None if it cannot be measured.
+    :rtype: int | None
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError, IndexError):
+        return None
+
+
+class _MemoryTracer:
+    # Measures the peak and net memory allocated during the node evaluations
+    # with tracemalloc. The traced peak is reset at each node start and end,
+    # after being folded into all the running nodes. Thus, it is correct for
+    # nested evaluations, while the allocations of concurrent threads are
+    # attributed to all the running nodes.
+    def __init__(self):
+        self.running, self.started, self.lock = {}, False, threading.Lock()
+
+    def _fold(self):
+        current, peak = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+.
+            for r in self.running.values():
+                r[2] = max(r[2], peak)
+            tracemalloc.reset_peak()
+        return current
+
+    def start(self, attr):
+        with self.lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.started = True
+            current = self._fold()
+            self.running[id(attr)] = [attr, current, current]
+
+    def stop(self, attr):
+        with self.lock:
+            if id(attr) not in self.running:
+                return
+            current = self._fold()
+            _, start, peak = self.running.pop(id(attr))
+            attr['memory_net'] = current - start
+            if hasattr(tracemalloc, 'reset_peak'):
+                attr['memory_peak'] = max(peak - start, 0)
+            if not self.running and self.started:
+                tracemalloc.stop()
+                self.started = False
+
+
+_memory_tracer = _MemoryTracer()
+
+
+def _records(sol, records):
+    # Appends the evaluated nodes of the solution and returns their total time.
+    groups, total = {}, 0
+    for s in sol.sub_sol.values():
+        wf_nodes, nodes = s.workflow.nodes, s.nodes
+        for k, attr in wf_nodes.items():
+            if 'duration' not in attr:  # Not evaluated.
+                continue
+            start, wall = attr['started'], attr['duration']
+            typ = nodes.get(k, {}).get('type', 'function')
+            if 'memory_size' in attr:
+                size = attr['memory_size']
+            elif 'results' in attr:
+                size = sizeof(attr['results'])
+            else:
+                size = sizeof(s[k]) if k in s else 0
+            r = {
+                'path': s.full_name + (k,), 'type': typ,
+                'self': wall, 'wall': wall, 'size': size, 'start': start,
+                'wait': max(start - attr.get('queued', start), 0),
+                'peak': attr.get('memory_peak', 0),
+                'net': attr.get('memory_net', 0)
+            }
+            records.append(r)
+            total += wall
+            if 'solution' in attr:  # Sub-dispatch function.
+                r['self'] = max(wall - _records(attr['solution'], records), 0)
+
+            # Sub-dispatcher nodes.
+            for i in range(len(sol.full_name) + 1, len(s.full_name) + 1):
+                g = s.full_name[:i]
+                if g not in groups:
+                    groups[g] = {
+                        'path': g, 'type': 'dispatcher', 'self': 0, 'wall': 0,
+                        'size': 0, 'wait': 0, 'start': start, 'peak': 0,
+                        'net': 0
+                    }
+                g = groups[g]
+                g['wall'] += wall
+                g['net'] += r['net']
+                g['peak'] = max(g['peak'], r['peak'])
+                g['start'] = min(g['start'], start)
+    records.extend(groups.values())
+    return total
+
+
+def _trace(sol, events, flows):
+    # Appends the trace events of the solution and the flows between them.
+    for s in sol.sub_sol.values():
+        cat = '/'.join(map(str, s.full_name)) or 'main'
+        wf, evs = s.workflow, {}
+        for k, attr in wf.nodes.items():
+            if 'ended_ns' not in attr:  # Not evaluated.
+                continue
+            pid, tid = attr['thread']
+            t0, t1 = attr['started_ns'], attr['ended_ns']
+            if 'worker' in attr:  # Executed in a process.
+                pid, tid, t0, t1 = attr['worker'][:4]
+            evs[k] = ev = {
+                'name': str(k), 'cat': cat, 'ph': 'X', 'ts': t0,
+                'dur': t1 - t0, 'pid': pid, 'tid': tid, 'args': {
+                    'path': '/'.join(map(str, s.full_name + (k,))),
+                    'executor': attr.get('executor') or 'sync'
+                }
+            }
+            events.append(ev)
+            if 'solution' in attr:  # Sub-dispatch function.
+                _trace(attr['solution'], events, flows)
+
+        pred, nodes = wf.pred, s.nodes
+        for k, ev in evs.items():  # Flows along the workflow edges.
+            it = {}
+            for u in pred[k]:
+                if u in evs:  # The data node is `u` or `k`.
+                    data = k if nodes.get(k, {}).get('type') == 'data' else u
+                    it[u] = data
+                else:  # Data node without function.
+                    it.update((v, u) for v in pred[u] if v in evs)
+            flows.extend((evs[u], ev, d) for u, d in it.items())
+
+
+def trace_events(sol):
+    """
+    Returns the Trace Event Format data of a dispatch.
+
+    There is one complete event per evaluated node, with the node path as
+    name, the sub-dispatcher path as category, and the process and thread ids
+    that have executed the node. The flow events follow the workflow edges.
+    The timestamps are measured with :func:`time.perf_counter_ns`.
+
+    :param sol:
+        Dispatch solution run with `trace=True`.
+    :type sol: schedula.utils.sol.Solution
+
+    :return:
+        Trace data to be saved as JSON and opened by `chrome://tracing` or
+        `https://ui.perfetto.dev`.
+    :rtype: dict
+
+    Example::
+
+        >>> import schedula as sh
+        >>> dsp = sh.Dispatcher(name='model')
+        >>> dsp.add_func(lambda a: a + 1, ['b'], function_id='f')
+        'f'
+        >>> dsp.add_func(lambda b: b + 1, ['c'], function_id='g')
+        'g'
+        >>> events = trace_events(dsp({'a': 1}, trace=True))['traceEvents']
+        >>> [(e['ph'], e['name']) for e in events]
+        [('M', 'process_name'), ('X', 'f'), ('X', 'g'), ('s', 'b'),
+         ('f', 'b')]
+    """
+    import os
+    events, flows = [], []
+    _trace(sol, events, flows)
+    t = min((e['ts'] for e in events), default=0)
+    for e in events:
+        e['ts'], e['dur'] = (e['ts'] - t) / 1000, e['dur'] / 1000
+    for i, (u, v, data) in enumerate(flows):
+        name = str(data)
+        events.append({
+            'name': name, 'cat': u['cat'], 'ph': 's', 'id': i, 'bp': 'e',
+            'ts': u['ts'] + u['dur'], 'pid': u['pid'], 'tid': u['tid']
+        })
+        events.append({
+            'name': name, 'cat': u['cat'], 'ph': 'f', 'id': i, 'bp': 'e',
+            'ts': v['ts'], 'pid': v['pid'], 'tid': v['tid']
+        })
+    pid, meta = os.getpid(), []
+    for p in sorted({e['pid'] for e in events}):
+        meta.append({
+            'name': 'process_name', 'ph': 'M', 'pid': p, 'tid': 0,
+            'args': {'name': 'main' if p == pid else 'worker %d' % p}
+        })
+    return {'traceEvents': meta + events, 'displayTimeUnit': 'ms'}
+
+
+class Profile(list):
+    """
+    Table of the evaluation stats of the nodes of a dispatch.
+
+    It is created by :func:`~schedula.utils.sol.Solution.profile`. Each row
+    is a dictionary with the following columns:
+
+    - `name`: node path (i.e., `full_name`) joined by `/` or node id if flat,
+    - `type`: node type (i.e., `data`, `function`, or `dispatcher`),
+    - `count`: number of evaluations,
+    - `self`: time [s] spent in the node excluding its sub-dispatches,
+    - `wall`: time [s] spent in the node,
+    - `wait`: time [s] spent in the queue of the executor,
+    - `size`: size estimate [bytes] of the outputs (see :func:`sizeof`),
+    - `peak`: maximum peak memory [bytes] allocated by an evaluation,
+    - `net`: net memory [bytes] allocated by the evaluations.
+
+    The time of a sub-dispatcher node is the total time of its nodes. The
+    memory columns are zero if the dispatch is not run with
+    `memory_profile=True`, and they are shown by the text table only when
+    available, followed by a summary of the largest allocations.
+    """
+    #: Table columns.
+    columns = (
+        'name', 'type', 'count', 'self', 'wall', 'wait', 'size', 'peak', 'net'
+    )
+
+    @classmethod
+    def from_solution(cls, sol, sort='wall', top=None, flat=False):
+        """
+        Returns the profile table of a dispatch solution.
+
+        :param sol:
+            Dispatch solution.
+        :type sol: schedula.utils.sol.Solution
+
+        :param sort:
+            Column to sort the rows (numbers are in descending order). If None
+            the rows are in order of evaluation.
+        :type sort: str, optional
+
+        :param top:
+            Maximum number of rows.
+        :type top: int, optional
+
+        :param flat:
+            If True the stats are aggregated by node id, otherwise by node
+            path.
+        :type flat: bool, optional
+
+        :return:
+            Profile table.
+        :rtype: Profile
+        """
+        records, rows = [], {}
+        _records(sol, records)
+        for r in records:
+            path = r['path'][-1:] if flat else r['path']
+            try:
+                row = rows[path]
+            except KeyError:
+                rows[path] = row = {
+                    'name': '/'.join(map(str, path)),
+                    'type': r['type'], 'count': 0, 'self': 0, 'wall': 0,
+                    'wait': 0, 'size': 0, 'peak': 0, 'net': 0,
+                    'start': r['start']
+                }
+            row['count'] += 1
+            for k in ('self', 'wall', 'wait', 'size', 'net'):
+                row[k] += r[k]
+            row['peak'] = max(row['peak'], r['peak'])
+            row['start'] = min(row['start'], r['start'])
+        rows = sorted(rows.values(), key=lambda x: x.pop('start'))
+        if sort is not None:
+            if sort not in cls.columns:
+                raise ValueError('Invalid sort column %r.' % sort)
+            reverse = sort not in ('name', 'type')
+            rows.sort(key=lambda x: x[sort], reverse=reverse)
+        return cls(rows[:top])
+
+    def to_csv(self, path=None):
+        """
+        Exports the table in CSV format.
+
+        :param path:
+            File name to write. If None the CSV is returned.
+        :type path: str, optional
+
+        :return:
+            CSV text if `path` is None.
+        :rtype: str | None
+        """
+        import io
+        import csv
+        with io.StringIO(newline='') as f:
+            writer = csv.DictWriter(f, self.columns, lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(self)
+            text = f.getvalue()
+        if path is None:
+            return text
+        with open(path, 'w', newline='') as f:
+            f.write(text)
+
+    def to_json(self, path=None):
+        """
+        Exports the table in JSON format (i.e., a list of rows).
+
+        :param path:
+            File name to write. If None the JSON is returned.
+        :type path: str, optional
+
+        :return:
+            JSON text if `path` is None.
+        :rtype: str | None
+        """
+        import json
+        text = json.dumps(list(self))
+        if path is None:
+            return text
+        with open(path, 'w') as f:
+            f.write(text)
+
+    def __str__(self):
+        memory = any(r['peak'] or r['net'] for r in self)
+        cells = [('name', 'type', 'count', 'self [s]', 'wall [s]', 'wait [s]',
+                  'size [B]') + (('peak [B]', 'net [B]') if memory else ())]
+        for r in self:
+            cells.append((
+                r['name'], r['type'], str(r['count']), '%.6f' % r['self'],
+                '%.6f' % r['wall'], '%.6f' % r['wait'], str(r['size'])
+            ) + ((str(r['peak']), str(r['net'])) if memory else ()))
+        widths = [max(map(len, c)) for c in zip(*cells)]
+        lines = ['  '.join(
+            v.ljust(w) if i < 2 else v.rjust(w)
+            for i, (v, w) in enumerate(zip(c, widths))
+        ).rstrip() for c in cells]
+        if memory:  # Summary of the largest allocations.
+            lines.append('')
+            for k, label in (('peak', 'peak'), ('net', 'net'),
+                             ('size', 'output')):
+                r = max(self, key=lambda x: x[k])
+                lines.append('max %s memory: %d B (%s)' % (
+                    label, r[k], r['name']
+                ))
+        return '\n'.join(lines)
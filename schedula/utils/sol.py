@@ -7,20 +7,26 @@
 # You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
 
 """
-It provides a solution class for dispatch result.
+It provides the solution classes for dispatch results.
 """
 import time
 import logging
 import collections
 from .base import Base
-from .imp import finalize, Future
+from .imp import finalize, Future, getpid, get_ident, perf_counter_ns, Lock
 from .cst import START, NONE, PLOT
 from heapq import heappop, heappush
 from .dsp import stlp, get_nested_dicts, inf
 from .alg import get_full_pipe, _sort_sk_wait_in
-from .exc import DispatcherError, DispatcherAbort, SkipNode, ExecutorShutdown
-from .asy import async_thread, await_result, async_process, AsyncList, EXECUTORS
+from .exc import (
+    DispatcherError, DispatcherAbort, SkipNode, ExecutorShutdown,
+    DeadlineExceeded
+)
+from .asy import (
+    async_thread, await_result, async_process, AsyncList, EXECUTORS, load_lazy
+)
 from .utl import select_diff
+from .hook import HOOKS, fire
 
 log = logging.getLogger(__name__)
 
@@ -29,6 +35,29 @@ log = logging.getLogger(__name__)
 class Solution(Base, collections.OrderedDict):
     """Solution class for dispatch result."""
 
+    #: Precomputed node records of a frozen dispatcher.
+    _records = None
+
+    #: Store of the node results (see :func:`Solution.checkpoint`).
+    _checkpoint = None
+
+    #: Function called with the path and the value of the estimated data nodes
+    #: (see :class:`~schedula.utils.stream.DispatchStream`).
+    _stream = None
+
+    #: Record the memory allocated by the node evaluations?
+    memory_profile = False
+
+    #: Record the timeline of the node evaluations (see
+    #: :func:`Solution.export_trace`)?
+    trace = False
+
+    #: Time [s since the epoch] after which no new node is evaluated.
+    deadline = None
+
+    #: Targets not estimated because the deadline was exhausted.
+    missed = None
+
     def __hash__(self):
         return id(self)
 
@@ -77,6 +106,7 @@ class Solution(Base, collections.OrderedDict):
         self._pred = dsp.dmap.pred
         self._succ = dsp.dmap.succ
         self._edge_length = dsp._edge_length
+        self._records = getattr(dsp, '_records', None)
 
     def _set_inputs(self, inputs, initial_dist, excluded_defaults=()):
         excluded = set(excluded_defaults)
@@ -171,6 +201,8 @@ class Solution(Base, collections.OrderedDict):
             wait_in = self._wait_in.get(n_id, wait_in)
         if wait_in:
             wf = self.workflow.pred[n_id]
+            if self._records is not None:
+                return not all(k in wf for k in self._records[n_id].pred)
             return not all(k in wf for k in self._pred[n_id])
         return False
 
@@ -223,17 +255,11 @@ class Solution(Base, collections.OrderedDict):
 
         self._add_out_dsp_inputs()
 
-    def _close(self, cached_ids):
+    def _close(self):
         p = self.index[:-1]
         if p:
             p = self.sub_sol[p]
-            if self.index in cached_ids:
-                k = cached_ids[self.index]
-            else:
-                i = self.index[-1:]
-                k = next(k for k, v in p.nodes.items() if v['index'] == i)
-                cached_ids[self.index] = k
-            return all(i in p.dist for i in p.dmap[k])
+            return all(i in p.dist for i in p.dmap[self._get_dsp_id(p)])
         return False
 
     @staticmethod
@@ -280,6 +306,8 @@ class Solution(Base, collections.OrderedDict):
             from concurrent.futures import wait as wait_fut
             wait_fut(futs, timeout)
         EXECUTORS.set_active(id(self), False)
+        if self._checkpoint is not None:
+            self._checkpoint.flush()
         exceptions = Exception, ExecutorShutdown, DispatcherAbort, SkipNode
         for f, it in futs.items():
             try:
@@ -290,12 +318,110 @@ class Solution(Base, collections.OrderedDict):
                 for d, k in it:
                     if k in d:
                         del d[k]
-                if not ex:
-                    ex = isinstance(e, SkipNode) and e.ex or e
+                e = isinstance(e, SkipNode) and e.ex or e
+                if isinstance(e, DeadlineExceeded):  # Partial solution.
+                    self.missed = self.missed or set()
+                    self.missed.update(k for d, k in it if d is self)
+                elif not ex:
+                    ex = e
+        if self.missed is not None:
+            self._update_missed()
         if ex:
             raise ex
         return self
 
+    def checkpoint(self, path, nodes=1, seconds=None, _dispatch=None):
+        """
+        Logs the node results into an append-only store to resume the dispatch.
+
+        The results of the evaluated functions are logged while the dispatch
+        runs, the results of the nodes already evaluated are logged at once.
+        :func:`~schedula.dispatcher.Dispatcher.resume` replays the logged
+        results, without calling the functions, and continues the dispatch.
+
+        :param path:
+            File name of the store or a
+            :class:`~schedula.utils.io.ckpt.Checkpoint` to resume.
+        :type path: str | schedula.utils.io.ckpt.Checkpoint
+
+        :param nodes:
+            Number of evaluated nodes between two writes.
+        :type nodes: int, optional
+
+        :param seconds:
+            Maximum number of seconds between two writes.
+        :type seconds: float, optional
+
+        :return:
+            Self.
+        :rtype: Solution
+
+        Example:
+
+        .. testsetup::
+            >>> import os
+            >>> from tempfile import mkstemp
+            >>> fd, path = mkstemp()
+            >>> os.close(fd)
+
+            >>> import schedula as sh
+            >>> dsp = sh.Dispatcher()
+            >>> calls = []
+            >>> def f(a):
+            ...     calls.append(a)
+            ...     return a + 1
+            >>> dsp.add_func(f, ['b'])
+            'f'
+            >>> sol = dsp({'a': 1}).checkpoint(path)
+            >>> dsp.resume(path), calls
+            (Solution({'a': 1, 'b': 2}), [1])
+
+        .. testcleanup::
+            >>> os.remove(path)
+        """
+        from .io.ckpt import Checkpoint
+        if isinstance(path, Checkpoint):
+            ckpt = path
+            if ckpt.header.get('fingerprint') != self.dsp.fingerprint():
+                raise ValueError(
+                    'The checkpoint %r belongs to a different model.' %
+                    ckpt.path
+                )
+        else:
+            if _dispatch is None:
+                _dispatch = {
+                    'inputs': self.inputs, 'inputs_dist': self.inputs_dist,
+                    'outputs': list(self.outputs) or None,
+                    'wildcard': bool(self._wildcards), 'no_call': self.no_call,
+                    'rm_unused_nds': self.rm_unused_nds,
+                    '_wait_in': self._wait_in or None,
+                    'sol_name': self.full_name
+                }
+            ckpt = Checkpoint(path, nodes, seconds).start({
+                'fingerprint': self.dsp.fingerprint(), 'dispatch': _dispatch
+            })
+        for sol in self.sub_sol.values():
+            sol._checkpoint = ckpt
+            nodes = sol.nodes
+            for k, attr in sol.workflow.nodes.items():  # Evaluated nodes.
+                if 'results' in attr:
+                    self._log_checkpoint(ckpt, (sol.index, k), attr['results'])
+                elif k in sol and k in nodes and (
+                        'function' in nodes[k] or nodes[k].get('wait_inputs')):
+                    self._log_checkpoint(ckpt, (sol.index, k), sol[k])
+        return self
+
+    @staticmethod
+    def _log_checkpoint(ckpt, key, value):
+        if isinstance(value, Future):  # Logged when done.
+            def _append(fut):
+                if not (fut.cancelled() or fut.exception()):
+                    ckpt.append(key, fut.result())
+
+            value.add_done_callback(_append)
+        elif not isinstance(value, AsyncList):
+            ckpt.append(key, value)
+
     @staticmethod
     def _dsp_closed_add(dsp_closed, s):
         dsp_closed.add(s.index)
@@ -306,7 +432,7 @@ class Solution(Base, collections.OrderedDict):
 
     def _run(self, stopper=None, executor=False):
         # Initialized and terminated dispatcher sets.
-        dsp_closed, dsp_init, cached_ids = set(), {self.index}, {}
+        dsp_closed, dsp_init = set(), {self.index}
 
         # Reset function pipe.
         pipe = self._pipe = []
@@ -330,9 +456,8 @@ class Solution(Base, collections.OrderedDict):
                 continue
 
             # Close sub-dispatcher solution when all outputs are satisfied.
-            if sol._close(cached_ids):
+            if sol._close():
                 self._dsp_closed_add(dsp_closed, sol)
-                cached_ids.pop(sol.index)
                 continue
 
             dsp_init_add(sol.index)  # Update initialized dispatcher sets.
@@ -352,8 +477,23 @@ class Solution(Base, collections.OrderedDict):
         if self.rm_unused_nds:  # Remove unused func and sub-dsp nodes.
             self._remove_unused_nodes()
         self.fringe = None
+        if self.deadline is not None and any(
+                s.missed is not None for s in self.sub_sol.values()):
+            self.missed = self.missed or set()
+            self._update_missed()
         return self  # Data outputs.
 
+    def _update_missed(self):
+        missed = self.missed.union(self.outputs)
+        self.missed = {k for k in missed if k not in self}
+
+    def _skip_deadline(self, node_id, node_attr):
+        # Records the outputs of the node as missed.
+        if self.missed is None:
+            self.missed = set()
+        self.missed.update(node_attr.get('outputs', (node_id,)))
+        raise SkipNode(ex=DeadlineExceeded())
+
     def get_sub_dsp_from_workflow(self, sources, reverse=False,
                                   add_missing=False, check_inputs=True):
         """
@@ -396,6 +536,100 @@ class Solution(Base, collections.OrderedDict):
         """Returns the full pipe of a dispatch run."""
         return get_full_pipe(self)
 
+    def profile(self, sort='wall', top=None, flat=False):
+        """
+        Returns the evaluation stats of the nodes of the dispatch.
+
+        The stats are computed from the `started`, `duration`, and `queued`
+        attributes of the workflow nodes, hence no extra cost is paid when
+        the profile is not requested. The memory stats are available when the
+        dispatch is run with `memory_profile=True`.
+
+        :param sort:
+            Column to sort the rows (numbers are in descending order). If None
+            the rows are in order of evaluation.
+        :type sort: str, optional
+
+        :param top:
+            Maximum number of rows.
+        :type top: int, optional
+
+        :param flat:
+            If True the stats are aggregated by node id (e.g., the iterations
+            of a :class:`~schedula.utils.dsp.MapDispatch`), otherwise by node
+            path.
+        :type flat: bool, optional
+
+        :return:
+            Profile table.
+        :rtype: schedula.utils.prf.Profile
+
+        Example::
+
+            >>> import schedula as sh
+            >>> sub = sh.Dispatcher(name='sub')
+            >>> sub.add_func(lambda x: x + 1, ['y'], function_id='f')
+            'f'
+            >>> dsp = sh.Dispatcher(name='model')
+            >>> dsp.add_dispatcher(sub, {'a': 'x'}, {'y': 'b'}, 'sub')
+            'sub'
+            >>> dsp.add_function('f', sh.SubDispatchFunction(
+            ...     sub, 'f', ['x'], ['y']), ['b'], ['c'])
+            'f'
+            >>> prof = dsp({'a': 1}).profile(sort='name')
+            >>> [(r['name'], r['type'], r['count']) for r in prof]
+            [('f', 'function', 1), ('f/f', 'function', 1),
+             ('sub', 'dispatcher', 1), ('sub/f', 'function', 1)]
+            >>> prof = dsp({'a': 1}).profile(sort='name', flat=True)
+            >>> [(r['name'], r['type'], r['count']) for r in prof]
+            [('f', 'function', 3), ('sub', 'dispatcher', 1)]
+            >>> print(prof.to_csv().splitlines()[0])
+            name,type,count,self,wall,wait,size,peak,net
+        """
+        from .prf import Profile
+        return Profile.from_solution(self, sort=sort, top=top, flat=flat)
+
+    def export_trace(self, path):
+        """
+        Writes the timeline of the dispatch in Trace Event Format.
+
+        The file can be opened by `chrome://tracing` or
+        `https://ui.perfetto.dev` to see which process and thread have
+        evaluated each node and when. The timeline is recorded only when the
+        dispatch is run with `trace=True`.
+
+        .. seealso:: :func:`~schedula.utils.prf.trace_events`
+
+        :param path:
+            File name of the JSON trace.
+        :type path: str
+
+        Example:
+
+        .. testsetup::
+            >>> import os
+            >>> from tempfile import mkstemp
+            >>> fd, path = mkstemp()
+            >>> os.close(fd)
+
+            >>> import json
+            >>> import schedula as sh
+            >>> dsp = sh.Dispatcher()
+            >>> dsp.add_func(lambda a: a + 1, ['b'], function_id='f')
+            'f'
+            >>> dsp({'a': 1}, trace=True).export_trace(path)
+            >>> with open(path) as f:
+            ...     [e['name'] for e in json.load(f)['traceEvents']]
+            ['process_name', 'f']
+
+        .. testcleanup::
+            >>> os.remove(path)
+        """
+        import json
+        from .prf import trace_events
+        with open(path, 'w') as f:
+            json.dump(trace_events(self), f)
+
     def _copy_structure(self, **kwargs):
         sol = self.__class__(
             self.dsp, self.inputs, self.outputs, False, self.inputs_dist,
@@ -409,6 +643,21 @@ class Solution(Base, collections.OrderedDict):
             setattr(sol, k, getattr(self, k))
         return sol
 
+    def __reduce__(self):
+        red = super(Solution, self).__reduce__()
+        if red[2] and any(k in red[2] for k in (
+                '_records', '_checkpoint', '_stream')):
+            state = red[2].copy()
+            state.pop('_records', None)  # Rebuilt from the dispatcher.
+            state.pop('_checkpoint', None)  # The store is not pickled.
+            state.pop('_stream', None)  # The stream is not pickled.
+            red = red[:2] + (state,) + red[3:]
+        return red
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._records = getattr(self.__dict__.get('dsp'), '_records', None)
+
     def __deepcopy__(self, memo):
         y = super(Solution, self).__deepcopy__(memo)
         y._update_methods()
@@ -533,17 +782,27 @@ class Solution(Base, collections.OrderedDict):
 
     def _evaluate_function(self, args, node_id, node_attr, attr, stopper=None,
                            executor=False):
+        if self.deadline is not None and time.time() >= self.deadline:
+            self._skip_deadline(node_id, node_attr)
         self._started(attr, node_id)
 
         def _callback(is_sol, sol):
             if is_sol:
                 attr['solution'] = sol
 
+        if executor:
+            attr['executor'] = EXECUTORS.executor_id(executor, self)[0]
         res = async_process(
             [node_attr['function']], *args, stopper=stopper, executor=executor,
             sol=self, callback=_callback, sol_name=self.full_name + (node_id,),
-            verbose=self.verbose
+            verbose=self.verbose, timeout=node_attr.get('timeout'),
+            trace=self.trace
         )
+        if executor:
+            from .asy.executors import pop_worker
+            worker = pop_worker()
+            if worker:  # Executed in a process.
+                attr['worker'] = worker
 
         return res
 
@@ -553,15 +812,24 @@ class Solution(Base, collections.OrderedDict):
         if not self.no_domain and 'input_domain' in node_attr:
             if node_attr.get('await_domain', True):
                 args = map(await_result, args)
-            args = [v for v in args if v is not NONE]
+            args = load_lazy([v for v in args if v is not NONE])
             # noinspection PyCallingNonCallable
             attr['solution_domain'] = bool(node_attr['input_domain'](*args))
             if not attr['solution_domain']:
+                if HOOKS:
+                    fire('node_skip', self, node_id, attr=attr)
                 raise SkipNode
 
     def _evaluate_node(self, args, node_attr, node_id, skip_func=False, **kw):
         # noinspection PyUnresolvedReferences
         attr = self.workflow.nodes[node_id]
+        ckpt = None if skip_func else self._checkpoint
+        if ckpt is not None:
+            key = self.index, node_id
+            if key in ckpt:  # Replay the logged result.
+                if HOOKS:
+                    fire('cache_hit', self, node_id, cache='checkpoint')
+                return ckpt.pop(key)
         try:
             if skip_func:
                 value = args[0]
@@ -572,6 +840,9 @@ class Solution(Base, collections.OrderedDict):
                 )
             value = self._apply_filters(value, node_id, node_attr, attr, **kw)
             self._ended(attr, node_id)
+            if self.memory_profile and not isinstance(value, Future):
+                from .prf import sizeof
+                attr['memory_size'] = sizeof(value)
 
             if 'callback' in node_attr:  # Invoke callback func of data node.
                 try:
@@ -581,8 +852,12 @@ class Solution(Base, collections.OrderedDict):
                     msg = "Failed CALLBACK '%s' due to:\n  %s"
                     self._warning(msg, node_id, ex)
 
+            if ckpt is not None:
+                self._log_checkpoint(ckpt, key, value)
             return value
         except Exception as ex:
+            if HOOKS:
+                fire('node_error', self, node_id, attr=attr, error=ex)
             self._ended(attr, node_id)
             # Some error occurs.
             msg = "Failed DISPATCHING '%s' due to:\n  %r"
@@ -638,6 +913,8 @@ class Solution(Base, collections.OrderedDict):
 
             if value is not NONE:  # Set data output.
                 self[node_id] = value
+                if self._stream is not None:
+                    self._stream(self.full_name + (node_id,), value)
 
             value = {'value': value}  # Output value.
 
@@ -659,13 +936,24 @@ class Solution(Base, collections.OrderedDict):
             index = self.index
             add_succ_fun = succ_fun.append
 
-            for u in self._succ[node_id]:  # no_visited_in_sub_dsp.
-                node = n[u]
-                if node['type'] == 'dispatcher' and has(u, node_id):
-                    visited = sub_sol[index + node['index']]._visited
-                    node['inputs'][node_id] not in visited and add_succ_fun(u)
-                else:
-                    add_succ_fun(u)
+            if self._records is not None:  # Frozen dispatcher.
+                for u, _, is_dsp in self._records[node_id].succ:
+                    if is_dsp and has(u, node_id):
+                        node = n[u]
+                        visited = sub_sol[index + node['index']]._visited
+                        if node['inputs'][node_id] not in visited:
+                            add_succ_fun(u)
+                    else:
+                        add_succ_fun(u)
+            else:
+                for u in self._succ[node_id]:  # no_visited_in_sub_dsp.
+                    node = n[u]
+                    if node['type'] == 'dispatcher' and has(u, node_id):
+                        visited = sub_sol[index + node['index']]._visited
+                        if node['inputs'][node_id] not in visited:
+                            add_succ_fun(u)
+                    else:
+                        add_succ_fun(u)
 
             # Check if it has functions as outputs and wildcard condition.
             if succ_fun and succ_fun[0] not in self._visited:
@@ -699,12 +987,31 @@ class Solution(Base, collections.OrderedDict):
     def _started(self, attr, node_id):
         if 'started' not in attr:
             attr['started'] = time.time()
+            if self.trace:
+                attr['started_ns'] = perf_counter_ns()
+                attr['thread'] = getpid(), get_ident()
             self._verbose(node_id, attr)
+            if HOOKS:
+                fire('node_start', self, node_id, attr=attr)
+            if self.memory_profile:
+                from .prf import _memory_tracer
+                _memory_tracer.start(attr)
 
     def _ended(self, attr, node_id):
         if 'started' in attr:
+            if self.trace:
+                attr['ended_ns'] = perf_counter_ns()
             attr['duration'] = time.time() - attr['started']
+            if self.memory_profile:
+                from .prf import _memory_tracer
+                _memory_tracer.stop(attr)
+                worker = attr.get('worker', ())
+                if len(worker) > 4 and worker[4] is not None:  # RSS delta.
+                    attr.pop('memory_peak', None)
+                    attr['memory_net'] = worker[4]
             self._verbose(node_id, attr, end=True)
+            if HOOKS:
+                fire('node_end', self, node_id, attr=attr)
 
     def _verbose(self, node_id, attr, end=False):
         if self.verbose:
@@ -922,6 +1229,18 @@ class Solution(Base, collections.OrderedDict):
         if self.check_targets(node_id):  # Check if the targets are satisfied.
             return False  # Stop loop.
 
+        if self._records is not None:  # Frozen dispatcher.
+            for w, length, is_dsp in self._records[node_id].succ:
+                if not wf_has_edge(node_id, w):  # Check wildcard option.
+                    continue
+                if is_dsp:
+                    self._set_sub_dsp_node_input(
+                        node_id, w, fringe, no_call, dist + length
+                    )
+                else:  # See the node.
+                    self._see_node(w, fringe, dist + length)
+            return True
+
         for w, e_data in self.dmap[node_id].items():
             if not wf_has_edge(node_id, w):  # Check wildcard option.
                 continue
@@ -964,9 +1283,12 @@ class Solution(Base, collections.OrderedDict):
         """
 
         # Namespace shortcuts.
-        seen, dists = self.seen, self.dist
+        seen, dists, records = self.seen, self.dist, self._records
 
-        wait_in = self.nodes[node_id]['wait_inputs']  # Wait inputs flag.
+        if records is None:
+            wait_in = self.nodes[node_id]['wait_inputs']  # Wait inputs flag.
+        else:
+            wait_in = records[node_id].wait_inputs
 
         self._update_meeting(node_id, dist)  # Update view distance.
 
@@ -981,7 +1303,10 @@ class Solution(Base, collections.OrderedDict):
         elif node_id not in seen or dist < seen[node_id]:  # Check min dist.
             seen[node_id] = dist  # Update dist.
             if fringe is not None:  # SubDispatchPipe.
-                index = self.nodes[node_id]['index']  # Node index.
+                if records is None:
+                    index = self.nodes[node_id]['index']  # Node index.
+                else:
+                    index = records[node_id].index
 
                 # Virtual distance.
                 vd = w_wait_in + int(wait_in), str(node_id), self.index + index
@@ -1043,6 +1368,16 @@ class Solution(Base, collections.OrderedDict):
         )
 
         sol.sub_sol = self.sub_sol
+        if self._checkpoint is not None:
+            sol._checkpoint = self._checkpoint
+        if self._stream is not None:
+            sol._stream = self._stream
+        if self.memory_profile:
+            sol.memory_profile = True
+        if self.trace:
+            sol.trace = True
+        if self.deadline is not None:
+            sol.deadline = self.deadline
 
         for f in sol.fringe or ():  # Update the fringe.
             item = (initial_dist + f[0], (2,) + f[1][1:], f[-1])
@@ -1074,22 +1409,43 @@ class Solution(Base, collections.OrderedDict):
         # Get `p_id` if `node_id` is data node.
         p_id = self.nodes[node_id]['type'] == 'data' and self.index[:-1]
         if p_id and check_dsp(p_id) and node_id in self:
-            # Get parent solution and child index.
-            sol, c_i = self.sub_sol[p_id], self.index[-1:]
-            for dsp_id, n in sol.dsp.nodes.items():
-                if n['index'] == c_i and node_id in n.get('outputs', {}):
-                    value = self[node_id]  # Get data output.
-                    visited = sol._visited
-                    has_edge = sol.workflow.has_edge
-                    pass_result = sol.workflow.add_edge_fw
-                    see_node = sol._see_node
-                    for n_id in stlp(n['outputs'][node_id]):
-                        # Node has been visited or inp do not coincide with out.
-                        if not (n_id in visited or has_edge(n_id, dsp_id)):
-                            pass_result(dsp_id, n_id, value=value)  # To child.
-                            if fringe is not None:
-                                see_node(n_id, fringe, dist, w_wait_in=2)
-                    break
+            # Get parent solution and sub-dispatcher node.
+            sol = self.sub_sol[p_id]
+            dsp_id = self._get_dsp_id(sol)
+            n = sol.dsp.nodes[dsp_id]
+            if node_id in n.get('outputs', {}):
+                value = self[node_id]  # Get data output.
+                visited = sol._visited
+                has_edge = sol.workflow.has_edge
+                pass_result = sol.workflow.add_edge_fw
+                see_node = sol._see_node
+                for n_id in stlp(n['outputs'][node_id]):
+                    # Node has been visited or inp do not coincide with out.
+                    if not (n_id in visited or has_edge(n_id, dsp_id)):
+                        pass_result(dsp_id, n_id, value=value)  # To child.
+                        if fringe is not None:
+                            see_node(n_id, fringe, dist, w_wait_in=2)
+
+    def _get_dsp_id(self, parent):
+        """
+        Returns the id of the sub-dispatcher node of the parent solution.
+
+        :param parent:
+            Parent solution.
+        :type parent: Solution
+
+        :return:
+            Sub-dispatcher node id.
+        :rtype: str
+        """
+        try:
+            return self._dsp_id
+        except AttributeError:
+            i = self.index[-1:]
+            self._dsp_id = k = next(
+                k for k, v in parent.dsp.nodes.items() if v['index'] == i
+            )
+            return k
 
     def _check_sub_dsp_domain(self, dsp_id, node, pred, kw):
         if 'input_domain' in node and not (self.no_domain or self.no_call):
@@ -1207,3 +1563,143 @@ class Solution(Base, collections.OrderedDict):
             except TypeError:  # MicroPython.
                 kwargs.pop('exc_info')
                 log.error(msg, node_id, ex, *args, **kwargs)
+
+
+class LazySolution(collections.abc.Mapping):
+    """
+    A dispatch result whose values are computed on first access.
+
+    The reachable data nodes are planned with a dispatch without function
+    calls (of the shrunk dispatcher when the outputs are given). When a value
+    is accessed only the minimal upstream workflow of the node is dispatched,
+    using the values already computed as inputs. All the computed values are
+    memoized for the later accesses. The planned nodes that are not computed
+    (e.g., because of a failing input domain) are removed from the mapping,
+    while the views (i.e., `keys` and `items`) compute all the pending values
+    at once.
+
+    :param dsp:
+        A dispatcher that identifies the model adopted.
+    :type dsp: schedula.Dispatcher
+
+    :param inputs:
+        Input data values.
+    :type inputs: dict[str, T], optional
+
+    :param outputs:
+        Ending data nodes.
+    :type outputs: list[str], iterable, optional
+
+    :param kwargs:
+        Extra keywords of :func:`~schedula.dispatcher.Dispatcher.dispatch`
+        used to compute the values.
+    :type kwargs: dict
+
+    Example::
+
+        >>> import schedula as sh
+        >>> dsp = sh.Dispatcher()
+        >>> calls = []
+        >>> def f(a):
+        ...     calls.append('f')
+        ...     return a + 1
+        >>> def g(b):
+        ...     calls.append('g')
+        ...     return b * 2
+        >>> def h(a):
+        ...     calls.append('h')
+        ...     return -a
+        >>> dsp.add_func(f, ['b'])
+        'f'
+        >>> dsp.add_func(g, ['c'])
+        'g'
+        >>> dsp.add_func(h, ['d'])
+        'h'
+        >>> sol = dsp.dispatch({'a': 1}, lazy=True)
+        >>> sorted(sol), calls
+        (['a', 'b', 'c', 'd'], [])
+        >>> sol['c'], calls
+        (4, ['f', 'g'])
+        >>> sol['b'], calls
+        (2, ['f', 'g'])
+        >>> sol
+        LazySolution({'a': 1, 'b': 2, 'd': ..., 'c': 4})
+        >>> dict(sol), calls
+        ({'a': 1, 'b': 2, 'd': -1, 'c': 4}, ['f', 'g', 'h'])
+    """
+
+    def __init__(self, dsp, inputs=None, outputs=None, **kwargs):
+        if outputs:  # Plan only the workflow of the outputs.
+            dsp = dsp.shrink_dsp(
+                inputs, outputs, kwargs.get('inputs_dist'),
+                kwargs.get('wildcard', False)
+            )
+        self.dsp = dsp
+        self.kwargs = kwargs
+        self.plan = dsp.dispatch(
+            inputs, outputs, kwargs.get('inputs_dist'),
+            kwargs.get('wildcard', False), True,
+            _wait_in=kwargs.get('_wait_in')
+        )
+        #: Input values.
+        self.inputs = inputs = dict(inputs or {})
+
+        # With wildcard, the inputs that are outputs are computed as well.
+        self._wildcard = set()
+        if kwargs.get('wildcard') and outputs:
+            self._wildcard = set(outputs).intersection(inputs)
+
+        #: Computed values.
+        self.values = {
+            k: v for k, v in inputs.items() if k not in self._wildcard
+        }
+        self._keys = dict.fromkeys(self.plan)
+        self._lock = Lock()
+
+    def _compute(self, keys):
+        with self._lock:
+            values = self.values
+            keys = [k for k in keys if k in self._keys and k not in values]
+            if keys:
+                inputs = {**values, **self.inputs}
+                sol = self.dsp.dispatch(inputs, keys, **self.kwargs).result()
+                skip = self._wildcard.difference(keys)
+                values.update(
+                    (k, v) for k, v in sol.items()
+                    if k in self._keys and k not in skip
+                )
+                for k in keys:
+                    if k not in values:  # Not computed, e.g., domain failure.
+                        del self._keys[k]
+
+    def __getitem__(self, key):
+        try:
+            return self.values[key]
+        except KeyError:
+            if key not in self._keys:
+                raise
+        self._compute([key])
+        return self.values[key]
+
+    def __iter__(self):
+        return iter(list(self._keys))
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def keys(self):
+        self._compute(list(self._keys))
+        return super(LazySolution, self).keys()
+
+    def items(self):
+        self._compute(list(self._keys))
+        return super(LazySolution, self).items()
+
+    def __repr__(self):
+        return '%s({%s})' % (self.__class__.__name__, ', '.join(
+            '%r: %s' % (k, repr(self.values[k]) if k in self.values else '...')
+            for k in self._keys
+        ))
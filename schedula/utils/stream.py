@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+
+"""
+It provides an iterator of the data node values estimated by a dispatch.
+
+Classes:
+
+.. autosummary::
+    :nosignatures:
+    :toctree: stream/
+
+    DispatchStream
+"""
+import queue
+import functools
+import threading
+from .imp import Future
+
+__author__ = 'Vincenzo Arcidiacono <vinci1it2000@gmail.com>'
+
+_END = object()
+
+
+class DispatchStream:
+    """
+    An iterator (and asynchronous iterator) of the data node values estimated
+    by a dispatch.
+
+    The dispatch runs in a background thread and the events
+    `(node_path, value)` are yielded as soon as each data node gets its value.
+    The `node_path` is the `full_name` of the solution plus the node id, hence
+    the values of the sub-dispatchers are yielded with their path. With
+    asynchronous executors the values are yielded when their futures are done
+    (the failed ones are not yielded). When the iteration ends the solution is
+    available as `solution` attribute, while the dispatch errors are raised.
+
+    :param dispatch:
+        Function that runs the dispatch. It takes the stream as argument (to
+        be set as stream of the solution) and returns the solution.
+    :type dispatch: callable
+
+    :param stopper:
+        A semaphore that is set to abort the dispatch when the stream is
+        closed. It must be the stopper of the dispatch.
+    :type stopper: multiprocess.Event | threading.Event
+
+    Example::
+
+        >>> import schedula as sh
+        >>> dsp = sh.Dispatcher()
+        >>> dsp.add_func(lambda a: a + 1, ['b'])
+        '<lambda>'
+        >>> stream = dsp.dispatch_iter({'a': 1})
+        >>> list(stream)
+        [(('a',), 1), (('b',), 2)]
+        >>> stream.solution
+        Solution({'a': 1, 'b': 2})
+
+    It can be consumed asynchronously::
+
+        >>> import asyncio
+        >>> async def main():
+        ...     return [e async for e in dsp.dispatch_iter({'a': 2})]
+        >>> asyncio.run(main())
+        [(('a',), 2), (('b',), 3)]
+    """
+
+    def __init__(self, dispatch, stopper):
+        self.dispatch = dispatch
+        self.stopper = stopper
+        self.solution = None
+        self._queue = queue.Queue()
+        self._pending = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._done = False
+
+    def __call__(self, path, value):
+        if isinstance(value, Future):
+            with self._cond:
+                self._pending += 1
+            value.add_done_callback(functools.partial(self._resolve, path))
+        else:
+            self._queue.put((path, value))
+
+    def _resolve(self, path, fut):
+        try:
+            if not (fut.cancelled() or fut.exception()):
+                self._queue.put((path, fut.result()))
+        finally:
+            with self._cond:
+                self._pending -= 1
+                self._cond.notify_all()
+
+    def _run(self):
+        error = None
+        try:
+            self.solution = sol = self.dispatch(self)
+            sol.result()
+        except BaseException as ex:
+            error = ex
+        finally:
+            with self._cond:  # Wait the values of the done futures.
+                self._cond.wait_for(lambda: not self._pending)
+            self._queue.put((_END, error))
+
+    def start(self):
+        """
+        Starts the dispatch (it is called by the first iteration).
+
+        :return:
+            Self.
+        :rtype: DispatchStream
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self._done:
+            path, value = self.start()._queue.get()
+            if path is not _END:
+                return path, value
+            self._done = True
+            if value is not None:
+                raise value
+        raise StopIteration
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        event = await loop.run_in_executor(None, next, self, _END)
+        if event is _END:
+            raise StopAsyncIteration
+        return event
+
+    def close(self, timeout=None):
+        """
+        Stops the iteration, aborts the dispatch, and waits for the end of its
+        thread (i.e., the node evaluations in progress).
+
+        :param timeout:
+            Maximum time [s] to wait for the thread. If None, it waits until
+            the thread ends.
+        :type timeout: float, optional
+        """
+        self.stopper.set()
+        self._done = True
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        try:  # Releases the values not yielded.
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
@@ -9,6 +9,8 @@
 """
 It provides some utility functions.
 """
+from heapq import heappop
+from types import MappingProxyType
 
 
 def select_diff(adict: dict, excluded: set, key: str) -> dict:
@@ -41,6 +43,9 @@ def get_unused_node_id(graph, initial_guess='unknown', _format='{}<%d>'):
     nodes = graph.nodes  # Namespace shortcut for speed.
     node_id = initial_guess  # Initial guess.
     if node_id in nodes:
+        index = getattr(graph, '_suffixes', None)
+        if index is not None and _format == '{}<%d>':
+            return _get_unused_suffix_id(nodes, index, node_id)
         n = 0  # Counter.
         id_fmt = _format.format(node_id.replace('%', '%%'))  # Node id format.
         node_id = id_fmt % n  # Guess.
@@ -49,3 +54,238 @@ def get_unused_node_id(graph, initial_guess='unknown', _format='{}<%d>'):
             node_id = id_fmt % n
 
     return node_id  # Returns an unused node id.
+
+
+def _get_unused_suffix_id(nodes, index, base):
+    # Index of the next suffix to probe and heap of the released ones.
+    try:
+        suffixes = index[base]
+    except KeyError:
+        suffixes = index[base] = [0, []]
+    n, released = suffixes
+    while released:  # Smallest released suffix still unused.
+        node_id = '%s<%d>' % (base, heappop(released))
+        if node_id not in nodes:
+            return node_id
+    node_id = '%s<%d>' % (base, n)
+    while node_id in nodes:
+        n += 1
+        node_id = '%s<%d>' % (base, n)
+    suffixes[0] = n + 1
+    return node_id
+
+
+def cached_by_version(func):
+    """
+    Decorator to cache the result of a method without arguments until the
+    `version` of the object changes.
+
+    The results are stored in the `_cache` dictionary of the object.
+
+    :param func:
+        Method to be cached.
+    :type func: callable
+
+    :return:
+        Cached method.
+    :rtype: callable
+
+    Example::
+
+        >>> class Graph:
+        ...     def __init__(self):
+        ...         self.version, self._cache, self.nodes = 0, {}, []
+        ...     @property
+        ...     @cached_by_version
+        ...     def n_nodes(self):
+        ...         print('computing...')
+        ...         return len(self.nodes)
+        >>> g = Graph()
+        >>> g.n_nodes
+        computing...
+        0
+        >>> g.n_nodes
+        0
+        >>> g.nodes.append('a'); g.version += 1
+        >>> g.n_nodes
+        computing...
+        1
+    """
+    name = func.__name__
+
+    def wrapper(self):
+        cache, version = self._cache, self.version
+        try:
+            v, res = cache[name]
+            if v == version:
+                return res
+        except KeyError:
+            pass
+        res = cache[name] = version, func(self)
+        return res[1]
+
+    try:
+        wrapper.__name__, wrapper.__doc__ = name, func.__doc__
+    except AttributeError:  # MicroPython.
+        pass
+    return wrapper
+
+
+#: Attributes that store the state of the sub-dispatch functions.
+_STATE_ATTRS = {
+    'dsp', 'solution', '_sol', 'pipe', 'pipes', 'hits', '_dirty',
+    '_signature', '__name__', '__doc__'
+}
+
+
+def _hash(*items):
+    import hashlib
+    return hashlib.blake2b(repr(items).encode(), digest_size=16).hexdigest()
+
+
+def _code_digest(code):
+    consts = tuple(
+        _code_digest(c) if hasattr(c, 'co_code') else repr(c)
+        for c in code.co_consts
+    )
+    return _hash(code.co_code, consts, code.co_names, code.co_varnames)
+
+
+def _obj_name(obj):
+    return '%s:%s' % (
+        getattr(obj, '__module__', None),
+        getattr(obj, '__qualname__', getattr(obj, '__name__', None))
+    )
+
+
+def fingerprint(obj, code=False, memo=None):
+    """
+    Returns a deterministic digest of an object.
+
+    Unlike :func:`hash` and :func:`id`, the digest is the same in any process.
+    It is computed as follow:
+
+        - dispatchers: see :func:`~schedula.dispatcher.Dispatcher.fingerprint`,
+        - functions and classes: module and qualified name (plus the digest of
+          the byte-code if `code` is True),
+        - wrappers (e.g., :class:`~schedula.utils.dsp.partial`,
+          :class:`~schedula.utils.dsp.add_args`, and
+          :class:`~schedula.utils.dsp.SubDispatch`): class name plus the
+          digests of the attributes and of the wrapped object,
+        - containers: digests of their items (sets and dicts are sorted),
+        - arrays: dtype, shape, and bytes,
+        - other objects: class name plus the digests of their attributes or
+          their `repr`.
+
+    :param obj:
+        Object to be hashed.
+    :type obj: object
+
+    :param code:
+        If True the byte-code of the functions is hashed.
+    :type code: bool, optional
+
+    :param memo:
+        A dictionary to cache the digests by object id.
+    :type memo: dict, optional
+
+    :return:
+        Hexadecimal digest.
+    :rtype: str
+
+    Example::
+
+        >>> import functools
+        >>> fingerprint(functools.partial(max, 1)) == fingerprint(
+        ...     functools.partial(max, 1))
+        True
+        >>> fingerprint({'a': {1, 2}}) == fingerprint({'a': {2, 1}})
+        True
+        >>> fingerprint(lambda x: x) == fingerprint(lambda x: x + 1)
+        True
+        >>> fingerprint(lambda x: x, True) == fingerprint(lambda x: x + 1, True)
+        False
+    """
+    memo = {} if memo is None else memo
+    c = _canon(obj, code, memo)
+    if c is obj or not isinstance(c, str):  # Primitive or container.
+        return _hash(c)
+    return c[1:]  # Digest.
+
+
+_PRIMITIVES = (bool, int, float, complex, str, bytes)
+_ATOMS = frozenset(_PRIMITIVES + (type(None),))
+
+
+def _first(item):
+    return item[0]
+
+
+def _canon(obj, code, memo):
+    """
+    Returns a canonical representation of an object (i.e., nested tuples of
+    primitives and digests).
+    """
+    if type(obj) in _ATOMS or isinstance(obj, _PRIMITIVES):
+        return obj
+    if isinstance(obj, (tuple, list)):
+        return (type(obj).__name__,) + tuple([
+            _canon(v, code, memo) for v in obj
+        ])
+    if isinstance(obj, (dict, MappingProxyType)):  # Read-only views too.
+        items = []
+        for k, v in obj.items():
+            k = _canon(k, code, memo)
+            items.append((repr(k), k, _canon(v, code, memo)))
+        items.sort(key=_first)
+        return ('dict',) + tuple([i[1:] for i in items])
+    if isinstance(obj, (set, frozenset)):
+        items = [_canon(v, code, memo) for v in obj]
+        return (type(obj).__name__,) + tuple(sorted(items, key=repr))
+    key = id(obj)
+    try:
+        return memo[key][0] or '#cycle'
+    except KeyError:
+        memo[key] = None, obj  # Keep the object alive to not reuse its id.
+    fp = '#' + _fingerprint(obj, code, memo)
+    memo[key] = fp, obj
+    return fp
+
+
+def _fingerprint(obj, code, memo):
+    import inspect
+    from .dsp import SubDispatch, add_args, partial
+    from .io.ref import LazyFunction
+    from ..dispatcher import Dispatcher
+
+    def f(o):
+        return _canon(o, code, memo)
+
+    if isinstance(obj, Dispatcher):
+        return obj._fingerprint(code, memo)
+    if isinstance(obj, LazyFunction):
+        return _fingerprint(obj.func, code, memo)
+    if isinstance(obj, partial):
+        return _hash('partial', f(obj.func), f(obj.args), f(obj.keywords))
+    if isinstance(obj, add_args):
+        return _hash('add_args', obj.n, f(obj.func), f(obj.callback))
+    if isinstance(obj, SubDispatch):
+        attrs = {k: v for k, v in vars(obj).items() if k not in _STATE_ATTRS}
+        return _hash(_obj_name(type(obj)), f(obj.dsp), f(attrs))
+    if inspect.ismethod(obj):
+        return _hash('method', f(obj.__self__), f(obj.__func__))
+    if inspect.isroutine(obj) or inspect.isclass(obj):
+        item = [_obj_name(obj)]
+        if code and hasattr(obj, '__code__'):
+            item.append(_code_digest(obj.__code__))
+        return _hash(*item)
+    if all(hasattr(obj, k) for k in ('dtype', 'shape', 'tobytes')):
+        import hashlib
+        data = hashlib.blake2b(obj.tobytes(), digest_size=16).hexdigest()
+        return _hash('array', str(obj.dtype), obj.shape, data)
+    if hasattr(obj, '__dict__'):
+        return _hash(_obj_name(type(obj)), f(vars(obj)))
+    r = repr(obj)
+    if ' at 0x' in r:  # Process dependent representation.
+        r = None
+    return _hash(_obj_name(type(obj)), r)
@@ -59,6 +59,8 @@ class WebMap(SiteMap):
     methods = ['POST']
     subsite_methods = ['GET', 'POST']
     idle_timeout = 600
+    metrics = None  # A MetricsCollector exposed on `/metrics`.
+    stream_mimetypes = 'application/x-ndjson', 'text/event-stream'
 
     def _repr_svg_(self):
         raise NotImplementedError()
@@ -83,6 +85,10 @@ class WebMap(SiteMap):
             else:
                 bp.add_url_rule('/', 'root', view, **opt)
                 bp.add_url_rule('/%s' % path, 'root', **opt)
+        if self.metrics is not None:
+            bp.add_url_rule(
+                '/metrics', 'metrics', self._metrics_handler, methods=['GET']
+            )
         if debug:
             bp.register_blueprint(self.sub_site())
         return bp
@@ -146,6 +152,40 @@ class WebMap(SiteMap):
             response.headers.update(headers)
         return response
 
+    def _metrics_handler(self):
+        from flask import Response
+        return Response(
+            self.metrics.to_prometheus(),
+            content_type='text/plain; version=0.0.4; charset=utf-8'
+        )
+
+    @staticmethod
+    def _stream_func(func):
+        from ..dsp import SubDispatch
+        from ...dispatcher import Dispatcher
+        if isinstance(func, Dispatcher):
+            return func.dispatch_iter
+        if isinstance(func, SubDispatch):
+            return func.iter
+
+    def _stream_handler(self, stream, mimetype):
+        from flask import current_app, stream_with_context
+        dumps = current_app.json.dumps
+        fmt = 'data: %s\n\n' if mimetype == 'text/event-stream' else '%s\n'
+
+        def _generate():
+            try:
+                for path, value in stream:
+                    yield fmt % dumps({'path': list(path), 'value': value})
+            except Exception as ex:
+                yield fmt % dumps({'error': str(ex)})
+            finally:
+                stream.close()
+
+        return current_app.response_class(
+            stream_with_context(_generate()), mimetype=mimetype
+        )
+
     def _func_handler(self, func):
         from ..dsp import selector
         from flask import request, current_app, Response
@@ -157,6 +197,14 @@ class WebMap(SiteMap):
             else:
                 inp = request.get_json(force=True)
             data['input'] = inp
+            mimetype = request.accept_mimetypes.best_match(
+                ('application/json',) + self.stream_mimetypes
+            )
+            stream = self._stream_func(func)
+            if mimetype in self.stream_mimetypes and stream:
+                return self._stream_handler(stream(
+                    *inp.get('args', ()), **inp.get('kwargs', {})
+                ), mimetype)
             data['return'] = func(*inp.get('args', ()), **inp.get('kwargs', {}))
             if isinstance(data['return'], Response):
                 resp = data['return']
@@ -106,6 +106,7 @@ if __name__ == '__main__':
     exclude = [
         'doc', 'doc.*',
         'tests', 'tests.*',
+        'benchmarks', 'benchmarks.*',
         'examples', 'examples.*',
         'micropython', 'micropython.*',
         'requirements', 'binder', 'bin',
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+import os
+import io
+import re
+import json
+import unittest
+import tempfile
+import contextlib
+
+EXTRAS = os.environ.get('EXTRAS', 'all')
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestDoctest(unittest.TestCase):
+    def runTest(self):
+        import doctest
+        import benchmarks.run as run
+        import benchmarks.generator as generator
+        import benchmarks.bench_import as bench_import
+        for mdl in (generator, run, bench_import):
+            failure_count, test_count = doctest.testmod(
+                mdl,
+                optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS)
+            self.assertGreater(test_count, 0, (failure_count, test_count))
+            self.assertEqual(failure_count, 0, (failure_count, test_count))
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestGenerator(unittest.TestCase):
+    def test_generate_model(self):
+        from benchmarks.generator import generate_model
+        kw = {
+            'sub_ratio': .2, 'domain_density': .2, 'wait_density': .2,
+            'cycle_density': .2, 'fan_out': 2
+        }
+        dsp, inputs, outputs = generate_model(100, seed=3, **kw)
+        other = generate_model(100, seed=3, **kw)
+        self.assertEqual(list(dsp.dmap.edges), list(other[0].dmap.edges))
+        self.assertEqual((inputs, outputs), other[1:])
+        self.assertNotEqual(
+            list(dsp.dmap.edges),
+            list(generate_model(100, seed=4, **kw)[0].dmap.edges)
+        )
+        nodes = dsp.nodes.values()
+        self.assertTrue(any(v['type'] == 'dispatcher' for v in nodes))
+        self.assertTrue(any('input_domain' in v for v in nodes))
+        self.assertTrue(any(v.get('wait_inputs') for v in nodes))
+        self.assertTrue(any(k.startswith('c') for k in dsp.function_nodes))
+        sol = dsp(inputs, outputs)
+        self.assertTrue(set(outputs).issubset(sol))
+
+        blue = generate_model(100, seed=3, blue=True, **kw)[0].register()
+        self.assertEqual(list(dsp.dmap.edges), list(blue.dmap.edges))
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestRunner(unittest.TestCase):
+    def test_run(self):
+        from benchmarks.run import main
+        name = 'dispatch.Dispatch.time_dispatch(10, plain)'
+        bench = '^%s$' % re.escape(name)
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                self.assertEqual(main([
+                    '-b', bench, '--save', path, '--baseline', os.devnull
+                ]), 0)
+            with open(path) as f:
+                data = json.load(f)
+            self.assertEqual(list(data['results']), [name])
+            self.assertGreater(data['results'][name], 0)
+            self.assertIn(name, out.getvalue())
+
+            data['results'][name] /= 10
+            with open(path, 'w') as f:
+                json.dump(data, f)
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                self.assertEqual(main(['-b', bench, '--baseline', path]), 1)
+            self.assertIn('REGRESSION', out.getvalue())
+        finally:
+            os.remove(path)
+
+    def test_baseline(self):
+        from benchmarks.run import BASELINE, discover
+        with open(BASELINE) as f:
+            results = json.load(f)['results']
+        self.assertEqual(set(results), {k[0] for k in discover()})
@@ -8,6 +8,7 @@
 
 import os
 import ddt
+import copy
 import time
 import timeit
 import platform
@@ -64,6 +65,31 @@ def _setup_dsp():
     return dsp
 
 
+class _Progress(list):
+    def append(self, item):
+        super(_Progress, self).append(item)
+        print(item, flush=True)
+
+
+def _setup_checkpoint_dsp(calls, delay=.2):
+    def step(x):
+        calls.append(x)
+        time.sleep(delay)
+        return x + 1
+
+    sub = sh.Dispatcher(name='sub')
+    sub.add_function('f', step, ['x'], ['y'])
+    sub.add_function('g', step, ['y'], ['z'])
+
+    dsp = sh.Dispatcher(name='model')
+    dsp.add_function('f', step, ['a'], ['b'])
+    dsp.add_function('g', step, ['b'], ['c'])
+    dsp.add_dispatcher(sub, {'c': 'x'}, {'z': 'd'}, 'sub')
+    dsp.add_function('h', step, ['d'], ['e'])
+    dsp.add_function('i', step, ['e'], ['out'])
+    return dsp
+
+
 @unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
 class TestDoctest(unittest.TestCase):
     def runTest(self):
@@ -200,6 +226,17 @@ class TestCreateDispatcher(unittest.TestCase):
         self.assertRaises(ValueError, dsp.add_function, 'f', inputs=[fun_id])
         self.assertRaises(ValueError, dsp.add_function, 'f', outputs=[fun_id])
 
+    def test_unused_node_id(self):
+        dsp = sh.Dispatcher()
+        ids = [dsp.add_function('f', inputs=['a']) for _ in range(4)]
+        self.assertEqual(ids, ['f', 'f<0>', 'f<1>', 'f<2>'])
+        dsp.dmap.remove_node('f<1>')
+        dsp.dmap.remove_node('f<0>')
+        dsp.add_function('f<3>', inputs=['a'])
+        ids = [dsp.add_function('f', inputs=['a']) for _ in range(4)]
+        self.assertEqual(ids, ['f<0>', 'f<1>', 'f<4>', 'f<5>'])
+        self.assertEqual(dsp.add_function('f<1>', inputs=['a']), 'f<1><0>')
+
     def test_add_dispatcher(self):
         sub_dsp = self.sub_dsp.register()
 
@@ -318,6 +355,80 @@ class TestCreateDispatcher(unittest.TestCase):
 
         self.assertEqual(dsp.dmap.nodes, res)
 
+    def test_load_from_records(self):
+        dsp = sh.Dispatcher()
+        self.assertEqual(dsp.add_from_records(), ([], [], []))
+
+        def fun(a, b):
+            return a + b
+
+        data_list = [
+            {'data_id': 'a', 'default_value': 0, 'description': 'A'},
+            {'data_id': 'b', 'wait_inputs': True, 'foo': 1},
+            {'default_value': 2}
+        ]
+        fun_list = [
+            {'function': fun, 'inputs': ['a', 'b'], 'outputs': ['c']},
+            {'function': fun, 'inputs': ['c', 'd'], 'outputs': ['e', 'a'],
+             'inp_weight': {'d': 2}, 'weight': 1, 'timeout': 1},
+            {'function_id': 'dummy', 'inputs': ['e']}
+        ]
+        dsp_list = [{
+            'dsp': {'fun_list': [fun_list[0]]}, 'inputs': {'c': 'a', 'e': 'b'},
+            'outputs': {'c': 'f'}, 'dsp_id': 'sub-dsp'
+        }]
+        columns = {k: [d.get(k) for d in fun_list] for k in (
+            'function_id', 'function', 'inputs', 'outputs', 'inp_weight',
+            'weight', 'timeout'
+        )}
+        res = dsp.add_from_records(data_list, columns, dsp_list)
+        self.assertEqual(res, (
+            ['a', 'b', 'unknown'], ['fun', 'fun<0>', 'dummy'], ['sub-dsp']
+        ))
+
+        sol = sh.Dispatcher()
+        self.assertEqual(sol.add_from_lists(data_list, fun_list, dsp_list), res)
+        sub_dsp = dsp.nodes['sub-dsp']['function']
+        sol.nodes['sub-dsp']['function'] = sub_dsp
+        self.assertEqual(dsp.dmap.nodes, sol.dmap.nodes)
+        self.assertEqual(dsp.dmap.succ, sol.dmap.succ)
+        self.assertEqual(dsp.default_values, sol.default_values)
+
+        nodes, version = dict(dsp.dmap.nodes), dsp.version
+        with self.assertRaises(ValueError) as ex:
+            dsp.add_from_records({'data_id': ['g', 'fun']}, [
+                {'function': fun, 'inputs': ['g'], 'outputs': ['h']},
+                {'function': fun, 'inputs': ['fun'], 'outputs': ['h']},
+            ])
+        self.assertEqual(str(ex.exception).splitlines()[1:], [
+            '  data_records[1]: Invalid data id: override function fun',
+            '  fun_records[1]: Invalid input id: fun is not a data node'
+        ])
+        self.assertEqual(dsp.dmap.nodes, nodes)
+        self.assertGreater(dsp.version, version)
+        self.assertRaises(
+            ValueError, dsp.add_from_records, {'data_id': ['a'], 'foo': []}
+        )
+
+        nodes, suffixes = dict(dsp.dmap.nodes), repr(dsp.dmap._suffixes)
+        index, defaults = dsp.counter(), dict(dsp.default_values)
+        with self.assertRaises(ValueError) as ex:
+            dsp.add_from_records(
+                [{'data_id': 'g', 'default_value': 1}],
+                [{'function': fun, 'inputs': ['a', 'g'], 'outputs': ['h']}],
+                [dsp_list[0], {'dsp': {}, 'inputs': ['fun'], 'outputs': ['i'],
+                               'dsp_id': 'sub-dsp'}]
+            )
+        self.assertEqual(str(ex.exception).splitlines()[1:], [
+            '  dsp_records[1]: Invalid input id: fun is not a data node'
+        ])
+        self.assertEqual(dsp.dmap.nodes, nodes)
+        self.assertEqual(repr(dsp.dmap._suffixes), suffixes)
+        self.assertEqual(dsp.default_values, defaults)
+        self.assertEqual(dsp.counter(), index + 1)
+        res = dsp.add_from_records(fun_records=[fun_list[0]])
+        self.assertEqual(res, ([], ['fun<1>'], []))
+
     def test_set_default_value(self):
         dsp = sh.Dispatcher()
 
@@ -356,7 +467,7 @@ class TestCopyDispatcher(unittest.TestCase):
         self.sub_dsp = sub_dsp
 
     def test_copy(self):
-        dsp = self.sub_dsp.copy()
+        dsp = copy.deepcopy(self.sub_dsp)
 
         self.assertIsNot(self.sub_dsp, dsp)
         self.assertIsNot(self.sub_dsp.nodes, dsp.nodes)
@@ -364,6 +475,169 @@ class TestCopyDispatcher(unittest.TestCase):
         self.assertIsNot(self.sub_dsp.dmap.nodes, dsp.dmap.nodes)
         self.assertIsNot(self.sub_dsp.dmap.edges, dsp.dmap.edges)
 
+    def test_cow_copy(self):
+        sub_dsp = self.sub_dsp
+        dsp = sub_dsp.copy()
+        self.assertIsNot(sub_dsp, dsp)
+        self.assertIsNot(sub_dsp.dmap, dsp.dmap)
+        self.assertIs(sub_dsp.nodes, dsp.nodes)
+        self.assertIs(sub_dsp.dmap.succ, dsp.dmap.succ)
+        self.assertIs(sub_dsp.default_values, dsp.default_values)
+        self.assertEqual(dsp.dispatch({'b': 0}), {'a': 1, 'b': 0, 'c': 0,
+                                                  'd': 3, 'e': -3})
+
+        nodes, edges = dict(sub_dsp.nodes), sub_dsp.dmap.edges
+        dsp.add_function('max', max, ['a', 'b'], ['c'], weight=2)
+        dsp.add_data('c', description='C')
+        dsp.dmap.add_edge('min', 'c', weight=3)
+        dsp.dmap.remove_edge('a', 'min')
+        self.assertEqual(sub_dsp.nodes, nodes)
+        self.assertEqual(sub_dsp.dmap.edges, edges)
+        self.assertNotIn('description', sub_dsp.nodes['c'])
+        self.assertEqual(dsp.nodes['c']['description'], 'C')
+        self.assertEqual(dsp.dmap.edges['min', 'c'], {'weight': 3})
+
+        dsp.set_default_value('a', 2)
+        self.assertEqual(sub_dsp.default_values['a']['value'], 1)
+        sub_dsp.set_default_value('b', 0)
+        self.assertNotIn('b', dsp.default_values)
+        sub_dsp.add_data('f')
+        self.assertNotIn('f', dsp.nodes)
+
+        parent = sh.Dispatcher()
+        parent.add_dispatcher(sub_dsp, ['b'], ['d'], 'sub')
+        func = sh.SubDispatchFunction(sub_dsp, 'func', ['b'], ['d'])
+        parent.add_function('func', func, ['b'], ['e'])
+        pipe = sh.DispatchPipe(sub_dsp, 'pipe', ['b'], ['d'])
+        parent.add_function('pipe', pipe, ['b'], ['g'])
+        dsp = parent.copy()
+        # The edges and the stateless nodes are still shared.
+        self.assertIs(dsp.dmap.succ, parent.dmap.succ)
+        self.assertIs(dsp.dmap.pred, parent.dmap.pred)
+        self.assertIs(dsp.nodes['b'], parent.nodes['b'])
+        self.assertEqual(dsp.dmap._shared, [2])
+        self.assertIs(dsp.solution.dsp, dsp)
+        self.assertIs(parent.solution.dsp, parent)
+        self.assertIsNot(dsp.nodes['sub']['function'], sub_dsp)
+        self.assertIn(dsp, dsp.nodes['sub']['function']._parents)
+        self.assertIsNot(dsp.nodes['func']['function'].dsp, sub_dsp)
+        self.assertIsNot(dsp.nodes['pipe']['function']._sol, pipe._sol)
+        sol = {'b': 0, 'd': 3, 'e': 3, 'g': 3}
+        self.assertEqual(dsp.dispatch({'b': 0}), sol)
+        self.assertEqual(parent.dispatch({'b': 0}), sol)
+        self.assertEqual(pipe(1), 4)
+
+        dsp.nodes['sub']['function'].add_data('h')
+        self.assertNotIn('h', sub_dsp.nodes)
+
+        parent.add_dispatcher(sub_dsp, ['b'], ['d'], ('sub', 2))
+        self.assertIsNot(
+            parent.copy().nodes['sub', 2]['function'], sub_dsp
+        )
+
+    def test_version(self):
+        sub_dsp, dsp = sh.Dispatcher(), sh.Dispatcher()
+        sub_dsp.add_function('min', min, ['a', 'b'], ['d'])
+        dsp.add_dispatcher(sub_dsp, ['a', 'b'], ['d'], 'sub')
+        nodes, edges, v = dsp.function_nodes, dsp.dmap.edges, dsp.version
+        self.assertIs(dsp.function_nodes, nodes)
+        self.assertIs(dsp.dmap.edges, edges)
+
+        dsp.dmap.add_edge('d', 'sub')
+        self.assertGreater(dsp.version, v)
+        self.assertIsNot(dsp.dmap.edges, edges)
+        self.assertIn(('d', 'sub'), dsp.dmap.edges)
+        dsp.dmap.remove_edge('d', 'sub')
+
+        v = dsp.version
+        sub_dsp.set_default_value('a', 1)
+        self.assertGreater(dsp.version, v)
+
+        v = dsp.version
+        dsp.add_function('f', inputs=['d'], outputs=['e'])
+        self.assertGreater(dsp.version, v)
+        self.assertIsNot(dsp.function_nodes, nodes)
+        self.assertEqual(set(dsp.function_nodes), {'f'})
+        self.assertEqual(set(dsp.sub_dsp_nodes), {'sub'})
+
+        d = dsp.copy()
+        sub, v, v0 = d.nodes['sub']['function'], d.version, dsp.version
+        self.assertIsNot(sub, sub_dsp)
+        sub.add_data('x')
+        self.assertGreater(d.version, v)
+        self.assertEqual(dsp.version, v0)
+
+        d = sh.Dispatcher.__new__(sh.Dispatcher)
+        d.__setstate__(dsp.__getstate__())  # Unpickle.
+        v = d.version
+        sub_dsp.add_data('x')
+        self.assertGreater(d.version, v)
+        self.assertGreater(dsp.version, v0)
+
+    def test_get_wait_in(self):
+        dsp = sh.Dispatcher()
+        dsp.add_data('c', wait_inputs=True)
+        dsp.add_function('f', max, ['a', 'b'], ['c'])
+        self.assertEqual(dsp._get_wait_in(), {'c': True})
+        dsp.add_function('g', min, ['a'], ['d'], input_domain=bool)
+        self.assertEqual(dsp._get_wait_in(), {'c': True, 'd': True})
+
+        sub = sh.Dispatcher()
+        sub.add_function('h', min, ['x'], ['y'], input_domain=bool)
+        dsp.add_dispatcher(sub, {'a': 'x'}, {'y': 'e'}, 'sub')
+        res = {'c': None, 'd': None, 'e': None, sub: {'y': None}}
+        self.assertEqual(dsp._get_wait_in(flag=None), res)
+
+    def test_fingerprint(self):
+        import sys
+        import subprocess
+        sub_dsp, fp = self.sub_dsp, self.sub_dsp.fingerprint()
+        self.assertEqual(fp, sub_dsp.copy().fingerprint())
+        self.assertEqual(fp, copy.deepcopy(sub_dsp).fingerprint())
+        self.assertEqual(fp, sub_dsp.freeze().fingerprint())
+        dsp = sh.Dispatcher(name='other')  # Different insertion order.
+        dsp.add_function('fun', sub_dsp.nodes['fun']['function'], ['c'],
+                         ['d', 'e'])
+        dsp.add_function('min', min, ['a', 'b'], ['c'])
+        dsp.add_data('a', 1)
+        self.assertEqual(fp, dsp.fingerprint())
+        self.assertNotEqual(fp, dsp.fingerprint(code=True))
+        self.assertEqual(dsp.fingerprint(True), sub_dsp.fingerprint(True))
+
+        dsp.set_default_value('a', {2, 'a', (3,)})
+        fp_dfl = dsp.fingerprint()
+        self.assertNotEqual(fp, fp_dfl)
+        dsp.add_function('max', max, ['a', 'b'], ['c'])
+        self.assertNotEqual(fp_dfl, dsp.fingerprint())
+
+        parent = sh.Dispatcher()
+        parent.add_dispatcher(sub_dsp, ['b'], ['d'], 'sub')
+        func = sh.SubDispatchFunction(sub_dsp, 'func', ['b'], ['d'])
+        parent.add_function('func', func, ['b'], ['e'])
+        fp = parent.fingerprint()
+        self.assertEqual(fp, parent.fingerprint())
+        parent.nodes['sub']['function'].add_data('x', 0)
+        self.assertNotEqual(fp, parent.fingerprint())
+        fp = parent.fingerprint()
+        func.dsp.set_default_value('b', 0)
+        self.assertNotEqual(fp, parent.fingerprint())
+        fp = parent.fingerprint()
+        func.outputs = ['c', 'd']  # Wrapper attributes are not versioned.
+        self.assertNotEqual(fp, parent.fingerprint())
+        func.outputs = ['d']
+        self.assertEqual(fp, parent.fingerprint())
+
+        code = 'import schedula as sh; dsp = sh.Dispatcher(); ' \
+               'dsp.add_data("a", {2, "a", (3,), "b"}); ' \
+               'dsp.add_function("f", sh.partial(max, 1), ["a"], ["b"]); ' \
+               'print(dsp.fingerprint())'
+        fps = {subprocess.check_output(
+            [sys.executable, '-c', code], env=dict(os.environ, **{
+                'PYTHONHASHSEED': str(i), 'PYTHONPATH': os.getcwd()
+            })
+        ) for i in range(3)}
+        self.assertEqual(len(fps), 1)
+
 
 class TestSubDMap(unittest.TestCase):
     def setUp(self):
@@ -902,6 +1176,34 @@ class TestAsyncParallel(unittest.TestCase):
             sol.result()
         self.assertFalse(set(sol) - {'b', 'a', 'err', 'd'})
 
+    @ddt.idata(['async', 'parallel', 'parallel-pool', 'parallel-dispatch'])
+    def test_timeout(self, executor):
+        dsp = sh.Dispatcher()
+        dsp.add_func(time.sleep, ['b'], inputs=['a'], timeout=.5)
+        dsp.add_func(lambda b: b, ['c'])
+        dsp.add_func(lambda a: a, ['d'])
+        start = time.time()
+        sol = dsp({'a': 5}, executor=executor)
+        with self.assertRaises(TimeoutError):
+            sol.result()
+        self.assertLess(time.time() - start, 4)
+        self.assertEqual(sol, {'a': 5, 'd': 5})
+        sh.shutdown_executors(False)  # The pool workers are left running.
+        sol = dsp({'a': 0}, executor=executor).result()
+        self.assertEqual(sol, {'a': 0, 'b': None, 'c': None, 'd': 0})
+
+    def test_deadline(self):
+        def sleep(x):
+            time.sleep(x)
+            return x
+
+        dsp = sh.Dispatcher()
+        dsp.add_func(sleep, ['b'], inputs=['a'], function_id='f')
+        dsp.add_func(sleep, ['c'], inputs=['b'], function_id='g')
+        sol = dsp({'a': .5}, deadline=.2, executor='async')
+        self.assertEqual(sol.result(), {'a': .5, 'b': .5})
+        self.assertEqual(sol.missed, {'c'})
+
     def test_multiple(self):
         from schedula.utils.asy import EXECUTORS, _parallel_pool_executor
         t, n, p = os.name == 'nt' and 2 or .5, len(self.dsp2.sub_dsp_nodes), 1
@@ -1724,6 +2026,98 @@ class TestDispatch(unittest.TestCase):
         select_output_kw = {'keys': (sh.SELF,), 'output_type': 'values'}
         self.assertEqual(dsp.dispatch(select_output_kw=select_output_kw), dsp)
 
+    def test_deadline(self):
+        import time
+        calls = []
+
+        def sleep(x):
+            calls.append(x)
+            time.sleep(x)
+            return x
+
+        dsp = sh.Dispatcher(raises=True)
+        dsp.add_func(sleep, ['b'], inputs=['a'], function_id='f')
+        dsp.add_func(sleep, ['c'], inputs=['b'], function_id='g')
+        dsp.add_func(sleep, ['d'], inputs=['c'], function_id='h')
+        sub = sh.Dispatcher()
+        sub.add_func(sleep, ['y'], inputs=['x'])
+        dsp.add_dispatcher(sub, {'c': 'x'}, {'y': 'e'})
+
+        sol = dsp({'a': .2}, deadline=.3)
+        self.assertEqual(sol, {'a': .2, 'b': .2, 'c': .2})
+        self.assertEqual(sol.missed, {'d'})
+        self.assertEqual(len(calls), 2)
+        sol = dsp({'a': .2}, ['e'], deadline=.3)
+        self.assertEqual(sol, {'a': .2, 'b': .2, 'c': .2})
+        self.assertEqual(sol.missed, {'e'})
+        sol = dsp({'a': 0}, deadline=1)
+        self.assertEqual(sol, {'a': 0, 'b': 0, 'c': 0, 'd': 0, 'e': 0})
+        self.assertIsNone(sol.missed)
+
+    def test_lazy(self):
+        from schedula.utils.sol import LazySolution
+        calls = []
+
+        def func(x):
+            calls.append(x)
+            return x + 1
+
+        sub = sh.Dispatcher()
+        sub.add_func(func, ['y'], inputs=['x'])
+        dsp = sh.Dispatcher()
+        for i in range(10):
+            dsp.add_func(func, ['b%d' % i], inputs=['a'])
+            dsp.add_func(func, ['c%d' % i], inputs=['b%d' % i])
+        dsp.add_dispatcher(sub, {'c0': 'x'}, {'y': 'd'})
+        dsp.add_func(func, ['e'], inputs=['f'], input_domain=lambda f: f > 0)
+
+        sol = dsp({'a': 0, 'f': 0}, lazy=True)
+        self.assertIsInstance(sol, LazySolution)
+        self.assertEqual(len(sol), 24)
+        self.assertEqual(calls, [])
+        self.assertEqual(sol['c1'], 2)
+        self.assertEqual(calls, [0, 1])
+        self.assertEqual(sol['d'], 3)
+        self.assertEqual(calls, [0, 1, 0, 1, 2])
+        self.assertEqual(sol['d'], 3)
+        self.assertEqual(sol['b0'], 1)
+        self.assertEqual(len(calls), 5)
+        self.assertNotIn('g', sol)
+        self.assertRaises(KeyError, sol.__getitem__, 'g')
+        self.assertIn('e', sol)
+        self.assertRaises(KeyError, sol.__getitem__, 'e')
+        self.assertNotIn('e', sol)  # Removed when it is not computed.
+        self.assertIsNone(sol.get('e'))
+
+        sol = dsp({'a': 0, 'f': 0}, lazy=True)
+        self.assertEqual(len(sol), 24)
+        res = dict(sol)  # The failing domain of `e` is skipped.
+        self.assertEqual(res, dict(dsp({'a': 0, 'f': 0})))
+        self.assertEqual(len(sol), 23)
+        self.assertEqual(sol, res)
+        self.assertEqual(dict(sol.items()), res)
+
+        d = sh.Dispatcher()
+        d.add_func(func, ['b'], inputs=['a'])
+        d.add_func(func, ['c'], inputs=['b'])
+        kw = {'inputs': {'a': 1, 'b': 5}, 'wildcard': True}
+        for outputs in (['b'], ['b', 'c']):
+            sol = d.dispatch(outputs=outputs, lazy=True, **kw)
+            self.assertEqual(sol['b'], 2)
+            self.assertEqual(dict(sol), d.dispatch(outputs=outputs, **kw))
+        sol = d.dispatch(outputs=['b', 'c'], lazy=True, **kw)
+        self.assertEqual((sol['c'], sol['b']), (6, 2))
+
+        for k, v in (('select_output_kw', {'keys': ['b']}), ('no_call', True),
+                     ('checkpoint', 'path'), ('_stream', print)):
+            with self.assertRaises(ValueError):
+                d.dispatch({'a': 1}, lazy=True, **{k: v})
+
+        sol = dsp({'a': 0}, ['c2'], lazy=True, executor='async')
+        self.assertEqual(set(sol), {'a', 'b2', 'c2'})
+        self.assertEqual(sol['c2'], 2)
+        sh.shutdown_executors(False)
+
 
 # noinspection PyUnusedLocal
 class TestBoundaryDispatch(unittest.TestCase):
@@ -2232,6 +2626,39 @@ class TestShrinkDispatcher(unittest.TestCase):
         self.assertEqual(set(shrink_dsp.dmap.nodes), sr)
         self.assertEqual(dict(sub_dsp.dmap.edges), sw)
 
+    def test_shrink_cache(self):
+        dsp = self.dsp_1
+        shrink_dsp = dsp.shrink_dsp(['a', 'b', 'd'], ['c', 'f'])
+        res = dsp.shrink_dsp(('a', 'b', 'd'), ('c', 'f'))
+        self.assertEqual(len(dsp._cache['shrink_dsp'][1]), 1)
+        self.assertIsNot(res.dmap, shrink_dsp.dmap)
+        self.assertEqual(res.dmap.edges, shrink_dsp.dmap.edges)
+        res.add_data('z')
+        self.assertNotIn('z', dsp.shrink_dsp(['a', 'b', 'd'], ['c', 'f']).nodes)
+
+        dsp.shrink_dsp(['a', 'b', 'd'], inputs_dist={'a': 1})
+        self.assertEqual(len(dsp._cache['shrink_dsp'][1]), 2)
+
+        dsp.add_function(function_id='h', inputs=['b'], outputs=['f'])
+        res = dsp.shrink_dsp(['a', 'b', 'd'], ['c', 'f'])
+        self.assertNotEqual(res.dmap.edges, shrink_dsp.dmap.edges)
+        self.assertEqual(len(dsp._cache['shrink_dsp'][1]), 1)
+
+        dsp.shrink_cache_size = 1
+        dsp.shrink_dsp(['a', 'b'], ['c'])
+        self.assertEqual(list(dsp._cache['shrink_dsp'][1]), [
+            (('a', 'b'), ('c',), None, True)
+        ])
+
+        dsp = self.dsp_of_dsp_1
+        sub_dsp = dsp.nodes['sub_dsp']['function']
+        res = dsp.shrink_dsp(['a', 'b'])
+        sub_dsp.add_function('h', inputs=['a'], outputs=['c'])
+        self.assertNotEqual(
+            res.nodes['sub_dsp']['function'].dmap.edges,
+            dsp.shrink_dsp(['a', 'b']).nodes['sub_dsp']['function'].dmap.edges
+        )
+
 
 class TestPipe(unittest.TestCase):
     def setUp(self):
@@ -2284,3 +2711,66 @@ class TestPipe(unittest.TestCase):
             "TypeError(\"'int' object is not iterable\")"
         err = n['sub_pipe']['dict']['error']
         self.assertEqual(e, err.replace('",)', '")').replace("isn't", "is not"))
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_resume(self):
+        calls = []
+        dsp = _setup_checkpoint_dsp(calls, 0)
+        res = dsp.dispatch({'a': 0}, checkpoint=self.path)
+        self.assertEqual(calls, [0, 1, 2, 3, 4, 5])
+        sol = dsp.resume(self.path)
+        self.assertEqual(sol, res)
+        self.assertEqual(list(sol.workflow.nodes), list(res.workflow.nodes))
+        self.assertEqual(calls, [0, 1, 2, 3, 4, 5])
+
+        res = dsp.dispatch({'a': 1}, ['c'], checkpoint={
+            'path': self.path, 'nodes': 10, 'seconds': 60
+        })
+        self.assertEqual(res, {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(dsp.resume(self.path), res)
+        self.assertEqual(calls[6:], [1, 2])
+
+        dsp.add_function('j', max, ['a'], ['c'])
+        self.assertRaises(ValueError, dsp.resume, self.path)
+
+    def test_kill(self):
+        import sys
+        import subprocess
+        code = 'from tests.test_dispatcher import _setup_checkpoint_dsp, ' \
+               '_Progress; _setup_checkpoint_dsp(_Progress()).dispatch(' \
+               '{"a": 0}, checkpoint=%r)' % self.path
+        root = os.path.dirname(os.path.dirname(__file__))
+        env = dict(os.environ, PYTHONPATH=root)
+        proc = subprocess.Popen(
+            [sys.executable, '-c', code], cwd=root, env=env,
+            stdout=subprocess.PIPE
+        )
+        for _ in range(4):  # Kill the dispatch after four functions.
+            proc.stdout.readline()
+        proc.kill()
+        proc.wait()
+        proc.stdout.close()
+
+        calls = []
+        dsp = _setup_checkpoint_dsp(calls)
+        t0 = time.time()
+        sol = dsp.resume(self.path)
+        t1 = time.time()
+        res = _setup_checkpoint_dsp([], 0).dispatch({'a': 0})
+        self.assertEqual(sol, res)
+        self.assertLessEqual(len(calls), 3)
+        self.assertLess(t1 - t0, 6 * .2)
+
+        calls.clear()  # The resumed dispatch is logged as well.
+        self.assertEqual(dsp.resume(self.path), res)
+        self.assertEqual(calls, [])
@@ -32,3 +32,33 @@ class TestImport(unittest.TestCase):
         os.environ['IMPORT_ALL'] = 'False'
         mdl = self.reload()
         self.assertTrue(set(mdl.__all__).isdisjoint(mdl.__dict__))
+
+
+@unittest.skipIf(
+    sys.version_info[:2] < (3, 7),
+    'Not for python version %s.' % '.'.join(map(str, sys.version_info[:3]))
+)
+class TestImportTime(unittest.TestCase):
+    # Modules that must be imported only when they are used.
+    heavy = {
+        'regex', 'jinja2', 'pygments', 'flask', 'werkzeug', 'docutils',
+        'graphviz', 'smart_open', 'pandas', 'numpy'
+    }
+    # Startup budget [us], generous to absorb slow and loaded machines.
+    budget = {
+        'import schedula; schedula.Dispatcher()({})': 200000,
+        'import schedula.utils.drw': 500000,
+        'import schedula.utils.web': 500000,
+        'import schedula.utils.form': 500000
+    }
+
+    def test_import_time(self):
+        from benchmarks.bench_import import import_times
+        for code, budget in self.budget.items():
+            with self.subTest(code=code):
+                times = import_times(code)
+                self.assertTrue(self.heavy.isdisjoint(times), sorted(
+                    self.heavy.intersection(times)
+                ))
+                total = sum(v[1] for v in times.values() if v[2] == 0)
+                self.assertLess(total, budget)
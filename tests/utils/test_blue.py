@@ -93,3 +93,46 @@ class TestBlueDispatcher(unittest.TestCase):
         self.assertEqual(dsp.solution, {})
         self.assertEqual(s, dsp())
         self.assertEqual(s, blue())
+
+    def test_register_cow(self):
+        blue = self.dsp.blue()
+        dsp = blue.register(copy='cow')
+        self.assertEqual(dsp(), self.dsp())
+        template = blue._template[1]
+        other = blue.register(copy='cow')
+        self.assertIsNot(other, dsp)
+        self.assertIs(other.nodes['input'], dsp.nodes['input'])
+        self.assertIs(blue._template[1], template)
+
+        other.add_data('k', 0)
+        self.assertNotIn('k', dsp.nodes)
+        self.assertNotIn('k', blue.register(copy='cow').nodes)
+
+        dsp_id, sub_blue = next(
+            (kw['dsp_id'], kw['dsp']) for m, kw in blue.deferred
+            if m == 'add_dispatcher'
+        )
+        sub_blue.add_data('k', 1)
+        dsp = blue.register(copy='cow')
+        self.assertIsNot(blue._template[1], template)
+        sub_dsp = dsp.get_node(dsp_id)[0]
+        self.assertEqual(sub_dsp.default_values['k']['value'], 1)
+
+        n = len(blue.deferred)
+        self.assertEqual(blue(), self.dsp())
+        template = blue._template[1]
+        blue()
+        self.assertIs(blue._template[1], template)
+        blue.add_data('l', 2)
+        self.assertEqual(blue()['l'], 2)
+        self.assertEqual(len(blue.deferred), n + 1)
+        self.assertIsNot(blue._template[1], template)
+
+    def test_call(self):
+        dsp = sh.Dispatcher()
+        dsp.add_func(lambda a: a + 1, ['b'])
+        blue = sh.DispatchPipe(dsp, 'pipe', ['a'], output_type='all').blue()
+        sol1, sol2 = blue(1), blue(5)
+        self.assertIsNot(sol1, sol2)
+        self.assertEqual(sol1, {'a': 1, 'b': 2})
+        self.assertEqual(sol2, {'a': 5, 'b': 6})
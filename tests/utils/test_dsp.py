@@ -242,6 +242,43 @@ class TestDispatcherUtils(unittest.TestCase):
         func = sh.parent_func(func)
         self.assertEqual(func, fo)
 
+    @unittest.skipIf(EXTRAS == 'micropython', 'Not for extra %s.' % EXTRAS)
+    def test_signature_cache(self):
+        import gc
+        from schedula.utils.dsp import _get_par_args, _signatures
+
+        def f(a, b, c=0, *args, d=0):
+            return a + b + c + d
+
+        par = _get_par_args(f)
+        self.assertEqual(tuple(par), ('a', 'b', 'c'))
+        par.pop('a')  # The cache cannot be modified.
+        self.assertEqual(tuple(_get_par_args(f, True)), ('a', 'b'))
+        self.assertIs(_get_par_args(f)['a'], _get_par_args(f)['a'])
+        self.assertIn(id(f), _signatures)
+
+        f.__defaults__ = (0, 0)
+        self.assertEqual(tuple(_get_par_args(f, True)), ('a',))
+
+        func = sh.partial(f, 1)
+        self.assertEqual(tuple(_get_par_args(func)), ('b', 'c'))
+        func.keywords['b'] = 2
+        self.assertEqual(tuple(_get_par_args(func)), ())
+        func = sh.add_args(sh.partial(f, 1), 2)
+        self.assertEqual(
+            str(func.__signature__), '(none, none, b=0, c=0, *args, d=0)'
+        )
+        self.assertIs(func.__signature__, func.__signature__)
+        func.n = 1
+        self.assertEqual(
+            str(func.__signature__), '(none, b=0, c=0, *args, d=0)'
+        )
+
+        key = id(f)
+        del f, func, par
+        gc.collect()
+        self.assertNotIn(key, _signatures)
+
 
 class TestSubDispatcher(unittest.TestCase):
     def setUp(self):
@@ -326,6 +363,13 @@ class TestSubDispatchFunction(unittest.TestCase):
         self.assertEqual(fun.__name__, 'F')
         if EXTRAS != 'micropython':
             self.assertEqual(str(fun.__signature__), '(a, b, **kw)')
+            self.assertIs(fun.__signature__, fun.__signature__)
+            fun.dsp.set_default_value('b', 1)
+            self.assertEqual(str(fun.__signature__), '(a, b=1, **kw)')
+            fun.inputs = ['b', 'a']
+            self.assertEqual(str(fun.__signature__), '(b=1, a, **kw)')
+            fun.inputs = ['a', 'b']
+            fun.dsp.set_default_value('b')
 
         # noinspection PyCallingNonCallable
         self.assertEqual(fun(2, 1), 1)
@@ -380,6 +424,37 @@ class TestSubDispatchFunction(unittest.TestCase):
         self.assertEqual(fun({'x': 3}), 3)
         self.assertRaises(TypeError, fun, {'x': 2}, x=2)
 
+    @unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+    def test_vectorize(self):
+        import numpy as np
+        fun = sh.SubDispatchFunction(
+            self.dsp_1, 'F', ['a', 'b'], ['c', 'a'], vectorize=True
+        )
+        self.assertEqual(fun.__name__, 'F')
+        c, a = fun(np.array([2, 3, 4]), np.array([1, -1, 5]))
+        np.testing.assert_array_equal(c, [2, 3, 5])
+        self.assertEqual(a.mask.tolist(), [False, True, False])
+        self.assertEqual(a.compressed().tolist(), [1, 5])
+        self.assertEqual(fun(2, 1), [2, 1])
+
+        dsp = sh.Dispatcher()
+        dsp.add_function(
+            'f', lambda x, y: (x + y, x - y), ['x', 'y'], ['a', 'b'],
+            vectorizable=True
+        )
+        dsp.add_data('y', 1)
+        dsp.add_function(
+            'g', np.log, ['a'], ['c'], vectorizable=True,
+            input_domain=lambda a: a > 0
+        )
+        fun = sh.SubDispatchFunction(dsp, 'F', ['x'], ['b', 'c'],
+                                     vectorize=True)
+        b, c = fun(np.array([-2., 0., np.e - 1]))
+        np.testing.assert_array_equal(b, [-3., -1., np.e - 2])
+        self.assertEqual(c.mask.tolist(), [True, False, False])
+        np.testing.assert_allclose(c.compressed(), [0., 1.])
+        self.assertIs(fun.dsp.nodes['f']['function'].row_wise, False)
+
 
 class TestSubDispatchPipe(unittest.TestCase):
     def setUp(self):
@@ -659,6 +734,63 @@ class TestDispatchPipe(unittest.TestCase):
         self.assertEqual(fun(x=3), 3)
 
 
+class TestMultiDispatchPipe(unittest.TestCase):
+    def setUp(self):
+        dsp = sh.Dispatcher()
+        dsp.add_data('b', 1)
+        dsp.add_function('max', max, inputs=['a', 'b'], outputs=['c'])
+        dsp.add_function('min', min, inputs=['a', 'b'], outputs=['d'])
+        dsp.add_function('sum', lambda *a: sum(a), ['c', 'd'], ['e'])
+        self.dsp = dsp
+
+    def test_function(self):
+        fun = sh.MultiDispatchPipe(self.dsp, 'F', ['a', 'b'], [['e'], ['c']])
+        self.assertEqual(fun.__name__, 'F')
+        self.assertEqual(fun.outputs, ['e'])
+        self.assertEqual(fun.outputs_list, [['e'], ['c']])
+        self.assertEqual(tuple(fun.__signature__.parameters), ('a', 'b'))
+        self.assertEqual(fun(2), 3)
+        self.assertEqual(fun(2, _outputs=['c']), 2)
+        self.assertEqual(fun(0, 3, _outputs=['d', 'c']), [0, 3])
+        self.assertEqual(set(fun.solution), {'a', 'b', 'c', 'd'})
+        self.assertEqual(fun(a=0, _outputs=['d', 'c']), [0, 1])
+        self.assertEqual(fun.cache_info(), {
+            'hits': 3, 'misses': 1, 'maxsize': 128, 'currsize': 3,
+            'hit_rate': .75
+        })
+
+        fun = sh.MultiDispatchPipe(self.dsp, 'F', ['a', 'b'], maxsize=1)
+        self.assertIsNone(fun.outputs)
+        self.assertEqual(fun(2, 3), {'a': 2, 'b': 3, 'c': 3, 'd': 2, 'e': 5})
+        self.assertEqual(fun(2, _outputs=['d']), 1)
+        self.assertEqual(list(fun.pipes), [('d',)])
+        self.assertEqual(fun.cache_info()['hit_rate'], 0)
+        fun.cache_clear()
+        self.assertEqual(fun.cache_info()['currsize'], 0)
+
+        fun = fun.blue().register()
+        self.assertEqual(fun.maxsize, 1)
+        self.assertEqual(fun(2, _outputs=['e']), 3)
+
+        dsp = sh.Dispatcher()
+        dsp.add_function('max', max, inputs=['a', 'b'], outputs=['cc'])
+        dsp.add_function('min', min, inputs=['a', 'b'], outputs=['dd'])
+        fun = sh.MultiDispatchPipe(dsp, 'F', ['a', 'b'], [['cc'], ['cc', 'dd']])
+        blue = fun.blue().register()
+        self.assertEqual(blue.outputs, ['cc'])
+        self.assertEqual(blue.outputs_list, [['cc'], ['cc', 'dd']])
+        self.assertEqual(list(blue.pipes), list(fun.pipes))
+        self.assertEqual(blue(1, 2), 2)
+        self.assertEqual(blue(1, 2, _outputs=['cc', 'dd']), [2, 1])
+
+        fun = sh.MultiDispatchPipe(self.dsp, 'F', ['a', 'b'], [['e']])
+        dsp = sh.Dispatcher()
+        dsp.add_function('F', fun, ['a', 'b'], ['e'])
+        sol = dsp({'a': 1, 'b': 5})
+        self.assertEqual(sol['e'], 6)
+        self.assertIs(sol.workflow.nodes['F']['solution'], fun.solution)
+
+
 class TestMapDispatch(unittest.TestCase):
     def setUp(self):
         dsp_1 = sh.BlueDispatcher(raises='')
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+import os
+import copy
+import unittest
+import schedula as sh
+
+EXTRAS = os.environ.get('EXTRAS', 'all')
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestDoctest(unittest.TestCase):
+    def runTest(self):
+        import doctest
+        import schedula.utils.frozen as utl
+        failure_count, test_count = doctest.testmod(
+            utl, optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS
+        )
+        self.assertGreater(test_count, 0, (failure_count, test_count))
+        self.assertEqual(failure_count, 0, (failure_count, test_count))
+
+
+def _setup_dsp():
+    sub = sh.Dispatcher(name='sub')
+    sub.add_data('y', wait_inputs=True, function=lambda x: sum(x.values()))
+    sub.add_function('f', lambda x: x + 1, ['x'], ['y'])
+    sub.add_function('g', lambda x: x * 2, ['x'], ['y'], input_domain=bool)
+
+    dsp = sh.Dispatcher(name='model')
+    dsp.add_data('a', 1)
+    dsp.add_function(
+        'min', lambda a, b: (min(a, b), a), ['a', 'b'], ['c', sh.SINK],
+        weight=2
+    )
+    dsp.add_function('max', max, ['a', 'b'], ['c'])
+    dsp.add_function('double', lambda c: 2 * c, ['c'], ['d'])
+    dsp.add_dispatcher(sub, {'d': 'x'}, {'y': 'e'}, 'sub')
+    dsp.add_dispatcher(sub, {'c': 'x', 'e': 'x'}, {'y': 'f'}, 'sub2',
+                       input_domain=lambda *args: True)
+    sub_dispatch = sh.SubDispatchFunction(sub, 'fun', ['x'], ['y'])
+    dsp.add_function('fun', sub_dispatch, ['f'], ['g'])
+    return dsp
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestFrozenDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.dsp = _setup_dsp()
+        self.frozen = self.dsp.freeze()
+
+    def test_dispatch(self):
+        dsp, frozen = self.dsp, self.frozen
+        self.assertIsInstance(frozen, sh.Dispatcher)
+        self.assertIsInstance(frozen.get_node('sub')[0], type(frozen))
+        for kw in ({}, {'inputs': {'b': 3}}, {'inputs': {'a': 5, 'b': 3}},
+                   {'inputs': {'b': 3}, 'outputs': ['e']},
+                   {'inputs': {'b': 3}, 'shrink': True, 'outputs': ['g']},
+                   {'inputs': {'b': 3, 'e': 1}, 'outputs': ['e'],
+                    'wildcard': True},
+                   {'inputs': {'b': 3}, 'no_call': True},
+                   {'inputs': {'b': 3}, 'rm_unused_nds': True}):
+            sol, frz = dsp.dispatch(**kw), frozen.dispatch(**kw)
+            self.assertEqual(frz, sol)
+            self.assertEqual(frz.workflow.succ, sol.workflow.succ)
+            self.assertEqual(frz.dist, sol.dist)
+        self.assertIsInstance(frozen.solution, type(dsp.solution))
+
+    def test_immutable(self):
+        dsp, frozen = self.dsp, self.frozen
+        h = hash(frozen)
+        for method, args in (('add_data', ('z',)), ('set_default_value', 'a'),
+                             ('add_function', ('f', max, ['a'], ['z'])),
+                             ('add_func', (max, ['z'])),
+                             ('add_dispatcher', (sh.Dispatcher(), {}, {})),
+                             ('add_from_lists', ()), ('add_from_records', ()),
+                             ('extend', ())):
+            self.assertRaises(TypeError, getattr(frozen, method), *args)
+        self.assertIs(frozen.freeze(), frozen)
+
+        dmap, records = frozen.dmap, dict(frozen._records)
+        for method, args in (('add_node', ('z',)), ('remove_node', ('a',)),
+                             ('add_nodes_from', (['z'],)),
+                             ('remove_nodes_from', (['a'],)),
+                             ('add_edge', ('a', 'z')),
+                             ('add_edges_from', ([('a', 'z')],)),
+                             ('remove_edge', ('a', 'max')),
+                             ('remove_edges_from', ([('a', 'max')],))):
+            self.assertRaises(TypeError, getattr(dmap, method), *args)
+        self.assertEqual(frozen._records.keys(), frozen.nodes.keys())
+        self.assertEqual(frozen._records, records)
+        self.assertIn('max', dmap.succ['a'])
+        self.assertEqual(type(dmap.copy().remove_node('a')), type(dsp.dmap))
+
+        dfl, sol = frozen.default_values, dsp({'b': 3})
+        with self.assertRaises(TypeError):
+            dfl['z'] = {'value': 0}
+        with self.assertRaises(TypeError):
+            dfl['a']['value'] = 0
+        parent = sh.Dispatcher()
+        self.assertRaises(
+            TypeError, parent.add_dispatcher, frozen, {'a': 'a', 'b': 'b'},
+            {'c': 'c'}, 'S', include_defaults=True
+        )
+        self.assertEqual(parent.nodes, {})
+        self.assertEqual(parent.default_values, {})
+        self.assertEqual(frozen.default_values['a']['value'], 1)
+        self.assertEqual(frozen({'b': 3}), sol)
+        parent.add_dispatcher(frozen, {'b': 'b'}, {'c': 'c'}, 'S')
+        self.assertEqual(parent({'b': 3}), {'b': 3, 'c': sol['c']})
+        self.assertEqual(copy.deepcopy(frozen)({'b': 3}), sol)
+
+        dsp.add_data('z')
+        dsp.set_default_value('a', 2)
+        dsp.get_node('sub')[0].add_data('w')
+        self.assertNotIn('z', frozen.nodes)
+        self.assertEqual(frozen.default_values['a']['value'], 1)
+        self.assertNotIn('w', frozen.get_node('sub')[0].nodes)
+        self.assertEqual(hash(frozen), h)
+
+        blue = frozen.blue().register()
+        self.assertNotIsInstance(blue, type(frozen))
+        self.assertEqual(blue.add_data('z'), 'z')
+
+    def test_hash(self):
+        import subprocess
+        import sys
+        frozen = self.frozen
+        self.assertEqual(hash(frozen), hash(_setup_dsp().freeze()))
+        self.assertEqual({frozen: 1}[frozen], 1)
+
+        dsp = _setup_dsp()
+        dsp.get_node('sub')[0].add_data('w')
+        self.assertNotEqual(hash(frozen), hash(dsp.freeze()))
+        dsp = _setup_dsp()
+        dsp.add_function('min', min, ['a', 'b'], ['c'], weight=3)
+        self.assertNotEqual(hash(frozen), hash(dsp.freeze()))
+
+        code = 'from tests.utils.test_frozen import _setup_dsp; ' \
+               'print(hash(_setup_dsp().freeze()))'
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        env = dict(os.environ, PYTHONHASHSEED='123', PYTHONPATH=root)
+        out = subprocess.check_output(
+            [sys.executable, '-c', code], cwd=root, env=env
+        )
+        self.assertEqual(int(out), hash(frozen))
+
+    def test_pickle(self):
+        import dill
+        frozen = self.frozen
+        obj = dill.loads(dill.dumps(frozen))
+        self.assertEqual(hash(obj), hash(frozen))
+        self.assertEqual(obj._records.keys(), frozen._records.keys())
+        self.assertEqual(obj({'b': 3}), frozen({'b': 3}))
+        self.assertRaises(TypeError, obj.add_data, 'z')
+
+    def test_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        frozen, inputs = self.frozen, [{'b': i} for i in range(50)]
+        with ThreadPoolExecutor(4) as executor:
+            res = list(executor.map(frozen.dispatch, inputs))
+        self.assertEqual(res, [self.dsp.dispatch(i) for i in inputs])
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+import os
+import unittest
+import schedula as sh
+from schedula.utils.hook import HOOKS
+
+EXTRAS = os.environ.get('EXTRAS', 'all')
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestDoctest(unittest.TestCase):
+    def runTest(self):
+        import doctest
+        import schedula.utils.hook as hook
+        failure_count, test_count = doctest.testmod(
+            hook, optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS
+        )
+        self.assertGreater(test_count, 0, (failure_count, test_count))
+        self.assertEqual(failure_count, 0, (failure_count, test_count))
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestHooks(unittest.TestCase):
+    def setUp(self):
+        def fail(b):
+            raise ValueError(b)
+
+        dsp = sh.Dispatcher(name='model')
+        dsp.add_func(lambda a: a + 1, ['b'], function_id='f')
+        dsp.add_func(fail, ['c'], function_id='g')
+        dsp.add_function(
+            'h', lambda b: b, ['b'], ['d'], input_domain=lambda b: b < 0
+        )
+        self.dsp = dsp
+
+    def tearDown(self):
+        sh.unregister_hook()
+        self.assertEqual(HOOKS, {})
+
+    def test_events(self):
+        events = []
+
+        def hook(event):
+            def _hook(source, key, **kw):
+                events.append((event, key, sorted(kw)))
+
+            return _hook
+
+        for e in ('node_start', 'node_end', 'node_error', 'node_skip'):
+            sh.register_hook(e, hook(e))
+        self.assertRaises(ValueError, sh.register_hook, 'unknown', hook(''))
+        sol = self.dsp({'a': 1})
+        self.assertEqual(sol, {'a': 1, 'b': 2})
+        self.assertEqual(events, [
+            ('node_start', 'f', ['attr']), ('node_end', 'f', ['attr']),
+            ('node_start', 'g', ['attr']),
+            ('node_error', 'g', ['attr', 'error']),
+            ('node_end', 'g', ['attr']), ('node_skip', 'h', ['attr'])
+        ])
+
+        sh.unregister_hook('node_start')
+        self.assertNotIn('node_start', HOOKS)
+        del events[:]
+        self.dsp({'a': 1})
+        self.assertEqual([e[0] for e in events], [
+            'node_end', 'node_error', 'node_end', 'node_skip'
+        ])
+
+    def test_failing_hook(self):
+        def hook(*args, **kwargs):
+            raise RuntimeError
+
+        import logging
+        sh.register_hook('node_start', hook)
+        logging.disable(False)
+        try:
+            with self.assertLogs('schedula.utils.hook', 'WARNING') as cm:
+                self.assertEqual(self.dsp({'a': 1}), {'a': 1, 'b': 2})
+        finally:
+            logging.disable()
+        self.assertEqual(len(cm.output), 2)
+
+    def test_executor(self):
+        with sh.MetricsCollector() as metrics:
+            sol = self.dsp.dispatch({'a': 1}, executor='async')
+            self.assertRaises(ValueError, sol.result)
+        self.assertEqual(sol, {'a': 1, 'b': 2})
+        self.assertEqual(HOOKS, {})
+        counters = metrics.counters
+        for k in ('a', 'b', 'f', 'g'):
+            self.assertEqual(counters['submit', k], 1)
+            self.assertEqual(counters['complete', k], 1)
+        self.assertEqual(counters['node_error', 'g'], 1)
+        self.assertEqual(counters['node_skip', 'h'], 1)
+        self.assertEqual(metrics.inflight, {'async': 0})
+        self.assertEqual(metrics.histograms['f'][-1], 1)
+        self.assertIn(
+            'schedula_executor_inflight{executor="async"} 0',
+            metrics.to_prometheus()
+        )
+        sh.shutdown_executors(False)
+
+    def test_cache_hit(self):
+        pipe = sh.MultiDispatchPipe(self.dsp, 'pipe', ['a'], [['b']])
+        with sh.MetricsCollector() as metrics:
+            for i in range(3):
+                self.assertEqual(pipe(i), i + 1)
+        self.assertEqual(
+            metrics.counters['cache_hit', 'pipe', 'pipe'],
+            pipe.cache_info()['hits']
+        )
+        self.assertIn(
+            'schedula_node_events_total{event="cache_hit",node="pipe",'
+            'cache="pipe"} %d' % pipe.cache_info()['hits'],
+            metrics.to_prometheus()
+        )
+        self.assertGreater(pipe.cache_info()['hits'], 1)
+
+        import tempfile
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            self.dsp.dispatch({'a': 1}, ['b'], checkpoint=path)
+            with sh.MetricsCollector() as metrics:
+                self.assertEqual(self.dsp.resume(path)['b'], 2)
+        finally:
+            os.remove(path)
+        self.assertEqual(metrics.counters['cache_hit', 'f', 'checkpoint'], 1)
+        self.assertNotIn(('node_start', 'f'), metrics.counters)
+
+
+@unittest.skipIf(EXTRAS not in ('all', 'web'), 'Not for extra %s.' % EXTRAS)
+class TestMetricsWeb(unittest.TestCase):
+    def test_metrics(self):
+        dsp = sh.Dispatcher(name='model')
+        dsp.add_func(lambda a: a + 1, ['b'], function_id='f"\n')
+        metrics = sh.MetricsCollector(buckets=(.5, 1)).register()
+        try:
+            client = dsp.web(run=False, metrics=metrics).app().test_client()
+            res = client.post('/model', json={'args': [{'a': 1}]})
+            self.assertEqual(res.json['return'], {'a': 1, 'b': 2})
+        finally:
+            metrics.unregister()
+        res = client.get('/metrics')
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.mimetype, 'text/plain')
+        text = res.get_data(as_text=True)
+        self.assertIn(
+            'schedula_node_events_total{event="node_start",node="f\\"\\n"} 1',
+            text
+        )
+        self.assertIn(
+            'schedula_node_duration_seconds_bucket{node="f\\"\\n",le="+Inf"} '
+            '1', text
+        )
+        self.assertEqual(
+            dsp.web(run=False).app().test_client().get('/metrics').status_code,
+            404
+        )
@@ -5,7 +5,10 @@
 # Licensed under the EUPL (the 'Licence');
 # You may not use this work except in compliance with the Licence.
 # You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+import io
 import os
+import shutil
+import pathlib
 import unittest
 import tempfile
 import schedula as sh
@@ -13,17 +16,24 @@ import schedula as sh
 EXTRAS = os.environ.get('EXTRAS', 'all')
 
 
+def _mmap_info(a):
+    return type(a).__name__, int(a.sum()), os.getpid()
+
+
 @unittest.skipIf(EXTRAS not in ('all', 'io'), 'Not for extra %s.' % EXTRAS)
 class TestDoctest(unittest.TestCase):
     def runTest(self):
         import doctest
         import schedula.utils.io as utl
+        import schedula.utils.io.ref as ref
+        import schedula.utils.io.ckpt as ckpt
 
-        failure_count, test_count = doctest.testmod(
-            utl,
-            optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS)
-        self.assertGreater(test_count, 0, (failure_count, test_count))
-        self.assertEqual(failure_count, 0, (failure_count, test_count))
+        for mdl in (utl, ref, ckpt):
+            failure_count, test_count = doctest.testmod(
+                mdl,
+                optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS)
+            self.assertGreater(test_count, 0, (failure_count, test_count))
+            self.assertEqual(failure_count, 0, (failure_count, test_count))
 
 
 @unittest.skipIf(EXTRAS not in ('all', 'io'), 'Not for extra %s.' % EXTRAS)
@@ -41,7 +51,9 @@ class TestReadWrite(unittest.TestCase):
 
         self.dsp = dsp
 
-        self.tmp = tempfile.mkstemp()[1]
+        directory = tempfile.mkdtemp()  # Holds the side and codec files.
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        self.tmp = os.path.join(directory, 'model')
 
     def test_save_dispatcher(self):
         sh.save_dispatcher(self.dsp, self.tmp)
@@ -52,6 +64,161 @@ class TestReadWrite(unittest.TestCase):
         self.assertEqual(dsp.dmap.nodes['a']['type'], 'data')
         self.assertEqual(dsp.dispatch()['b'], 6)
 
+    def test_ref_format(self):
+        import numpy as np
+        from schedula.utils.io.ref import LazyFunction, side_path
+        from .test_frozen import _setup_dsp
+        dsp = _setup_dsp()
+        dsp.add_data('arr', np.arange(5))
+        dsp.add_function('sum', np.sum, ['arr'], ['s'])
+        sh.save_dispatcher(dsp, self.tmp, format='ref')
+        self.assertTrue(os.path.isfile(side_path(self.tmp)))
+        self.assertRaises(ValueError, sh.save_dispatcher, dsp, self.tmp, 'x')
+
+        for lazy in (False, True):
+            obj = sh.load_dispatcher(self.tmp, lazy=lazy)
+            self.assertEqual(obj.fingerprint(), dsp.fingerprint())
+            self.assertEqual(  # Shared sub-dispatchers are preserved.
+                obj.get_node('sub')[0] is obj.get_node('sub2')[0],
+                dsp.get_node('sub')[0] is dsp.get_node('sub2')[0]
+            )
+            self.assertIn(obj, set(obj.get_node('sub')[0]._parents))
+            for kw in ({}, {'inputs': {'b': 3}}, {'outputs': ['s', 'g']},
+                       {'inputs': {'a': 5, 'b': 3}, 'outputs': ['g']}):
+                sol, res = dsp.dispatch(**kw), obj.dispatch(**kw)
+                self.assertEqual(set(res), set(sol))
+                self.assertEqual(
+                    {k: v for k, v in res.items() if k != 'arr'},
+                    {k: v for k, v in sol.items() if k != 'arr'}
+                )
+            func = obj.get_node('sum', node_attr='function')[0]
+            self.assertEqual(isinstance(func, LazyFunction), lazy)
+            self.assertIs(getattr(func, 'func', func), np.sum)
+            self.assertEqual(repr(obj.counter.__self__),
+                             repr(dsp.counter.__self__))
+
+        # A lazy model can be saved in any format.
+        sh.save_dispatcher(obj, self.tmp)
+        self.assertEqual(sh.load_dispatcher(self.tmp)({'b': 3})['g'], 31)
+        sh.save_dispatcher(obj, self.tmp, format='ref')
+        self.assertEqual(sh.load_dispatcher(self.tmp)({'b': 3})['g'], 31)
+
+        frozen = dsp.freeze()
+        sh.save_dispatcher(frozen, self.tmp, format='ref')
+        obj = sh.load_dispatcher(self.tmp)
+        self.assertIsInstance(obj, type(frozen))
+        self.assertEqual(hash(obj), hash(frozen))
+
+        sh.save_dispatcher(sh.Dispatcher(), self.tmp, format='ref')
+        self.assertFalse(os.path.isfile(side_path(self.tmp)))
+
+    def test_compression(self):
+        import io
+        import importlib
+        from schedula.utils.io import CODECS
+        from schedula.utils.io.ref import side_path
+        magic = {
+            'gzip': b'\x1f\x8b', 'bz2': b'BZh', 'lzma': b'\xfd7zXZ',
+            'zstandard': b'\x28\xb5\x2f\xfd'
+        }
+        for ext, codec in sorted(CODECS.items()):
+            try:
+                importlib.import_module(codec)
+            except ImportError:
+                continue
+            path = self.tmp + ext
+            for fmt in ('dill', 'ref'):
+                sh.save_dispatcher(self.dsp, path, format=fmt)
+                for fn in (path, side_path(path) if fmt == 'ref' else path):
+                    with open(fn, 'rb') as f:
+                        self.assertEqual(
+                            f.read(len(magic[codec])), magic[codec]
+                        )
+                self.assertEqual(sh.load_dispatcher(path).dispatch()['b'], 6)
+            sh.save_default_values(self.dsp, path)
+            dsp = sh.Dispatcher(dmap=self.dsp.dmap)
+            sh.load_default_values(dsp, path)
+            self.assertEqual(dsp.dispatch()['b'], 6)
+
+        # Open file objects are neither compressed nor closed.
+        for fmt in ('dill', 'ref'):
+            f = io.BytesIO()
+            dsp = sh.Dispatcher()
+            dsp.add_function(function=max, inputs=['a', 'b'], outputs=['c'])
+            sh.save_dispatcher(dsp, f, format=fmt)
+            f.seek(0)
+            self.assertEqual(sh.load_dispatcher(f)({'a': 1, 'b': 2})['c'], 2)
+            self.assertFalse(f.closed)
+        self.assertRaises(
+            ValueError, sh.save_dispatcher, self.dsp, io.BytesIO(), 'ref'
+        )
+        with open(self.tmp, 'wb') as f:
+            sh.save_dispatcher(self.dsp, f, format='ref')
+        self.assertEqual(sh.load_dispatcher(self.tmp).dispatch()['b'], 6)
+
+    def test_memory_map(self):
+        import dill
+        import numpy as np
+        arr = np.arange(100000, dtype=float)
+        np.save(self.tmp + '.npy', arr)
+        arr.tofile(self.tmp + '.raw')
+        mmaps = [
+            sh.MemoryMap(self.tmp + '.npy'),
+            sh.MemoryMap(self.tmp + '.raw', 'float64', (1000, 100)),
+            sh.MemoryMap(self.tmp + '.raw', 'float64', offset=8)
+        ]
+        self.assertEqual(mmaps[0].load().sum(), arr.sum())
+        self.assertIs(mmaps[0].load(), mmaps[0].load())
+        self.assertEqual(mmaps[1].load().shape, (1000, 100))
+        self.assertEqual(mmaps[2].load().sum(), arr.sum())
+        raw = sh.MemoryMap(self.tmp + '.raw', offset=8).load()
+        self.assertEqual(bytes(raw), arr.tobytes()[8:])
+        obj = sh.MemoryMap(pathlib.Path(self.tmp + '.npy'))
+        self.assertEqual(obj.path, mmaps[0].path)
+        self.assertEqual(obj.load().sum(), arr.sum())
+        self.assertEqual(repr(obj), repr(mmaps[0]))
+        self.assertRaises(ValueError, mmaps[0].load().__setitem__, 0, 1)
+
+        # Only the reference is pickled.
+        obj = dill.loads(dill.dumps(mmaps[0]))
+        self.assertLess(len(dill.dumps(mmaps[0])), 200)
+        self.assertIsNone(obj._value)
+        self.assertEqual(repr(obj), repr(mmaps[0]))
+
+        dsp = sh.Dispatcher()
+        dsp.add_data('a', mmaps[0])
+        dsp.add_data('b', mmaps[1])
+        dsp.add_function('info', _mmap_info, ['a'], ['c'],
+                         input_domain=lambda a: a.shape == (100000,))
+        sub = sh.Dispatcher()
+        sub.add_function('info', _mmap_info, ['x'], ['y'])
+        dsp.add_dispatcher(sub, {'b': 'x'}, {'x': 'x', 'y': 'e'})
+        sol = dsp.dispatch()
+        self.assertIs(sol['a'], mmaps[0])  # It is not materialized.
+        self.assertIs(sol['x'], mmaps[1])
+        self.assertEqual(sol['c'][:2], ('memmap', arr.sum()))
+        self.assertEqual(sol['e'][:2], ('memmap', arr.sum()))
+
+        sol = dsp.dispatch(executor='parallel-pool').result()
+        self.assertEqual(sol['c'][:2], ('memmap', arr.sum()))
+        self.assertNotEqual(sol['c'][2], os.getpid())
+        sh.shutdown_executors()
+
+        dsp.add_data('d', arr)
+        sh.save_default_values(dsp, self.tmp, mmap_size=arr.nbytes)
+        self.assertLess(os.path.getsize(self.tmp), arr.nbytes / 10)
+        obj = sh.Dispatcher(dmap=dsp.dmap)
+        sh.load_default_values(obj, self.tmp)
+        value = obj.default_values['d']['value']
+        self.assertIsInstance(value, sh.MemoryMap)
+        self.assertTrue(os.path.isabs(value.path))
+        self.assertEqual(value.load().sum(), arr.sum())
+        self.assertEqual(obj.default_values['a']['value'].path,
+                         mmaps[0].path)
+        self.assertRaises(
+            ValueError, sh.save_default_values, dsp, io.BytesIO(), 0
+        )
+
     def test_save_default_values(self):
         sh.save_default_values(self.dsp, self.tmp)
 
@@ -77,3 +244,15 @@ class TestReadWrite(unittest.TestCase):
         )
         self.assertEqual(dsp.dmap.nodes[self.fun_id]['function'](1), 2)
         self.assertEqual(dsp.dispatch()['b'], 6)
+
+    def test_load_pipe(self):
+        self.assertRaises(TypeError, sh.save_pipe, self.dsp, self.tmp)
+        for cls in (sh.SubDispatchPipe, sh.DispatchPipe):
+            pipe = cls(self.dsp, 'pipe', ['a'], ['b'])
+            self.assertEqual(pipe(2), 3)
+            sh.save_pipe(pipe, self.tmp)
+            func = sh.load_pipe(self.tmp)
+            self.assertIsInstance(func, cls)
+            self.assertEqual(len(func.pipe), len(pipe.pipe))
+            self.assertEqual(func(), 6)
+            self.assertEqual(func(2), 3)
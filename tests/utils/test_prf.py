@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+import os
+import ddt
+import json
+import time
+import platform
+import unittest
+import tempfile
+import schedula as sh
+
+EXTRAS = os.environ.get('EXTRAS', 'all')
+PLATFORM = platform.system().lower()
+
+
+def _sleep(x, t=.05):
+    time.sleep(t)
+    return x + 1
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestDoctest(unittest.TestCase):
+    def runTest(self):
+        import doctest
+        import schedula.utils.prf as prf
+        import schedula.utils.sol as sol
+
+        for mdl in (prf, sol):
+            failure_count, test_count = doctest.testmod(
+                mdl,
+                optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS)
+            self.assertGreater(test_count, 0, (failure_count, test_count))
+            self.assertEqual(failure_count, 0, (failure_count, test_count))
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestProfile(unittest.TestCase):
+    def setUp(self):
+        def sleep(x, t=.01):
+            time.sleep(t)
+            return x
+
+        task = sh.Dispatcher(name='task')
+        task.add_function('sleep', sleep, ['a'], ['b'])
+        task.add_function('fast', lambda b: [b] * 10, ['b'], ['c'])
+
+        sub = sh.Dispatcher(name='sub')
+        sub.add_function('sleep', sleep, ['x'], ['y'])
+
+        dsp = sh.Dispatcher(name='model')
+        dsp.add_function('map', sh.MapDispatch(task), ['inputs'], ['outputs'])
+        dsp.add_dispatcher(sub, {'inputs': 'x'}, {'y': 'z'}, 'sub')
+        dsp.add_data('slow', function=lambda x: sleep(x, .05), wait_inputs=1)
+        dsp.add_function('sum', len, ['outputs'], ['slow'])
+        self.dsp, self.inputs = dsp, {'inputs': [{'a': i} for i in range(3)]}
+
+    def test_profile(self):
+        sol = self.dsp(self.inputs)
+        prof = sol.profile()
+        rows = {r['name']: r for r in prof}
+        runs = ['map/run<%d>' % i for i in range(1, 4)]
+        self.assertEqual(set(rows), {
+            'map', 'map/prepare_inputs', 'sub', 'sub/sleep', 'sum', 'slow'
+        }.union(runs, *([k + '/sleep', k + '/fast'] for k in runs)))
+        self.assertEqual(prof[0]['name'], 'slow')
+        self.assertEqual(rows['slow']['type'], 'data')
+        self.assertEqual(rows['sub']['type'], 'dispatcher')
+        self.assertGreaterEqual(rows['slow']['wall'], .05)
+        self.assertGreaterEqual(rows['map']['wall'], .03)
+        self.assertLess(rows['map']['self'], rows['map']['wall'] - .029)
+        self.assertEqual(rows['sub']['wall'], rows['sub/sleep']['wall'])
+        self.assertGreater(
+            rows['map/run<1>/fast']['size'], rows['map/run<1>/sleep']['size']
+        )
+        walls = [r['wall'] for r in prof]
+        self.assertEqual(walls, sorted(walls, reverse=True))
+
+        top = sol.profile(sort='self', top=2)
+        self.assertEqual(len(top), 2)
+        self.assertEqual(top[0]['name'], 'slow')
+        self.assertTrue(top[1]['name'].endswith('/sleep'))
+        flat = {r['name']: r for r in sol.profile(flat=True)}
+        self.assertEqual(flat['sleep']['count'], 4)
+        self.assertEqual(flat['fast']['count'], 3)
+        self.assertRaises(ValueError, sol.profile, sort='unknown')
+
+    def test_executor(self):
+        dsp = self.dsp
+        dsp.executor = 'async'
+        rows = {r['name']: r for r in dsp(self.inputs).result().profile()}
+        self.assertGreaterEqual(rows['slow']['wall'], .05)
+        self.assertTrue(all(r['wait'] >= 0 for r in rows.values()))
+
+    def test_export(self):
+        prof = self.dsp(self.inputs).profile(top=3)
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            prof.to_csv(path)
+            with open(path) as f:
+                self.assertEqual(f.read(), prof.to_csv())
+            self.assertEqual(len(prof.to_csv().splitlines()), 4)
+
+            prof.to_json(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f), list(prof))
+        finally:
+            os.remove(path)
+        self.assertEqual(len(str(prof).splitlines()), 4)
+
+
+@unittest.skipIf(EXTRAS not in ('all', 'parallel'),
+                 'Not for extra %s.' % EXTRAS)
+@unittest.skipIf(PLATFORM not in ('darwin', 'linux'),
+                 'Not for platform %s.' % PLATFORM)
+@ddt.ddt
+class TestTrace(unittest.TestCase):
+    def setUp(self):
+        sub = sh.Dispatcher(name='sub')
+        sub.add_function('s', _sleep, ['x'], ['y'])
+        dsp = sh.Dispatcher(name='model')
+        for i in range(3):
+            dsp.add_function('f%d' % i, _sleep, ['a'], ['b%d' % i])
+        dsp.add_function(
+            'g', sh.SubDispatchFunction(sub, 'g', ['x'], ['y']), ['b0'], ['c']
+        )
+        dsp.add_function('h', lambda b1, b2: b1 + b2, ['b1', 'b2'], ['d'])
+        self.dsp = dsp
+
+    def tearDown(self):
+        sh.shutdown_executors(False)
+
+    @ddt.data('sync', 'async', 'parallel', 'parallel-pool',
+              'parallel-dispatch')
+    def test_export_trace(self, executor):
+        sol = self.dsp.dispatch({'a': 1}, executor=executor).result()
+        self.assertEqual(sol['d'], 4)
+        nodes = sol.workflow.nodes  # Not recorded by default.
+        self.assertNotIn('started_ns', nodes['h'])
+        sub = nodes['g']['solution'].workflow.nodes
+        self.assertNotIn('started_ns', sub['s'])
+        sol = self.dsp.dispatch(
+            {'a': 1}, executor=executor, trace=True
+        ).result()
+        self.assertEqual(sol['d'], 4)
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            sol.export_trace(path)
+            with open(path) as f:
+                events = json.load(f)['traceEvents']
+        finally:
+            os.remove(path)
+        nodes = {e['name']: e for e in events if e['ph'] == 'X'}
+        self.assertEqual(set(nodes), {'f0', 'f1', 'f2', 'g', 's', 'h'})
+        self.assertEqual(nodes['s']['cat'], 'g')
+        self.assertEqual(nodes['s']['args']['path'], 'g/s')
+        self.assertEqual(nodes['f0']['args']['executor'], executor)
+        for k in ('f0', 'f1', 'f2', 's'):
+            self.assertGreaterEqual(nodes[k]['dur'], 4e4)  # Microseconds.
+        self.assertGreaterEqual(nodes['g']['ts'] + nodes['g']['dur'],
+                                nodes['s']['ts'] + nodes['s']['dur'])
+        self.assertGreaterEqual(
+            nodes['h']['ts'], nodes['f1']['ts'] + nodes['f1']['dur']
+        )
+        pids = {e['pid'] for e in nodes.values()}
+        if executor in ('sync', 'async'):
+            self.assertEqual(pids, {os.getpid()})
+        else:
+            self.assertIn(nodes['f0']['pid'], pids - {os.getpid()})
+        if executor == 'async':  # The functions run in parallel threads.
+            self.assertGreater(len({e['tid'] for e in nodes.values()}), 1)
+
+        flows = [e for e in events if e['ph'] in 'sf']
+        self.assertEqual(len(flows), 6)
+        flows = {(e['ph'], e['name'], e['id']): e for e in flows}
+        for (ph, name, i), e in flows.items():
+            if ph == 's':
+                self.assertLessEqual(e['ts'], flows['f', name, i]['ts'])
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestMemory(unittest.TestCase):
+    def setUp(self):
+        import numpy as np
+        dsp = sh.Dispatcher(name='model')
+        dsp.add_function('zeros', np.zeros, ['n'], ['a'])
+        dsp.add_function(
+            'copies', lambda a: [a.copy() for _ in range(4)][0], ['a'], ['b']
+        )
+        dsp.add_function('len', len, ['b'], ['c'])
+        self.dsp, self.size = dsp, 8 * 100000
+
+    def test_memory_profile(self):
+        size = self.size
+        sol = self.dsp({'n': 100000}, memory_profile=True)
+        nodes = sol.workflow.nodes
+        self.assertEqual(nodes['a']['memory_size'], size)
+        self.assertEqual(nodes['zeros']['memory_size'], size)
+        self.assertGreaterEqual(nodes['zeros']['memory_net'], size)
+        self.assertGreaterEqual(nodes['copies']['memory_peak'], 4 * size)
+        self.assertLess(nodes['copies']['memory_net'], 2 * size)
+        self.assertLess(nodes['len']['memory_peak'], size)
+
+        rows = {r['name']: r for r in sol.profile(sort='peak')}
+        peak = nodes['copies']['memory_peak']
+        self.assertEqual(rows['copies']['peak'], peak)
+        self.assertEqual(rows['zeros']['net'], nodes['zeros']['memory_net'])
+        text = str(sol.profile())
+        self.assertIn('peak [B]', text)
+        self.assertIn('max peak memory: %d B (copies)' % peak, text)
+
+        from schedula.utils.drw import SiteMap
+        sitemap = SiteMap()
+        sitemap.add_items(sol, workflow=True)
+        folder = next(iter(sitemap))
+        tooltips = {
+            n.node_id: dict(n._tooltip())['tooltip'] for n in folder.nodes
+        }
+        self.assertIn('memory peak: %d B' % rows['copies']['peak'],
+                      tooltips['copies'])
+        self.assertIn('size: %d B' % size, tooltips['a'])
+
+    def test_disabled(self):
+        sol = self.dsp({'n': 10})
+        self.assertFalse(any(
+            k.startswith('memory') for v in sol.workflow.nodes.values()
+            for k in v
+        ))
+        self.assertNotIn('peak [B]', str(sol.profile()))
+
+    def test_sizeof(self):
+        from schedula.utils.prf import sizeof
+        try:
+            import pandas as pd
+        except ImportError:
+            return
+        df = pd.DataFrame({'a': ['x' * 100] * 10})
+        self.assertEqual(sizeof(df), df.memory_usage(deep=True).sum())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2015-2026, Vincenzo Arcidiacono;
+# Licensed under the EUPL (the 'Licence');
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at: http://ec.europa.eu/idabc/eupl
+import os
+import json
+import time
+import asyncio
+import unittest
+import schedula as sh
+
+EXTRAS = os.environ.get('EXTRAS', 'all')
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestDoctest(unittest.TestCase):
+    def runTest(self):
+        import doctest
+        import schedula.utils.stream as stream
+        failure_count, test_count = doctest.testmod(
+            stream, optionflags=doctest.NORMALIZE_WHITESPACE | doctest.ELLIPSIS
+        )
+        self.assertGreater(test_count, 0, (failure_count, test_count))
+        self.assertEqual(failure_count, 0, (failure_count, test_count))
+
+
+def _model():
+    def sleep(x):
+        time.sleep(x)
+        return x
+
+    def fail(a):
+        raise ValueError(a)
+
+    sub = sh.Dispatcher(name='sub')
+    sub.add_func(sleep, ['y'], inputs=['x'])
+    dsp = sh.Dispatcher(name='model')
+    dsp.add_func(sleep, ['b'], inputs=['a'], function_id='f')
+    dsp.add_dispatcher(sub, {'b': 'x'}, {'y': 'c'}, 'sub')
+    dsp.add_func(fail, ['e'], inputs=['d'])
+    return dsp
+
+
+@unittest.skipIf(EXTRAS not in ('all',), 'Not for extra %s.' % EXTRAS)
+class TestDispatchStream(unittest.TestCase):
+    def setUp(self):
+        self.dsp = _model()
+
+    def tearDown(self):
+        sh.shutdown_executors(False)
+
+    def test_sync(self):
+        stream = self.dsp.dispatch_iter({'a': .1})
+        self.assertIsInstance(stream, sh.DispatchStream)
+        self.assertEqual(list(stream), [
+            (('a',), .1), (('b',), .1), (('sub', 'x'), .1),
+            (('sub', 'y'), .1), (('c',), .1)
+        ])
+        self.assertEqual(stream.solution, {'a': .1, 'b': .1, 'c': .1})
+        self.assertEqual(list(stream), [])
+
+    def test_executor(self):
+        events, start = [], time.time()
+        stream = self.dsp.dispatch_iter({'a': .5}, executor='async')
+        for path, value in stream:
+            events.append((path, time.time() - start))
+        paths = [e[0] for e in events]
+        self.assertEqual(set(paths), {
+            ('a',), ('b',), ('sub', 'x'), ('sub', 'y'), ('c',)
+        })
+        self.assertLess(paths.index(('a',)), paths.index(('b',)))
+        self.assertLess(dict(events)[('a',)], .5)
+        self.assertGreaterEqual(dict(events)[('c',)], 1)
+
+        stream = self.dsp.dispatch_iter({'d': 1}, executor='async')
+        with self.assertRaises(ValueError):
+            list(stream)
+
+    def test_close(self):
+        from multiprocess import Event
+        stopper = Event()
+        stream = self.dsp.dispatch_iter({'a': .5}, stopper=stopper)
+        self.assertEqual(next(stream), (('a',), .5))
+        stream.close()
+        self.assertTrue(stopper.is_set())
+        self.assertEqual(list(stream), [])
+
+    def test_close_early(self):
+        stream = self.dsp.dispatch_iter({'a': .5})
+        self.assertEqual(next(stream), (('a',), .5))
+        stream.close()  # It aborts the dispatch without a given stopper.
+        self.assertTrue(stream.stopper.is_set())
+        self.assertFalse(stream._thread.is_alive())
+        self.assertTrue(stream._queue.empty())
+        self.assertNotIn('c', self.dsp.solution)
+        self.assertEqual(list(stream), [])
+
+        func = sh.SubDispatchFunction(self.dsp, 'func', ['a'], ['c'])
+        stream = func.iter(.5)
+        self.assertEqual(next(stream), (('a',), .5))
+        stream.close()
+        self.assertFalse(stream._thread.is_alive())
+        self.assertNotIn('c', func.solution)
+
+    def test_async(self):
+        async def main():
+            return [p async for p, v in self.dsp.dispatch_iter({'a': 0})]
+
+        self.assertEqual(asyncio.run(main()), [
+            ('a',), ('b',), ('sub', 'x'), ('sub', 'y'), ('c',)
+        ])
+
+    def test_sub_dispatch(self):
+        func = sh.SubDispatchFunction(self.dsp, 'func', ['a'], ['c'])
+        self.assertEqual([p for p, v in func.iter(0)], [
+            ('a',), ('b',), ('sub', 'x'), ('sub', 'y'), ('c',)
+        ])
+        self.assertEqual(func.solution['c'], 0)
+        self.assertRaises(TypeError, func.iter, 0, 1)
+
+
+@unittest.skipIf(EXTRAS not in ('all', 'web'), 'Not for extra %s.' % EXTRAS)
+class TestStreamWeb(unittest.TestCase):
+    def test_stream(self):
+        client = _model().web(run=False).app().test_client()
+        kw = {'json': {'args': [{'a': 0}]}}
+        res = client.post(
+            '/model', headers={'Accept': 'application/x-ndjson'}, **kw
+        )
+        self.assertEqual(res.mimetype, 'application/x-ndjson')
+        lines = res.get_data(as_text=True).splitlines()
+        self.assertEqual(json.loads(lines[-1]), {'path': ['c'], 'value': 0})
+        self.assertEqual(len(lines), 5)
+
+        res = client.post(
+            '/model', headers={'Accept': 'text/event-stream'}, **kw
+        )
+        self.assertEqual(res.mimetype, 'text/event-stream')
+        self.assertTrue(res.get_data(as_text=True).startswith(
+            'data: {"path": ["a"], "value": 0}\n\n'
+        ))
+
+        res = client.post('/model', **kw)
+        self.assertEqual(res.json['return'], {'a': 0, 'b': 0, 'c': 0})